@@ -12,10 +12,10 @@ Responses-API calls (proxy compatibility).
 
 from __future__ import annotations
 
-import json
 from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
+import orjson
 
 from app.core.config import settings
 from app.core.exceptions import ServiceUnavailableError, UpstreamError
@@ -47,6 +47,9 @@ TRUSTED_SPACE_DOMAINS: List[str] = [
     "uzay.gov.tr",
 ]
 
+# Responses-API stream events `_stream_responses` actually consumes.
+_RESPONSES_STREAM_EVENTS = frozenset({"response.output_text.delta", "response.completed"})
+
 
 class AIClient:
     def __init__(
@@ -59,11 +62,28 @@ class AIClient:
         self.base_url = (base_url or settings.AI_BASE_URL).rstrip("/")
         self.api_key = api_key or settings.AI_API_KEY
         self.model = model or settings.AI_MODEL
-
-    def _headers(self) -> Dict[str, str]:
+        # One pooled connection set shared by every call, so requests reuse
+        # keep-alive connections instead of paying a TLS handshake each time.
+        # Timeouts are set per request.
+        self._http: Optional[httpx.AsyncClient] = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient()
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+
+    def _headers(self, prompt_cache_key: Optional[str] = None) -> Dict[str, str]:
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
+        if prompt_cache_key and "x.ai" in self.base_url.lower():
+            # xAI routes requests sharing this id to the same cache shard.
+            headers["x-grok-conv-id"] = prompt_cache_key
         return headers
 
     @property
@@ -102,12 +122,14 @@ class AIClient:
         temperature: float,
         max_tokens: int,
         stream: bool,
+        prompt_cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": self.model,
             "messages": messages,
             "stream": stream,
         }
+        self._apply_prompt_cache_key(payload, prompt_cache_key)
         if self._is_reasoning_family:
             payload["max_completion_tokens"] = max_tokens
             # Reasoning models only accept the default temperature; omit it.
@@ -116,6 +138,14 @@ class AIClient:
             payload["temperature"] = temperature
         return payload
 
+    def _apply_prompt_cache_key(self, payload: Dict[str, Any], prompt_cache_key: Optional[str]) -> None:
+        """Tag requests that share a long static prefix so the provider's
+        prompt cache can serve it. OpenAI takes a body field; xAI a header
+        (see `_headers`). Other OpenAI-compatible hosts get nothing — unknown
+        body fields are rejected by some proxies."""
+        if prompt_cache_key and "openai.com" in self.base_url.lower():
+            payload["prompt_cache_key"] = prompt_cache_key
+
     async def chat(
         self,
         messages: List[Dict[str, str]],
@@ -123,6 +153,7 @@ class AIClient:
         temperature: float = 0.7,
         max_tokens: int = 1024,
         with_search: bool = False,
+        prompt_cache_key: Optional[str] = None,
     ) -> str:
         if not self.configured:
             raise ServiceUnavailableError(
@@ -133,7 +164,7 @@ class AIClient:
         # Web-search lives on /v1/responses for both OpenAI and xAI; route
         # there and return just the text. Plain chat stays on /v1/chat/completions.
         if with_search and self.supports_responses_api:
-            result = await self.chat_with_search(messages, max_tokens=max_tokens)
+            result = await self.chat_with_search(messages, max_tokens=max_tokens, prompt_cache_key=prompt_cache_key)
             return result["text"]
 
         url = f"{self.base_url}/v1/chat/completions"
@@ -142,34 +173,35 @@ class AIClient:
             temperature=temperature,
             max_tokens=max_tokens,
             stream=False,
+            prompt_cache_key=prompt_cache_key,
         )
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        client = self._http_client()
+        try:
+            response = await client.post(url, json=payload, headers=self._headers(prompt_cache_key), timeout=120.0)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            body_text = ""
             try:
-                response = await client.post(url, json=payload, headers=self._headers())
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                body_text = ""
-                try:
-                    body_text = exc.response.text[:600]
-                except Exception:
-                    body_text = "<unreadable>"
-                log.warning(
-                    "ai.upstream_error",
-                    status=exc.response.status_code,
-                    body=body_text,
-                    model=self.model,
-                )
-                raise UpstreamError(
-                    f"AI provider returned {exc.response.status_code}",
-                    code="AI_UPSTREAM",
-                    details={"status": exc.response.status_code, "body": body_text},
-                ) from exc
-            except httpx.HTTPError as exc:
-                raise UpstreamError(f"AI provider unreachable: {exc!r}", code="AI_NETWORK") from exc
+                body_text = exc.response.text[:600]
+            except Exception:
+                body_text = "<unreadable>"
+            log.warning(
+                "ai.upstream_error",
+                status=exc.response.status_code,
+                body=body_text,
+                model=self.model,
+            )
+            raise UpstreamError(
+                f"AI provider returned {exc.response.status_code}",
+                code="AI_UPSTREAM",
+                details={"status": exc.response.status_code, "body": body_text},
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise UpstreamError(f"AI provider unreachable: {exc!r}", code="AI_NETWORK") from exc
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             return str(data["choices"][0]["message"]["content"])
         except (KeyError, IndexError, ValueError) as exc:
             raise UpstreamError("AI provider returned unexpected payload", code="AI_BAD_PAYLOAD") from exc
@@ -216,10 +248,10 @@ class AIClient:
             stream=True,
         )
 
-        async with httpx.AsyncClient(timeout=180.0) as client:
-            async with client.stream("POST", url, json=payload, headers=self._headers()) as response:
-                async for evt in self._consume_stream(response):
-                    yield evt
+        client = self._http_client()
+        async with client.stream("POST", url, json=payload, headers=self._headers(), timeout=180.0) as response:
+            async for evt in self._consume_stream(response):
+                yield evt
 
     async def _consume_stream(self, response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
         """Drain an open SSE response into typed delta/citation events."""
@@ -242,6 +274,7 @@ class AIClient:
             )
 
         final_citations: List[str] = []
+        seen: set[str] = set()
 
         async for raw_line in response.aiter_lines():
             line = raw_line.strip()
@@ -251,20 +284,17 @@ class AIClient:
             if data_str == "[DONE]":
                 break
             try:
-                chunk = json.loads(data_str)
+                chunk = orjson.loads(data_str)
             except ValueError:
                 continue
 
             cits = chunk.get("citations")
             if isinstance(cits, list) and cits:
                 for c in cits:
-                    if isinstance(c, str):
-                        if c not in final_citations:
-                            final_citations.append(c)
-                    elif isinstance(c, dict):
-                        u = c.get("url")
-                        if isinstance(u, str) and u not in final_citations:
-                            final_citations.append(u)
+                    u = c if isinstance(c, str) else c.get("url") if isinstance(c, dict) else None
+                    if isinstance(u, str) and u not in seen:
+                        seen.add(u)
+                        final_citations.append(u)
 
             try:
                 choices = chunk.get("choices") or []
@@ -287,6 +317,7 @@ class AIClient:
         max_tokens: int = 2000,
         allowed_domains: Optional[List[str]] = None,
         external_web_access: bool = True,
+        prompt_cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Single-shot **Responses API** call with the `web_search` tool enabled.
 
@@ -311,7 +342,7 @@ class AIClient:
 
         # Proxies without /v1/responses fall back to plain chat (no search).
         if not self.supports_responses_api:
-            text = await self.chat(messages, max_tokens=max_tokens)
+            text = await self.chat(messages, max_tokens=max_tokens, prompt_cache_key=prompt_cache_key)
             return {"text": text, "citations": [], "searched": False, "fallback": True}
 
         url = f"{self.base_url}/v1/responses"
@@ -322,38 +353,39 @@ class AIClient:
             external_web_access=external_web_access,
             stream=False,
         )
+        self._apply_prompt_cache_key(payload, prompt_cache_key)
 
-        async with httpx.AsyncClient(timeout=180.0) as client:
+        client = self._http_client()
+        try:
+            response = await client.post(url, json=payload, headers=self._headers(prompt_cache_key), timeout=180.0)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            body_text = ""
             try:
-                response = await client.post(url, json=payload, headers=self._headers())
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                body_text = ""
-                try:
-                    body_text = exc.response.text[:600]
-                except Exception:
-                    body_text = "<unreadable>"
-                log.warning(
-                    "ai.responses_upstream_error",
-                    status=exc.response.status_code,
-                    body=body_text,
-                    model=self.model,
-                )
-                # 404 / 400 likely means the provider doesn't accept Responses
-                # API → fall back transparently.
-                if exc.response.status_code in (400, 404, 405, 501):
-                    log.info("ai.responses_falling_back_to_chat", reason=exc.response.status_code)
-                    text = await self.chat(messages, max_tokens=max_tokens)
-                    return {"text": text, "citations": [], "searched": False, "fallback": True}
-                raise UpstreamError(
-                    f"AI provider returned {exc.response.status_code}",
-                    code="AI_UPSTREAM",
-                    details={"status": exc.response.status_code, "body": body_text},
-                ) from exc
-            except httpx.HTTPError as exc:
-                raise UpstreamError(f"AI provider unreachable: {exc!r}", code="AI_NETWORK") from exc
+                body_text = exc.response.text[:600]
+            except Exception:
+                body_text = "<unreadable>"
+            log.warning(
+                "ai.responses_upstream_error",
+                status=exc.response.status_code,
+                body=body_text,
+                model=self.model,
+            )
+            # 404 / 400 likely means the provider doesn't accept Responses
+            # API → fall back transparently.
+            if exc.response.status_code in (400, 404, 405, 501):
+                log.info("ai.responses_falling_back_to_chat", reason=exc.response.status_code)
+                text = await self.chat(messages, max_tokens=max_tokens, prompt_cache_key=prompt_cache_key)
+                return {"text": text, "citations": [], "searched": False, "fallback": True}
+            raise UpstreamError(
+                f"AI provider returned {exc.response.status_code}",
+                code="AI_UPSTREAM",
+                details={"status": exc.response.status_code, "body": body_text},
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise UpstreamError(f"AI provider unreachable: {exc!r}", code="AI_NETWORK") from exc
 
-        data = response.json()
+        data = orjson.loads(response.content)
         return _parse_responses_payload(data)
 
     def _build_responses_payload(
@@ -408,67 +440,78 @@ class AIClient:
             stream=True,
         )
 
-        async with httpx.AsyncClient(timeout=240.0) as client:
-            async with client.stream("POST", url, json=payload, headers=self._headers()) as response:
-                if response.status_code >= 400:
-                    body_text = ""
-                    try:
-                        body_text = (await response.aread()).decode(errors="ignore")[:600]
-                    except Exception:
-                        body_text = "<unreadable>"
-                    log.warning(
-                        "ai.responses_stream_upstream_error",
-                        status=response.status_code,
-                        body=body_text,
-                        model=self.model,
-                    )
-                    raise UpstreamError(
-                        f"AI provider returned {response.status_code}",
-                        code="AI_UPSTREAM",
-                        details={"status": response.status_code, "body": body_text},
-                    )
-
-                citations: List[str] = []
-                seen: set[str] = set()
-
-                async for raw_line in response.aiter_lines():
-                    line = raw_line.strip()
-                    if not line.startswith("data:"):
-                        continue
-                    data_str = line[len("data:") :].strip()
-                    if not data_str or data_str == "[DONE]":
-                        continue
-                    try:
-                        chunk = json.loads(data_str)
-                    except ValueError:
-                        continue
-
-                    evt_type = chunk.get("type", "")
-                    # Token-level deltas from the message item.
-                    if evt_type == "response.output_text.delta":
-                        delta = chunk.get("delta")
-                        if isinstance(delta, str) and delta:
-                            yield {"type": "delta", "content": delta}
-                        continue
-
-                    # Final aggregate — pull text out if we somehow missed deltas
-                    # and harvest citations from message annotations.
-                    if evt_type == "response.completed":
-                        resp = chunk.get("response") or {}
-                        for item in resp.get("output", []) or []:
-                            if item.get("type") != "message":
-                                continue
-                            for content in item.get("content", []) or []:
-                                for ann in content.get("annotations", []) or []:
-                                    if ann.get("type") != "url_citation":
-                                        continue
-                                    u = ann.get("url")
-                                    if isinstance(u, str) and u and u not in seen:
-                                        seen.add(u)
-                                        citations.append(u)
-
-                if citations:
-                    yield {"type": "citations", "urls": citations}
+        client = self._http_client()
+        async with client.stream("POST", url, json=payload, headers=self._headers(), timeout=240.0) as response:
+            if response.status_code >= 400:
+                body_text = ""
+                try:
+                    body_text = (await response.aread()).decode(errors="ignore")[:600]
+                except Exception:
+                    body_text = "<unreadable>"
+                log.warning(
+                    "ai.responses_stream_upstream_error",
+                    status=response.status_code,
+                    body=body_text,
+                    model=self.model,
+                )
+                raise UpstreamError(
+                    f"AI provider returned {response.status_code}",
+                    code="AI_UPSTREAM",
+                    details={"status": response.status_code, "body": body_text},
+                )
+
+            citations: List[str] = []
+            seen: set[str] = set()
+            # Name from the SSE `event:` line preceding each `data:` line.
+            # Lets us skip decoding events we ignore — several of them
+            # (`output_text.done`, `output_item.done`) repeat the full reply.
+            event_name = ""
+
+            async for raw_line in response.aiter_lines():
+                line = raw_line.strip()
+                if line.startswith("event:"):
+                    event_name = line[len("event:") :].strip()
+                    continue
+                if not line.startswith("data:"):
+                    continue
+                if event_name and event_name not in _RESPONSES_STREAM_EVENTS:
+                    event_name = ""
+                    continue
+                event_name = ""
+                data_str = line[len("data:") :].strip()
+                if not data_str or data_str == "[DONE]":
+                    continue
+                try:
+                    chunk = orjson.loads(data_str)
+                except ValueError:
+                    continue
+
+                evt_type = chunk.get("type", "")
+                # Token-level deltas from the message item.
+                if evt_type == "response.output_text.delta":
+                    delta = chunk.get("delta")
+                    if isinstance(delta, str) and delta:
+                        yield {"type": "delta", "content": delta}
+                    continue
+
+                # Final aggregate — pull text out if we somehow missed deltas
+                # and harvest citations from message annotations.
+                if evt_type == "response.completed":
+                    resp = chunk.get("response") or {}
+                    for item in resp.get("output", []) or []:
+                        if item.get("type") != "message":
+                            continue
+                        for content in item.get("content", []) or []:
+                            for ann in content.get("annotations", []) or []:
+                                if ann.get("type") != "url_citation":
+                                    continue
+                                u = ann.get("url")
+                                if isinstance(u, str) and u and u not in seen:
+                                    seen.add(u)
+                                    citations.append(u)
+
+            if citations:
+                yield {"type": "citations", "urls": citations}
 
 
 def _parse_responses_payload(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -537,3 +580,8 @@ def get_client() -> AIClient:
     if _singleton is None:
         _singleton = AIClient()
     return _singleton
+
+
+async def close_client() -> None:
+    if _singleton is not None:
+        await _singleton.aclose()
@@ -61,11 +61,70 @@ CHAT_SYSTEM = (
 )
 
 
+# Prebuilt system-role messages, shared by every request. Treat as read-only:
+# the same dict objects go into every outgoing payload.
+THREAT_EXPLAINER_SYSTEM_MESSAGE = {"role": "system", "content": THREAT_EXPLAINER_SYSTEM}
+_CHAT_SYSTEM_MESSAGE = {"role": "system", "content": CHAT_SYSTEM}
+
+
+# Static instruction blocks for the threat briefing — built once at import;
+# only the per-record facts block is formatted per call.
+_THREAT_BRIEF_INSTRUCTIONS_TR = (
+    "Aşağıdaki gerçek NASA/JPL verisinden bir asteroid brifa hazırla. "
+    "Hedef kitle: lise/üniversite öğrencileri, eğitimciler, uzaya meraklı "
+    "geniş kitle. Ton: güvenli, bilimsel, **eğitimsel ve tanıtımsal** — "
+    "korku yaymadan, halkı bilgilendirir gibi. 3 kısa paragraf, "
+    "aralarında boş satır:\n"
+    "  ¶1 NEDİR — isim, sınıf, büyüklük + günlük dünyadan ölçek karşılaştırması "
+    "('20 katlı bina kadar', 'futbol sahası uzunluğunda', 'Galata Kulesi'nin "
+    "iki katı' gibi). PHA veya Sentry listesinde mi belirt.\n"
+    "  ¶2 SAYILAR — yaklaşma tarihi + mesafe (km cinsinden VE Ay-mesafesine "
+    "göre kaç kat), bağıl hız, hibrit risk skoru ile ML güveninin pratik "
+    "anlamı. Monte Carlo p1/p50/p99 aralığı varsa belirsizliği özetle.\n"
+    "  ¶3 NEDEN ÖNEMLİ — boyut/davranış olarak en yakın ünlü olayla "
+    "karşılaştır (Çelyabinsk-2013 ~20 m, Tunguska-1908 ~60 m, Apophis "
+    "~370 m, Bennu ~490 m, Eros ~16 km, Vesta ~525 km). Son cümlede "
+    "operasyonel sonucu belirt ('rutin gözlem yeterli', 'gözlem geçişi "
+    "öneriliyor', 'bu yüzyılda çarpma riski yok' vb.).\n\n"
+    "Kurallar: birimleri olduğu gibi koru ('km²' yazma); 1900'lü yıllarda "
+    "'next close approach' görünüyorsa 'veri anomalisi' olarak işaretle "
+    "ve yorumlama; teknik terimleri ilk kullandığında parantez içinde "
+    "kısa bir açıklama ekle (PHA, Sentry, Monte Carlo, ML skoru); en "
+    "fazla 2 yerde **kalın** vurgu kullan, sayıları kalınlaştırma; sayıları "
+    "okunaklı yaz ('38 milyon km' tercih et, '38000000 km' değil).\n\n"
+)
+
+_THREAT_BRIEF_INSTRUCTIONS_EN = (
+    "Write a science-communication briefing for the following real "
+    "NASA/JPL risk record. Audience: students, educators, science-curious "
+    "public — not just mission operators. Tone: calm, factual, educational. "
+    "Three short paragraphs separated by blank lines:\n"
+    "  ¶1 WHAT IT IS — name, class, size + an everyday size analogy "
+    "(e.g. 'about a 20-storey building tall', 'football-pitch wide'). "
+    "Note if PHA or Sentry-listed.\n"
+    "  ¶2 THE NUMBERS — close-approach date + miss distance (km AND lunar "
+    "distances), relative velocity, plain-language meaning of hybrid_score "
+    "and ML confidence. If MC p1/p50/p99 is given, summarize uncertainty.\n"
+    "  ¶3 WHY IT MATTERS — compare to the nearest famous reference "
+    "(Chelyabinsk-2013 ~20 m, Tunguska-1908 ~60 m, Apophis ~370 m, Bennu "
+    "~490 m, Eros ~16 km, Vesta ~525 km). End with operational meaning.\n\n"
+    "Rules: preserve units exactly; flag year-1900 dates as 'data anomaly'; "
+    "first time you use a technical term (PHA, Sentry, Monte Carlo) follow "
+    "it with a short parenthetical gloss; **bold** at most twice; prefer "
+    "readable numbers ('38 million km' over '38000000 km').\n\n"
+)
+
+
 def threat_explanation_user_prompt(record: RiskRecord, language: str = "tr") -> str:
     """Build the user-side prompt for `record`. Includes numeric facts as a clean
     key/value block; the model is instructed to *use* but not *quote* markdown
     around ordinary values.
+
+    Facts are rendered from `_quantised(record)`, so the prompt doubles as the
+    response-cache identity: a recompute that only jitters the numbers renders
+    the same text, and anything the prompt shows is part of the key.
     """
+    record = _quantised(record)
     mc = record.monte_carlo
     parts = [
         f"NEO id: {record.neo_id}",
@@ -91,56 +150,100 @@ def threat_explanation_user_prompt(record: RiskRecord, language: str = "tr") ->
 
     facts = "\n".join(f"- {p}" for p in parts)
 
-    if language.lower().startswith("tr"):
-        return (
-            "Aşağıdaki gerçek NASA/JPL verisinden bir asteroid brifa hazırla. "
-            "Hedef kitle: lise/üniversite öğrencileri, eğitimciler, uzaya meraklı "
-            "geniş kitle. Ton: güvenli, bilimsel, **eğitimsel ve tanıtımsal** — "
-            "korku yaymadan, halkı bilgilendirir gibi. 3 kısa paragraf, "
-            "aralarında boş satır:\n"
-            "  ¶1 NEDİR — isim, sınıf, büyüklük + günlük dünyadan ölçek karşılaştırması "
-            "('20 katlı bina kadar', 'futbol sahası uzunluğunda', 'Galata Kulesi'nin "
-            "iki katı' gibi). PHA veya Sentry listesinde mi belirt.\n"
-            "  ¶2 SAYILAR — yaklaşma tarihi + mesafe (km cinsinden VE Ay-mesafesine "
-            "göre kaç kat), bağıl hız, hibrit risk skoru ile ML güveninin pratik "
-            "anlamı. Monte Carlo p1/p50/p99 aralığı varsa belirsizliği özetle.\n"
-            "  ¶3 NEDEN ÖNEMLİ — boyut/davranış olarak en yakın ünlü olayla "
-            "karşılaştır (Çelyabinsk-2013 ~20 m, Tunguska-1908 ~60 m, Apophis "
-            "~370 m, Bennu ~490 m, Eros ~16 km, Vesta ~525 km). Son cümlede "
-            "operasyonel sonucu belirt ('rutin gözlem yeterli', 'gözlem geçişi "
-            "öneriliyor', 'bu yüzyılda çarpma riski yok' vb.).\n\n"
-            "Kurallar: birimleri olduğu gibi koru ('km²' yazma); 1900'lü yıllarda "
-            "'next close approach' görünüyorsa 'veri anomalisi' olarak işaretle "
-            "ve yorumlama; teknik terimleri ilk kullandığında parantez içinde "
-            "kısa bir açıklama ekle (PHA, Sentry, Monte Carlo, ML skoru); en "
-            "fazla 2 yerde **kalın** vurgu kullan, sayıları kalınlaştırma; sayıları "
-            "okunaklı yaz ('38 milyon km' tercih et, '38000000 km' değil).\n\n"
-            f"{facts}"
+    instructions = _THREAT_BRIEF_INSTRUCTIONS_TR if language.lower().startswith("tr") else _THREAT_BRIEF_INSTRUCTIONS_EN
+    return instructions + facts
+
+
+def _quantised(record: RiskRecord) -> RiskRecord:
+    """`record` rounded to what changes the narrative — every recompute nudges
+    the score and MC percentiles by a few km."""
+    update: dict[str, object] = {
+        "hybrid_score": round(record.hybrid_score, 2),
+        "ml_confidence": round(record.ml_confidence, 1),
+        "diameter_max_km": _significant(record.diameter_max_km, 2),
+        "miss_distance_km": _significant(record.miss_distance_km, 2),
+        "relative_velocity_kms": _significant(record.relative_velocity_kms, 2),
+    }
+    mc = record.monte_carlo
+    if mc is not None:
+        update["monte_carlo"] = mc.model_copy(
+            update={
+                "p1_km": _significant(mc.p1_km, 2),
+                "p50_km": _significant(mc.p50_km, 2),
+                "p99_km": _significant(mc.p99_km, 2),
+            }
+        )
+    return record.model_copy(update=update)
+
+
+def _significant(value: float | None, digits: int) -> float | None:
+    return float(f"{value:.{digits}g}") if value is not None else None
+
+
+_LUNAR_DISTANCE_KM = 384_400.0
+
+
+_TR_SEPARATORS = str.maketrans({",": ".", ".": ","})
+
+
+def _number(value: float, spec: str, language: str) -> str:
+    """Format `value` with `spec`; Turkish swaps the separators (1.200,5)."""
+    text = format(value, spec)
+    if language == "tr":
+        text = text.translate(_TR_SEPARATORS)
+    return text
+
+
+def _readable_km(km: float, language: str) -> str:
+    if km >= 1_000_000:
+        unit = "milyon km" if language == "tr" else "million km"
+        return f"{_number(km / 1_000_000, '.1f', language)} {unit}"
+    return f"{_number(km, ',.0f', language)} km"
+
+
+def routine_threat_brief(record: RiskRecord, language: str = "tr") -> str:
+    """Deterministic briefing for no-signal records — the model would only
+    restate these facts. Used instead of a generation when the record is
+    below `AI_EXPLAIN_ROUTINE_MAX_SCORE`."""
+    tr = language.lower().startswith("tr")
+    lang = "tr" if tr else "en"
+    parts = []
+    if tr:
+        head = f"{record.name}, CLIFF hibrit risk modelinde **minimal** sınıfta"
+        if record.diameter_max_km is not None:
+            head += f"; tahmini en büyük çapı {_number(record.diameter_max_km * 1000, ',.0f', lang)} m"
+        parts.append(head + ". PHA (potansiyel tehlikeli asteroid) değil ve Sentry listesinde yer almıyor.")
+        if record.miss_distance_km is not None:
+            lunar = _number(record.miss_distance_km / _LUNAR_DISTANCE_KM, ".1f", lang)
+            approach = f"En yakın geçişte Dünya'dan {_readable_km(record.miss_distance_km, lang)} uzaktan geçecek"
+            approach += f" (Ay mesafesinin yaklaşık {lunar} katı)"
+            if record.relative_velocity_kms is not None:
+                approach += f", bağıl hızı {_number(record.relative_velocity_kms, '.1f', lang)} km/s"
+            parts.append(approach + ".")
+        score = _number(record.hybrid_score, ".3f", lang)
+        parts.append(
+            f"Hibrit risk skoru {score}; rutin gözlem yeterli; mevcut yörünge çözümüne göre çarpma riski ihmal edilebilir."
+        )
+    else:
+        head = f"{record.name} is rated **minimal** by the CLIFF hybrid risk model"
+        if record.diameter_max_km is not None:
+            head += f", with an estimated maximum diameter of {record.diameter_max_km * 1000:,.0f} m"
+        parts.append(head + ". It is not a PHA (potentially hazardous asteroid) and is not Sentry-listed.")
+        if record.miss_distance_km is not None:
+            approach = f"At closest approach it passes {_readable_km(record.miss_distance_km, lang)} from Earth"
+            approach += f" (about {record.miss_distance_km / _LUNAR_DISTANCE_KM:.1f}× the lunar distance)"
+            if record.relative_velocity_kms is not None:
+                approach += f" at {record.relative_velocity_kms:.1f} km/s relative velocity"
+            parts.append(approach + ".")
+        parts.append(
+            f"Hybrid score {record.hybrid_score:.3f}; routine tracking is sufficient; "
+            "impact risk is negligible per the current orbit solution."
         )
-    return (
-        "Write a science-communication briefing for the following real "
-        "NASA/JPL risk record. Audience: students, educators, science-curious "
-        "public — not just mission operators. Tone: calm, factual, educational. "
-        "Three short paragraphs separated by blank lines:\n"
-        "  ¶1 WHAT IT IS — name, class, size + an everyday size analogy "
-        "(e.g. 'about a 20-storey building tall', 'football-pitch wide'). "
-        "Note if PHA or Sentry-listed.\n"
-        "  ¶2 THE NUMBERS — close-approach date + miss distance (km AND lunar "
-        "distances), relative velocity, plain-language meaning of hybrid_score "
-        "and ML confidence. If MC p1/p50/p99 is given, summarize uncertainty.\n"
-        "  ¶3 WHY IT MATTERS — compare to the nearest famous reference "
-        "(Chelyabinsk-2013 ~20 m, Tunguska-1908 ~60 m, Apophis ~370 m, Bennu "
-        "~490 m, Eros ~16 km, Vesta ~525 km). End with operational meaning.\n\n"
-        "Rules: preserve units exactly; flag year-1900 dates as 'data anomaly'; "
-        "first time you use a technical term (PHA, Sentry, Monte Carlo) follow "
-        "it with a short parenthetical gloss; **bold** at most twice; prefer "
-        "readable numbers ('38 million km' over '38000000 km').\n\n"
-        f"{facts}"
-    )
+    return " ".join(parts)
 
 
 def chat_messages(history: list[dict], query: str) -> list[dict]:
-    messages = [{"role": "system", "content": CHAT_SYSTEM}]
+    messages = [_CHAT_SYSTEM_MESSAGE]
     messages.extend(history or [])
     messages.append({"role": "user", "content": query})
     return messages
@@ -0,0 +1,131 @@
+"""Exact-match cache for deterministic AI generations.
+
+Threat briefings are a pure function of their prompt: the same risk record
+rendered with the same model and parameters produces the same request body.
+Rather than paying a multi-second upstream call (and the token bill) for a
+repeat, we hash the canonical request and keep the response in Redis.
+
+The key covers everything that influences the output — model, prompt
+template, sampling parameters, search mode — so a change to the template or
+`AI_MODEL` naturally misses. Record facts enter through the rendered prompt,
+which `prompts.threat_explanation_user_prompt` quantises so recompute jitter
+doesn't re-generate an unchanged briefing. Falls back gracefully if Redis is down
+(the caller just generates).
+
+A small in-process LRU sits in front of Redis so a hot briefing (the same
+NEO opened from many dashboards) skips the round-trip and the JSON decode.
+Entries are held for at most `_LOCAL_TTL_SECONDS`, never past the Redis TTL
+they were written with — a read-through hit is capped at the key's PTTL.
+
+Redis keys:
+    cliff:ai:resp:{sha256}    JSON  (the service-level result dict)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+from app.core import redis_client
+from app.core.logging import get_logger
+
+log = get_logger(__name__)
+
+_PREFIX = "cliff:ai:resp"
+
+_LOCAL_MAX = 1024
+_LOCAL_TTL_SECONDS = 300.0
+# digest → (monotonic expiry, result); insertion order doubles as LRU order.
+_local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_local_hits = 0
+_local_misses = 0
+
+
+def key_for(request: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON encoding of `request`."""
+    return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _key(digest: str) -> str:
+    return f"{_PREFIX}:{digest}"
+
+
+def _local_get(digest: str) -> Optional[Dict[str, Any]]:
+    global _local_hits, _local_misses
+    entry = _local.get(digest)
+    if entry is None or entry[0] <= time.monotonic():
+        if entry is not None:
+            del _local[digest]
+        _local_misses += 1
+        return None
+    _local.move_to_end(digest)
+    _local_hits += 1
+    return dict(entry[1])
+
+
+def _local_put(digest: str, value: Dict[str, Any], ttl_seconds: float) -> None:
+    _local[digest] = (time.monotonic() + min(ttl_seconds, _LOCAL_TTL_SECONDS), value)
+    _local.move_to_end(digest)
+    if len(_local) > _LOCAL_MAX:
+        _local.popitem(last=False)
+
+
+def cache_info() -> Dict[str, int]:
+    """In-process LRU counters, for the health/observability endpoints."""
+    return {"hits": _local_hits, "misses": _local_misses, "size": len(_local), "max_size": _LOCAL_MAX}
+
+
+def clear_local() -> None:
+    global _local_hits, _local_misses
+    _local.clear()
+    _local_hits = _local_misses = 0
+
+
+async def get(digest: str) -> Optional[Dict[str, Any]]:
+    value = _local_get(digest)
+    if value is not None:
+        return value
+    try:
+        client = redis_client.get_client()
+    except RuntimeError:
+        return None
+    try:
+        # GET + PTTL in one round-trip: the local copy must not outlive the
+        # Redis entry it was read from.
+        pipe = client.pipeline(transaction=False)
+        pipe.get(_key(digest))
+        pipe.pttl(_key(digest))
+        raw, ttl_ms = await pipe.execute()
+    except Exception as exc:
+        log.warning("ai.response_cache.get_failed", error=str(exc))
+        return None
+    if not raw:
+        return None
+    try:
+        value = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    if ttl_ms > 0:
+        _local_put(digest, value, ttl_ms / 1000.0)
+    elif ttl_ms == -1:  # no expiry on the Redis key
+        _local_put(digest, value, _LOCAL_TTL_SECONDS)
+    return dict(value)
+
+
+async def put(digest: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+    _local_put(digest, dict(value), ttl_seconds)
+    try:
+        client = redis_client.get_client()
+    except RuntimeError:
+        return
+    try:
+        await client.set(_key(digest), orjson.dumps(value), ex=ttl_seconds)
+    except Exception as exc:
+        log.warning("ai.response_cache.put_failed", error=str(exc))
+
+
+__all__ = ["key_for", "get", "put", "cache_info", "clear_local"]
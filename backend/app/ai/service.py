@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from app.ai import prompts
+from app.ai import prompts, response_cache
 from app.ai.client import TRUSTED_SPACE_DOMAINS, AIClient, get_client
-from app.core.exceptions import NotFoundError
+from app.core.concurrency import AdjustableSemaphore
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, UpstreamError
 from app.core.logging import get_logger
-from app.domain.risk import RiskRecord
+from app.domain.risk import RiskClass, RiskRecord
 from app.pipeline import risk_store
 
 log = get_logger(__name__)
@@ -17,12 +20,69 @@ log = get_logger(__name__)
 class AIService:
     def __init__(self, client: Optional[AIClient] = None) -> None:
         self._client = client or get_client()
-
-    async def explain_threat(self, neo_id: str, *, language: str = "tr", with_search: bool = True) -> Dict[str, Any]:
+        self._generation_slots = AdjustableSemaphore(settings.AI_MAX_CONCURRENT_GENERATIONS)
+        # AIMD: a provider 429 halves the live limit; it then creeps back up
+        # by one per full window of clean generations, never past the ceiling.
+        self._generation_ceiling = settings.AI_MAX_CONCURRENT_GENERATIONS
+        self._clean_generations = 0
+
+    @property
+    def active_generations(self) -> int:
+        """Upstream generations currently holding a slot."""
+        return self._generation_slots.active
+
+    @property
+    def generation_limit(self) -> int:
+        """Current (possibly backed-off) concurrent generation limit."""
+        return self._generation_slots.limit
+
+    def set_generation_limit(self, limit: int) -> None:
+        """Resize the generation pool in place; queued callers keep their turn.
+        Also becomes the ceiling adaptive back-off recovers to."""
+        self._generation_ceiling = limit
+        self._clean_generations = 0
+        self._generation_slots.set_limit(limit)
+
+    def _on_rate_limited(self) -> None:
+        limit = max(1, self._generation_slots.limit // 2)
+        self._clean_generations = 0
+        if limit != self._generation_slots.limit:
+            log.warning("ai.generation_limit_backoff", limit=limit, ceiling=self._generation_ceiling)
+            self._generation_slots.set_limit(limit)
+
+    def _on_generation_ok(self) -> None:
+        limit = self._generation_slots.limit
+        if limit >= self._generation_ceiling:
+            return
+        self._clean_generations += 1
+        if self._clean_generations >= limit:
+            self._clean_generations = 0
+            self._generation_slots.set_limit(limit + 1)
+            log.info("ai.generation_limit_recover", limit=limit + 1, ceiling=self._generation_ceiling)
+
+    @asynccontextmanager
+    async def _generation_slot(self) -> AsyncIterator[None]:
+        async with self._generation_slots:
+            try:
+                yield
+            except UpstreamError as exc:
+                if exc.details.get("status") == 429:
+                    self._on_rate_limited()
+                raise
+        self._on_generation_ok()
+
+    async def explain_threat(
+        self,
+        neo_id: str,
+        *,
+        language: str = "tr",
+        with_search: bool = True,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
         record = await risk_store.get(neo_id)
         if record is None:
             raise NotFoundError(f"No risk record for NEO {neo_id}", details={"neo_id": neo_id})
-        return await self.explain_threat_record(record, language=language, with_search=with_search)
+        return await self.explain_threat_record(record, language=language, with_search=with_search, refresh=refresh)
 
     async def explain_threat_record(
         self,
@@ -30,9 +90,13 @@ class AIService:
         *,
         language: str = "tr",
         with_search: bool = True,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
         """Produce a threat briefing.
 
+        `refresh=True` skips the response-cache lookup (the fresh result
+        still overwrites the cached entry) — for callers that regenerate.
+
         When `with_search=True` and the upstream supports the Responses API,
         the model is allowed to issue web searches against trusted astronomy
         sources (NASA / JPL / ESA / arXiv) so it can ground its answer in the
@@ -46,23 +110,59 @@ class AIService:
                 "fallback":   bool,   # True when web_search wasn't available
             }
         """
+        if _is_routine(record):
+            text = prompts.routine_threat_brief(record, language=language)
+            return {"text": text, "citations": [], "searched": False, "fallback": True}
+
         messages = [
-            {"role": "system", "content": prompts.THREAT_EXPLAINER_SYSTEM},
+            prompts.THREAT_EXPLAINER_SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": prompts.threat_explanation_user_prompt(record, language=language),
             },
         ]
 
-        if not with_search or not self._client.supports_web_search:
-            text = await self._client.chat(messages, temperature=0.3, max_tokens=2000)
-            return {"text": text, "citations": [], "searched": False, "fallback": True}
-
-        return await self._client.chat_with_search(
-            messages,
-            max_tokens=2000,
-            allowed_domains=TRUSTED_SPACE_DOMAINS,
+        use_search = with_search and self._client.supports_web_search
+        max_tokens = settings.AI_EXPLAIN_MAX_TOKENS
+        ttl = settings.AI_EXPLAIN_CACHE_TTL_SECONDS
+        # The user prompt renders quantised facts, so keying on the exact
+        # messages still hits when a recompute only jitters the numbers.
+        cache_key = response_cache.key_for(
+            {
+                "model": settings.AI_MODEL,
+                "messages": messages,
+                "search": use_search,
+                "temperature": 0.3,
+                "max_tokens": max_tokens,
+            }
         )
+        if ttl > 0 and not refresh:
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                log.info("ai.explain.cache_hit", neo_id=record.neo_id)
+                return cached
+
+        # Every brief shares the system prompt + static instructions as its
+        # prefix (record facts go last), so one cache key per language lets
+        # the provider reuse that prefix across NEOs.
+        prompt_cache_key = f"cliff-threat-brief:{language}"
+        async with self._generation_slot():
+            if not use_search:
+                text = await self._client.chat(
+                    messages, temperature=0.3, max_tokens=max_tokens, prompt_cache_key=prompt_cache_key
+                )
+                result = {"text": text, "citations": [], "searched": False, "fallback": True}
+            else:
+                result = await self._client.chat_with_search(
+                    messages,
+                    max_tokens=max_tokens,
+                    allowed_domains=TRUSTED_SPACE_DOMAINS,
+                    prompt_cache_key=prompt_cache_key,
+                )
+
+        if ttl > 0 and result.get("text"):
+            await response_cache.put(cache_key, result, ttl)
+        return result
 
     async def chat(
         self,
@@ -73,7 +173,8 @@ class AIService:
         with_search: bool = False,
     ) -> str:
         messages = prompts.chat_messages(history, query)
-        return await self._client.chat(messages, temperature=temperature, with_search=with_search)
+        async with self._generation_slot():
+            return await self._client.chat(messages, temperature=temperature, with_search=with_search)
 
     async def chat_stream(
         self,
@@ -88,8 +189,25 @@ class AIService:
         - {"type": "citations", "urls": [str, ...]}  (final, optional)
         """
         messages = prompts.chat_messages(history, query)
-        async for evt in self._client.stream(messages, temperature=temperature, with_search=with_search):
-            yield evt
+        async with self._generation_slot():
+            async for evt in self._client.stream(messages, temperature=temperature, with_search=with_search):
+                yield evt
+
+
+def _is_routine(record: RiskRecord) -> bool:
+    """No-signal record: the model would only restate its facts.
+
+    Only analysed records qualify — a seeded placeholder (MINIMAL, score 0,
+    no Monte Carlo run) was never scored, so calling it minimal would be a
+    claim the model didn't make.
+    """
+    return (
+        record.monte_carlo is not None
+        and record.risk_class is RiskClass.MINIMAL
+        and not record.is_potentially_hazardous
+        and not record.sentry_listed
+        and record.hybrid_score < settings.AI_EXPLAIN_ROUTINE_MAX_SCORE
+    )
 
 
 _singleton: Optional[AIService] = None
@@ -19,6 +19,15 @@ from app.core.logging import get_logger
 
 log = get_logger(__name__)
 
+# First poll fires after this delay, then doubles up to TTS_POLL_INTERVAL_SECONDS.
+# Short clips are often ready well inside the steady-state interval, so a fixed
+# 1.5 s sleep before every poll was pure added latency.
+_FIRST_POLL_DELAY_SECONDS = 0.25
+
+
+def _poll_delay(attempt: int) -> float:
+    return min(settings.TTS_POLL_INTERVAL_SECONDS, _FIRST_POLL_DELAY_SECONDS * (1 << min(attempt, 16)))
+
 
 class TtsError(Exception):
     """TTS failure — wraps misconfiguration, upstream errors, timeouts."""
@@ -113,7 +122,7 @@ async def synthesize(
         # 2. Poll — task service is asynchronous; status flips PROCESSING → FINISHED.
         audio_url: Optional[str] = None
         for attempt in range(settings.TTS_MAX_POLL_ATTEMPTS):
-            await asyncio.sleep(settings.TTS_POLL_INTERVAL_SECONDS)
+            await asyncio.sleep(_poll_delay(attempt))
             try:
                 poll = await client.get(
                     f"{base}/get/{task_id}",
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import io
-import json
 import uuid
 from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -206,6 +206,12 @@ async def text_to_speech(request: TtsRequest) -> StreamingResponse:
     )
 
 
+def _sse(payload: dict) -> bytes:
+    """Frame one SSE `data:` event. orjson emits UTF-8 bytes directly, so
+    each streamed delta skips the str round-trip."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 @router.post(
     "/chat",
     dependencies=[
@@ -229,7 +235,7 @@ async def chat(request: ChatRequest):
         return ChatResponse(request_id=request_id, reply=reply, model=settings.AI_MODEL)
 
     async def event_source():
-        yield f"data: {json.dumps({'request_id': request_id, 'event': 'start'})}\n\n"
+        yield _sse({"request_id": request_id, "event": "start"})
         try:
             async for evt in service.chat_stream(
                 history,
@@ -239,14 +245,14 @@ async def chat(request: ChatRequest):
             ):
                 if evt.get("type") == "delta":
                     payload = {"request_id": request_id, "event": "delta", "content": evt["content"]}
-                    yield f"data: {json.dumps(payload)}\n\n"
+                    yield _sse(payload)
                 elif evt.get("type") == "citations":
                     payload = {"request_id": request_id, "event": "citations", "urls": evt["urls"]}
-                    yield f"data: {json.dumps(payload)}\n\n"
+                    yield _sse(payload)
         except Exception as exc:  # bubble error as final SSE event
-            yield f"data: {json.dumps({'request_id': request_id, 'event': 'error', 'message': str(exc)})}\n\n"
+            yield _sse({"request_id": request_id, "event": "error", "message": str(exc)})
             return
-        yield f"data: {json.dumps({'request_id': request_id, 'event': 'done'})}\n\n"
+        yield _sse({"request_id": request_id, "event": "done"})
 
     return StreamingResponse(event_source(), media_type="text/event-stream")
 
@@ -7,8 +7,10 @@ from typing import Any, Dict
 
 from fastapi import APIRouter
 
+from app.ai.service import get_service
 from app.core import redis_client
 from app.core.config import settings
+from app.nasa import http as nasa_http
 from app.ws.manager import get_manager
 
 router = APIRouter()
@@ -22,7 +24,11 @@ async def health() -> Dict[str, Any]:
         "version": settings.APP_VERSION,
         "environment": settings.ENVIRONMENT,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "components": {"redis": "healthy" if redis_ok else "unhealthy"},
+        "components": {
+            "redis": "healthy" if redis_ok else "unhealthy",
+            "upstream": {"requests_per_second": round(nasa_http.requests_per_second(), 3)},
+            "ai": {"active_generations": get_service().active_generations},
+        },
     }
 
 
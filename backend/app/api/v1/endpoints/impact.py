@@ -11,11 +11,13 @@ serves the impact-simulator picker as a hybrid list:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import math
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
@@ -127,32 +129,19 @@ class PresetsResponse(BaseModel):
 @router.get("/presets", response_model=PresetsResponse)
 async def list_presets() -> PresetsResponse:
     """Hybrid preset catalog: fixed historical events + live active NEOs."""
-    items: List[ImpactPreset] = []
-
     # 1. Historical impacts — fixed (events that have already happened can't change).
-    for raw in _load_historical_impacts():
-        items.append(
-            ImpactPreset(
-                id=raw["id"],
-                name=raw["name"],
-                subtitle=raw["subtitle"],
-                era=raw["era"],
-                context=raw["context"],
-                input=PresetInput(**raw["input"]),
-                kind="historical",
-                source="Curated historical record",
-                last_updated=None,
-            )
-        )
+    items: List[ImpactPreset] = list(_historical_presets())
 
     # 2. Active NEOs — refresh diameter/density from JPL SBDB on every call
     # (cached 24h server-side). Falls back to default_input on SBDB failure.
+    # Lookups are independent, so a cold cache costs one SBDB round-trip
+    # rather than one per preset.
     now = datetime.now(timezone.utc)
-    for preset in ACTIVE_NEO_PRESETS:
+    bodies = await asyncio.gather(*(sbdb.get_body(preset["designation"]) for preset in ACTIVE_NEO_PRESETS))
+    for preset, body in zip(ACTIVE_NEO_PRESETS, bodies):
         merged_input = dict(preset["default_input"])
         source = "JPL SBDB"
         last_updated: Optional[datetime] = now
-        body = await sbdb.get_body(preset["designation"])
         if body is not None:
             phys = sbdb.extract_physical(body)
             if phys.get("diameter_km"):
@@ -181,6 +170,25 @@ async def list_presets() -> PresetsResponse:
     return PresetsResponse(items=items, fetched_at=now)
 
 
+@lru_cache(maxsize=1)
+def _historical_presets() -> Tuple[ImpactPreset, ...]:
+    """Historical presets parsed + validated once; the JSON ships with the package."""
+    return tuple(
+        ImpactPreset(
+            id=raw["id"],
+            name=raw["name"],
+            subtitle=raw["subtitle"],
+            era=raw["era"],
+            context=raw["context"],
+            input=PresetInput(**raw["input"]),
+            kind="historical",
+            source="Curated historical record",
+            last_updated=None,
+        )
+        for raw in _load_historical_impacts()
+    )
+
+
 def _load_historical_impacts() -> List[Dict[str, Any]]:
     try:
         with HISTORICAL_IMPACTS_PATH.open("r", encoding="utf-8") as f:
@@ -197,15 +205,14 @@ def _load_historical_impacts() -> List[Dict[str, Any]]:
 
 JOULES_PER_MEGATON = 4.184e15
 
+# Kinetic energy of a sphere, folded into one coefficient:
+#   ½ · (4/3)·π·(d/2)³ · ρ · v²  =  (π/12) · d³ · ρ · v²
+_KE_SPHERE_COEFF = math.pi / 12.0
 
-def _compute(p: ImpactRequest) -> ImpactResult:
-    # Mass from sphere
-    radius_m = p.diameter_m / 2.0
-    volume_m3 = (4.0 / 3.0) * math.pi * radius_m**3
-    mass_kg = volume_m3 * p.density_kg_m3
 
+def _compute(p: ImpactRequest) -> ImpactResult:
     velocity_ms = p.velocity_kms * 1000.0
-    energy_j = 0.5 * mass_kg * velocity_ms**2
+    energy_j = _KE_SPHERE_COEFF * p.diameter_m**3 * p.density_kg_m3 * velocity_ms * velocity_ms
     energy_mt = energy_j / JOULES_PER_MEGATON
 
     # Crater diameter (Holsapple π-scaling, simplified)
@@ -213,7 +220,7 @@ def _compute(p: ImpactRequest) -> ImpactResult:
     sin_angle = max(0.05, math.sin(math.radians(p.angle_deg)))
     crater_d_m = (
         1.161
-        * (p.density_kg_m3 / p.target_density_kg_m3) ** (1.0 / 3.0)
+        * math.cbrt(p.density_kg_m3 / p.target_density_kg_m3)
         * (p.diameter_m**0.78)
         * (velocity_ms**0.44)
         * (g**-0.22)
@@ -228,8 +235,9 @@ def _compute(p: ImpactRequest) -> ImpactResult:
     # Seismic magnitude (Schultz/Gault scaling)
     seismic_magnitude = 0.67 * math.log10(max(1.0, energy_j)) - 5.87
 
-    # Overpressure radius for 5 psi (heavy structural damage)
-    overpressure_radius_km = 2.2 * (energy_mt**0.33)
+    # Overpressure radius for 5 psi (heavy structural damage) — blast
+    # radii follow cube-root (Hopkinson–Cranz) energy scaling.
+    overpressure_radius_km = 2.2 * math.cbrt(energy_mt)
 
     # Crude population proxy (only meaningful with target population layer)
     impact_area = math.pi * (overpressure_radius_km**2) * 100  # km² → arbitrary
@@ -14,11 +14,14 @@ yerine "yaklaşım sırasında nominal olarak görülebilir mi" kabaca filtre.
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional  # noqa: F401
+from typing import Any, Dict, List, Optional, Tuple  # noqa: F401
 
+import numpy as np
 from fastapi import APIRouter, Query
 
+from app.domain.risk import RiskRecord
 from app.pipeline import risk_store
 
 router = APIRouter()
@@ -30,34 +33,37 @@ AMATEUR_TELESCOPE_LIMIT = 12.0
 PROFESSIONAL_LIMIT = 18.0
 
 
-def _h_from_diameter(diameter_km: float, albedo: float = DEFAULT_ALBEDO) -> float:
-    """Mutlak parlaklık (H) — Bowell (1989) bağıntısı."""
-    if diameter_km <= 0:
-        return 99.0
-    return 5.0 * math.log10(1329.0 / math.sqrt(albedo)) - 5.0 * math.log10(diameter_km)
+def _h_from_diameter(diameter_km: np.ndarray, albedo: float = DEFAULT_ALBEDO) -> np.ndarray:
+    """Mutlak parlaklık (H) — Bowell (1989) bağıntısı. Çap > 0 varsayılır."""
+    return 5.0 * math.log10(1329.0 / math.sqrt(albedo)) - 5.0 * np.log10(diameter_km)
 
 
-def _apparent_magnitude(h: float, distance_au: float) -> float:
+def _apparent_magnitude(h: np.ndarray, distance_au: np.ndarray) -> np.ndarray:
     """Yaklaşık görünen parlaklık. r ≈ 1 AU varsayımıyla basitleştirilmiş."""
-    if distance_au <= 0:
-        return 99.0
     # Daha gerçekçi formül için faz açısı eklenir; demo için Δ baskın.
-    return h + 5.0 * math.log10(distance_au)
+    return h + 5.0 * np.log10(distance_au)
 
 
-def _observable_window(approach_at: datetime, lat: float = 39.0) -> str:
-    """Türkiye gecesi varsayımı: yerel saat 21:00–05:00 arası gözlem."""
-    # Türkiye TRT (UTC+3)
-    trt = approach_at.astimezone(timezone(timedelta(hours=3)))
+# Türkiye TRT (UTC+3)
+_TRT = timezone(timedelta(hours=3))
+
+
+def _observing_slot(approach_at: datetime) -> Tuple[str, str]:
+    """(gözlem penceresi, Türkiye saati ile zaman etiketi) — tek TRT dönüşümü.
+
+    Türkiye gecesi varsayımı: yerel saat 21:00–05:00 arası gözlem.
+    """
+    trt = approach_at.astimezone(_TRT)
     hour = trt.hour
     if 21 <= hour or hour < 5:
-        return "gece (uygun)"
+        return "gece (uygun)", f"{trt.strftime('%d %b · %H:%M')} TRT"
+    when = f"{trt.strftime('%d %b %H:%M')} TRT (gündüz)"
     if 5 <= hour < 8 or 18 <= hour < 21:
-        return "alacakaranlık"
-    return "gündüz (uygun değil)"
+        return "alacakaranlık", when
+    return "gündüz (uygun değil)", when
 
 
-def _phase_angle_estimate(distance_au: float) -> float:
+def _phase_angle_estimate(distance_au: np.ndarray) -> np.ndarray:
     """Faz açısı yaklaşımı (derece).
 
     Yakın geçiş sırasında NEO observer-Sun çizgisinde olabilir; faz açısı
@@ -69,32 +75,49 @@ def _phase_angle_estimate(distance_au: float) -> float:
     """
     # Δ < 0.001 AU → yakın geçiş, ~30° faz açısı
     # Δ > 0.05 AU → ~90° faz açısı
-    if distance_au < 0.001:
-        return 30.0
-    if distance_au > 0.1:
-        return 110.0
     # Logaritmik interpolasyon
-    log_d = math.log10(distance_au)
-    return min(120.0, max(20.0, 30.0 + (log_d + 3) * 30.0))
+    interp = np.clip(30.0 + (np.log10(distance_au) + 3) * 30.0, 20.0, 120.0)
+    return np.where(distance_au < 0.001, 30.0, np.where(distance_au > 0.1, 110.0, interp))
 
 
-def _observable_time_tr(approach_at: datetime) -> str:
-    """Türkiye saati ile 'bu gece HH:MM-HH:MM' aralık tahmini."""
-    trt = approach_at.astimezone(timezone(timedelta(hours=3)))
-    hour = trt.hour
-    if 21 <= hour or hour < 5:
-        return f"{trt.strftime('%d %b')} · {trt.strftime('%H:%M')} TRT"
-    return f"{trt.strftime('%d %b %H:%M')} TRT (gündüz)"
+_CLASS_LIMITS = (NAKED_EYE_LIMIT, AMATEUR_TELESCOPE_LIMIT, PROFESSIONAL_LIMIT)
+_CLASS_NAMES = ("naked_eye", "amateur_telescope", "professional", "out_of_reach")
+
 
+def _classify(magnitudes: np.ndarray) -> List[str]:
+    """Görünürlük sınıfları — limitler dahil (m ≤ limit) → side="left"."""
+    return [_CLASS_NAMES[i] for i in np.searchsorted(_CLASS_LIMITS, magnitudes, side="left").tolist()]
 
-def _classify(magnitude: float) -> str:
-    if magnitude <= NAKED_EYE_LIMIT:
-        return "naked_eye"
-    if magnitude <= AMATEUR_TELESCOPE_LIMIT:
-        return "amateur_telescope"
-    if magnitude <= PROFESSIONAL_LIMIT:
-        return "professional"
-    return "out_of_reach"
+
+@dataclass(frozen=True, slots=True)
+class _RecordColumns:
+    """Risk kayıtlarının sütun (SoA) görünümü; eksik değerler NaN."""
+
+    miss_km: np.ndarray
+    diameter_km: np.ndarray
+    approach_s: np.ndarray  # UTC epoch saniye
+
+
+def _as_utc(approach: datetime) -> datetime:
+    # risk_store naive datetime depoluyor — UTC kabul et
+    return approach.replace(tzinfo=timezone.utc) if approach.tzinfo is None else approach
+
+
+def _records_to_columns(records: List[RiskRecord]) -> _RecordColumns:
+    """Kayıt listesini tek geçişte paralel float64 dizilerine açar."""
+    nan = float("nan")
+    n = len(records)
+    miss_km = np.full(n, nan)
+    diameter_km = np.full(n, nan)
+    approach_s = np.full(n, nan)
+    for i, r in enumerate(records):
+        if r.miss_distance_km is not None:
+            miss_km[i] = r.miss_distance_km
+        if r.diameter_max_km is not None:
+            diameter_km[i] = r.diameter_max_km
+        if r.next_approach_at is not None:
+            approach_s[i] = _as_utc(r.next_approach_at).timestamp()
+    return _RecordColumns(miss_km=miss_km, diameter_km=diameter_km, approach_s=approach_s)
 
 
 @router.get("/turkey")
@@ -112,54 +135,57 @@ async def turkey_observable(
     now = datetime.now(timezone.utc)
     horizon = now + timedelta(days=days)
 
+    # Kayıtlar girişte bir kez sütunlara (SoA) açılır; tarih / eksik veri
+    # filtresi ve fotometri dizi maskeleri üzerinde — kayıt başına dal yok.
+    # NaN her karşılaştırmada False → eksik alanlı kayıtlar kendiliğinden düşer.
+    cols = _records_to_columns(records)
+    now_s = now.timestamp()
+    valid = (
+        (cols.approach_s >= now_s)
+        & (cols.approach_s <= horizon.timestamp())
+        & (cols.miss_km > 0)
+        & (cols.diameter_km > 0)
+    )
+    idx = np.flatnonzero(valid)
+
     out: List[Dict[str, Any]] = []
-    for r in records:
-        approach = r.next_approach_at
-        if approach is None:
-            continue
-        # risk_store naive datetime depoluyor — UTC kabul et
-        if approach.tzinfo is None:
-            approach = approach.replace(tzinfo=timezone.utc)
-        if approach < now or approach > horizon:
-            continue
-        if r.miss_distance_km is None or r.miss_distance_km <= 0:
-            continue
-        if r.diameter_max_km is None or r.diameter_max_km <= 0:
-            continue
-
-        distance_au = r.miss_distance_km / KM_PER_AU
-        h = _h_from_diameter(r.diameter_max_km)
-        m = _apparent_magnitude(h, distance_au)
-        if m > max_magnitude:
-            continue
-
-        days_until: Optional[int] = None
-        delta = approach - now
-        days_until = max(0, delta.days)
-
-        phase_angle = _phase_angle_estimate(distance_au)
-        out.append(
-            {
-                "neo_id": r.neo_id,
-                "name": r.name,
-                "designation": r.designation,
-                "diameter_max_km": r.diameter_max_km,
-                "miss_distance_km": r.miss_distance_km,
-                "miss_distance_au": round(distance_au, 5),
-                "next_approach_at": approach.isoformat(),
-                "days_until_approach": days_until,
-                "absolute_magnitude_h": round(h, 2),
-                "apparent_magnitude": round(m, 2),
-                "phase_angle_deg": round(phase_angle, 1),
-                "observable_class": _classify(m),
-                "observable_window": _observable_window(approach),
-                "best_time_tr": _observable_time_tr(approach),
-                "is_potentially_hazardous": r.is_potentially_hazardous,
-                "sentry_listed": r.sentry_listed,
-                "hybrid_score": r.hybrid_score,
-                "risk_class": r.risk_class.value,
-            }
-        )
+    if idx.size:
+        distance_au = cols.miss_km[idx] / KM_PER_AU
+        h_arr = _h_from_diameter(cols.diameter_km[idx])
+        m_arr = _apparent_magnitude(h_arr, distance_au)
+        phase_arr = _phase_angle_estimate(distance_au)
+        # Yaklaşmaya kalan gün ve görünürlük sınıfı da dizi üzerinde:
+        # tam gün = floor(Δt / 86400), sınıf = limitlere göre searchsorted.
+        days_arr = np.floor_divide(cols.approach_s[idx] - now_s, 86400.0).astype(np.int64)
+        classes = _classify(m_arr)
+
+        for i in np.flatnonzero(m_arr <= max_magnitude).tolist():
+            r = records[idx[i]]
+            approach = _as_utc(r.next_approach_at)
+            m = float(m_arr[i])
+            window, best_time = _observing_slot(approach)
+            out.append(
+                {
+                    "neo_id": r.neo_id,
+                    "name": r.name,
+                    "designation": r.designation,
+                    "diameter_max_km": r.diameter_max_km,
+                    "miss_distance_km": r.miss_distance_km,
+                    "miss_distance_au": round(float(distance_au[i]), 5),
+                    "next_approach_at": approach.isoformat(),
+                    "days_until_approach": max(0, int(days_arr[i])),
+                    "absolute_magnitude_h": round(float(h_arr[i]), 2),
+                    "apparent_magnitude": round(m, 2),
+                    "phase_angle_deg": round(float(phase_arr[i]), 1),
+                    "observable_class": classes[i],
+                    "observable_window": window,
+                    "best_time_tr": best_time,
+                    "is_potentially_hazardous": r.is_potentially_hazardous,
+                    "sentry_listed": r.sentry_listed,
+                    "hybrid_score": r.hybrid_score,
+                    "risk_class": r.risk_class.value,
+                }
+            )
 
     # En parlak (en düşük m) önce
     out.sort(key=lambda x: x.get("apparent_magnitude") or 99)
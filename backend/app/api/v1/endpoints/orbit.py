@@ -14,6 +14,7 @@ from typing import Any, Dict
 from fastapi import APIRouter, Query
 
 from app.core.exceptions import NotFoundError, UpstreamError
+from app.core.executor import run_blocking
 from app.nasa import neows
 from app.pipeline import orbit_elements as oe
 from app.pipeline import propagator as prop
@@ -57,13 +58,15 @@ async def projection(
 ) -> Dict[str, Any]:
     """RK4 + perturbation propagation. Returns sampled trajectory points.
 
-    Heavy: a 50-year, 1000-sample projection takes ~1 second on a laptop.
-    Cache aggressively at the caller level if you call this often.
+    Heavy: a 50-year, 1000-sample projection takes ~1 second on a laptop,
+    so the integration runs on the shared CPU pool rather than the event
+    loop. Cache aggressively at the caller level if you call this often.
     """
     elements = await _fetch_elements(neo_id)
     jd_start = oe.jd_now()
     days = years * 365.25
-    traj = prop.propagate(
+    traj = await run_blocking(
+        prop.propagate,
         elements,
         jd_start=jd_start,
         days=days,
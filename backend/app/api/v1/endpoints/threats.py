@@ -57,8 +57,7 @@ class GenerateExplanationRequest(BaseModel):
 
 @router.get("/risk/snapshot", response_model=RiskSnapshot)
 async def risk_snapshot(limit: int = Query(200, ge=1, le=500)) -> RiskSnapshot:
-    items = await risk_store.top_n_by_score(limit)
-    total = await risk_store.total()
+    items, total = await risk_store.top_n_with_total(limit)
     return RiskSnapshot(items=items, total=total, computed_at=datetime.utcnow())
 
 
@@ -74,9 +73,9 @@ async def featured_today() -> dict:
         return {"available": False}
 
     # Prefer items with a *future* next-approach so the hero feels timely.
+    # Only the first match is needed — stop scanning there, no filtered list.
     now = datetime.utcnow()
-    upcoming = [r for r in items if r.next_approach_at is not None and r.next_approach_at >= now]
-    pick = upcoming[0] if upcoming else items[0]
+    pick = next((r for r in items if r.next_approach_at is not None and r.next_approach_at >= now), items[0])
 
     days_until: Optional[int] = None
     if pick.next_approach_at is not None and pick.next_approach_at >= now:
@@ -162,10 +161,13 @@ async def generate_explanation(
     text" without separate routes. Rate-limited the same way the legacy
     `/ai/threat-explanation` route was — whitelisted IPs bypass."""
     service = get_service()
+    # Regenerate means a new generation: skip the AI response cache, which
+    # would otherwise hand back the same text for up to its TTL.
     result = await service.explain_threat(
         neo_id,
         language=request.language,
         with_search=request.with_search,
+        refresh=True,
     )
     payload = await explanation_store.put(
         neo_id,
@@ -190,14 +192,16 @@ async def clear_cached_explanation(neo_id: str) -> Response:
 
 @router.post("/refresh", status_code=202)
 async def trigger_refresh() -> dict:
-    """Manually trigger one autonomous-loop cycle (fire-and-forget)."""
-    import asyncio
+    """Manually trigger one autonomous-loop cycle (fire-and-forget).
 
+    While a manual cycle is still running, further calls join it instead of
+    starting another (`coalesced: true`)."""
     from app.scheduler.autonomous_loop import loop
 
-    asyncio.create_task(loop._safe_cycle())  # type: ignore[attr-defined]
+    started = loop.trigger_cycle()
     return {
         "accepted": True,
+        "coalesced": not started,
         "cycle_count": loop.cycle_count,
         "last_cycle_at": loop.last_cycle_at.isoformat() if loop.last_cycle_at else None,
     }
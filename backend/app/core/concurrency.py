@@ -0,0 +1,94 @@
+"""Async concurrency primitives shared across services."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Deque
+
+
+class AdjustableSemaphore:
+    """Counting semaphore whose capacity can change while callers are queued.
+
+    `asyncio.Semaphore` has a fixed capacity; the only way to resize it is to
+    build a new one, which strands every coroutine already waiting on the old
+    object and resets throttling. Here `set_limit()` adjusts the capacity in
+    place: raising it wakes queued waiters immediately, lowering it lets
+    in-flight holders drain naturally before anyone new gets in.
+
+    The in-flight count is tracked explicitly (`active`) so callers never
+    have to peek at private state. Single event loop only — no locking.
+    """
+
+    __slots__ = ("_limit", "_active", "_waiters")
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        self._limit = limit
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def locked(self) -> bool:
+        return self._active >= self._limit
+
+    def set_limit(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        self._limit = limit
+        self._wake()
+
+    async def acquire(self) -> bool:
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            return True
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was granted just as we were cancelled — hand it back.
+                self._active -= 1
+                self._wake()
+            else:
+                try:
+                    self._waiters.remove(fut)
+                except ValueError:
+                    pass
+            raise
+        return True
+
+    def release(self) -> None:
+        if self._active <= 0:
+            raise ValueError("AdjustableSemaphore released too many times")
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._active < self._limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._active += 1
+                fut.set_result(None)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.release()
+
+
+__all__ = ["AdjustableSemaphore"]
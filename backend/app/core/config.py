@@ -31,6 +31,9 @@ class Settings(BaseSettings):
     BACKEND_HOST: str = "0.0.0.0"
     BACKEND_PORT: int = 8000
     BACKEND_RELOAD: bool = True
+    # Open WebSocket clients held at once; new connections beyond this are
+    # refused so a reconnect storm can't grow the connection table unbounded.
+    WS_MAX_CONNECTIONS: int = Field(default=2000, ge=1)
 
     # Logging
     LOG_LEVEL: LogLevel = "info"
@@ -55,6 +58,22 @@ class Settings(BaseSettings):
     AI_EXPLAIN_LIMIT_PER_MINUTE: int = 3
     AI_EXPLAIN_LIMIT_PER_HOUR: int = 15
     AI_GLOBAL_LIMIT_PER_MINUTE: int = 60  # safety net across all clients
+    # Upstream generations allowed in flight at once (chat, stream, threat
+    # briefings). Extra callers wait for a free slot instead of piling onto
+    # the provider.
+    AI_MAX_CONCURRENT_GENERATIONS: int = Field(default=4, ge=1)
+    # Identical threat-briefing requests (same record facts, model and
+    # parameters) are served from Redis for this long. 0 disables the cache.
+    AI_EXPLAIN_CACHE_TTL_SECONDS: int = Field(default=6 * 3600, ge=0)
+    # Output cap for threat briefings. The prompt asks for 5-8 sentences in
+    # three short paragraphs (~300-600 tokens; Turkish runs longer). Reasoning
+    # models count their hidden reasoning against this budget too, so keep
+    # headroom — but every token of cap is decode time when a model rambles.
+    AI_EXPLAIN_MAX_TOKENS: int = Field(default=1500, ge=256)
+    # Records with no signal (minimal class, neither PHA nor Sentry-listed,
+    # hybrid score below this) get a locally templated briefing instead of a
+    # model call. 0 disables the short-circuit.
+    AI_EXPLAIN_ROUTINE_MAX_SCORE: float = Field(default=0.05, ge=0.0, le=1.0)
 
     # IPs in this list completely bypass every rate limit (per-minute,
     # per-hour, queue, global). Comma-separated. Useful for the operator's
@@ -117,6 +136,7 @@ class Settings(BaseSettings):
     INGEST_INTERVAL_SECONDS: int = 1800
     RISK_REFRESH_SECONDS: int = 3600
     WATCHLIST_SIZE: int = 200
+    RECOMPUTE_CONCURRENCY: int = Field(default=8, ge=1)  # parallel NeoWs lookups + analyses per cycle
     INGEST_FEED_DAYS_BOOT: int = 30  # initial cycle pulls 30 days for a wider catalog
     INGEST_FEED_DAYS_CYCLE: int = 7  # subsequent cycles pull 7 days (NeoWs limit)
     SCHEDULER_ENABLED: bool = True
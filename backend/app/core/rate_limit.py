@@ -201,6 +201,15 @@ def _bucket_for(
     refill_rate: float,
 ) -> _TokenBucket:
     table = _BUCKETS.setdefault(name, OrderedDict())
+    # A bucket idle for a full refill period is back at capacity — the same
+    # as a fresh one — so it can go. The table is kept in access order, so
+    # those sit at the front: expiring them is O(expired), not a full scan.
+    idle_cutoff = time.monotonic() - capacity / refill_rate
+    while table:
+        oldest = next(iter(table.values()))
+        if oldest.last_used > idle_cutoff:
+            break
+        table.popitem(last=False)
     bucket = table.get(ip)
     if bucket is None:
         bucket = _TokenBucket(capacity=capacity, refill_rate=refill_rate)
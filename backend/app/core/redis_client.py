@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
 import redis.asyncio as aioredis
@@ -13,6 +14,9 @@ from app.core.logging import get_logger
 log = get_logger(__name__)
 
 _client: Optional[Redis] = None
+# Serializes connect(): without it, two callers racing past the `_client is
+# None` check across the ping await would each build a pool and leak one.
+_connect_lock = asyncio.Lock()
 
 
 async def connect() -> Optional[Redis]:
@@ -26,35 +30,38 @@ async def connect() -> Optional[Redis]:
     global _client
     if _client is not None:
         return _client
-    candidate = aioredis.from_url(
-        settings.REDIS_URL,
-        encoding="utf-8",
-        decode_responses=True,
-        socket_timeout=settings.REDIS_TIMEOUT_SECONDS,
-        socket_connect_timeout=settings.REDIS_TIMEOUT_SECONDS,
-        retry_on_timeout=True,
-        health_check_interval=30,
-    )
-    try:
-        await candidate.ping()
-    except Exception as exc:
-        log.warning("redis.connect_failed", error=str(exc))
+    async with _connect_lock:
+        if _client is not None:
+            return _client
+        candidate = aioredis.from_url(
+            settings.REDIS_URL,
+            encoding="utf-8",
+            decode_responses=True,
+            socket_timeout=settings.REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_TIMEOUT_SECONDS,
+            retry_on_timeout=True,
+            health_check_interval=30,
+        )
         try:
-            await candidate.aclose()
-        except Exception:
-            pass
-        # Dev fallback: spin up an in-memory fakeredis so the backend runs
-        # locally without Docker/Redis. Production never fakes — fail loud.
-        if settings.REDIS_FALLBACK_FAKE and not settings.is_production:
-            fake = _make_fake_redis()
-            if fake is not None:
-                _client = fake
-                log.warning("redis.using_fakeredis_fallback")
-                return _client
-        return None
-    _client = candidate
-    log.info("redis.connected", url=_safe_url(settings.REDIS_URL))
-    return _client
+            await candidate.ping()
+        except Exception as exc:
+            log.warning("redis.connect_failed", error=str(exc))
+            try:
+                await candidate.aclose()
+            except Exception:
+                pass
+            # Dev fallback: spin up an in-memory fakeredis so the backend runs
+            # locally without Docker/Redis. Production never fakes — fail loud.
+            if settings.REDIS_FALLBACK_FAKE and not settings.is_production:
+                fake = _make_fake_redis()
+                if fake is not None:
+                    _client = fake
+                    log.warning("redis.using_fakeredis_fallback")
+                    return _client
+            return None
+        _client = candidate
+        log.info("redis.connected", url=_safe_url(settings.REDIS_URL))
+        return _client
 
 
 def _make_fake_redis() -> Optional[Redis]:
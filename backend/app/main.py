@@ -14,12 +14,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from prometheus_client import make_asgi_app
 
+from app.ai import client as ai_client
 from app.api.v1.router import api_v1_router
-from app.core import redis_client
+from app.core import executor, redis_client
 from app.core.config import settings
 from app.core.exceptions import register_handlers
 from app.core.logging import configure_logging, get_logger
 from app.nasa import http as nasa_http
+from app.pipeline.ml_classifier import get_classifier
 from app.scheduler.autonomous_loop import loop as autonomous_loop
 from app.ws.manager import manager as ws_manager
 
@@ -31,6 +33,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     log.info("app.starting", version=settings.APP_VERSION, env=settings.ENVIRONMENT)
     await redis_client.connect()
     await nasa_http.get_client()
+    # Load the ML artifact off the loop before the first recompute needs it.
+    await executor.run_blocking(get_classifier().ensure_loaded)
     await autonomous_loop.start()
     log.info("app.started")
     try:
@@ -40,7 +44,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await autonomous_loop.stop()
         await ws_manager.shutdown()
         await nasa_http.close_client()
+        await ai_client.close_client()
         await redis_client.disconnect()
+        executor.shutdown()
         log.info("app.stopped")
 
 
@@ -105,6 +111,8 @@ def create_app() -> FastAPI:
     @app.websocket("/ws/cliff")
     async def cliff_ws(websocket: WebSocket) -> None:
         client_id = await ws_manager.accept(websocket)
+        if client_id is None:
+            return
         try:
             while True:
                 payload = await websocket.receive_text()
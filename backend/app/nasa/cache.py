@@ -3,13 +3,17 @@
 `get_or_fetch(key, ttl, loader)` is the only thing callers need: returns
 deserialized JSON if cached, otherwise calls `loader`, persists, returns.
 Falls back gracefully if Redis is down (loader still runs, no cache).
+
+Payloads go through orjson: NeoWs feed windows run to megabytes and are
+decoded on every cache hit.
 """
 
 from __future__ import annotations
 
-import json
 from typing import Any, Awaitable, Callable, Optional
 
+import orjson
+
 from app.core import redis_client
 from app.core.logging import get_logger
 
@@ -32,7 +36,7 @@ async def get(key: str) -> Optional[Any]:
         raw = await client.get(_full_key(key))
         if raw is None:
             return None
-        return json.loads(raw)
+        return orjson.loads(raw)
     except Exception as exc:
         log.warning("cache.get_failed", key=key, error=str(exc))
         return None
@@ -46,7 +50,7 @@ async def set(key: str, value: Any, ttl_seconds: int) -> None:
     try:
         await client.set(
             _full_key(key),
-            json.dumps(value, default=str),
+            orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS),
             ex=ttl_seconds,
         )
     except Exception as exc:
@@ -9,9 +9,8 @@ helper used by the hybrid pipeline.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypedDict
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -20,14 +19,20 @@ from app.nasa import cache, http
 log = get_logger(__name__)
 
 
-@dataclass(frozen=True)
-class EphemerisRow:
+class EphemerisRow(TypedDict):
+    """One parsed ephemeris row, stored as-is under the payload's `_rows`.
+
+    Plain dicts rather than a dataclass: rows only ever exist to be cached
+    and read back by key, so building an object per row and converting it
+    again would be pure overhead.
+    """
+
     when: str
     delta_au: float
     deldot_kms: float
-    ra: Optional[str] = None
-    dec: Optional[str] = None
-    apmag: Optional[float] = None
+    ra: Optional[str]
+    dec: Optional[str]
+    apmag: Optional[float]
 
 
 def _normalize_command(target: str) -> str:
@@ -98,7 +103,7 @@ async def get_ephemeris(
             params=_default_params(target_id, start, stop, step),
             upstream_label="jpl.horizons",
         )
-        payload["_rows"] = [row.__dict__ for row in _parse_result(payload)]
+        payload["_rows"] = _parse_result(payload)
         return payload
 
     return await cache.get_or_fetch(key, settings.CACHE_TTL_HORIZONS, loader)
@@ -118,6 +123,23 @@ async def get_future_positions(
     )
 
 
+def table_lines(raw: str) -> List[str]:
+    """Lines between the `$$SOE` / `$$EOE` markers of a Horizons `result`.
+
+    The header and footer around the table run to several KB; slicing the
+    block out with two `find` scans avoids splitting and stripping all of it
+    line by line. A missing `$$EOE` reads to the end, like the old loop did.
+    """
+    start = raw.find("$$SOE")
+    if start < 0:
+        return []
+    start = raw.find("\n", start)
+    if start < 0:
+        return []
+    end = raw.find("$$EOE", start)
+    return raw[start + 1 : end if end >= 0 else len(raw)].splitlines()
+
+
 def _parse_result(payload: Dict[str, Any]) -> List[EphemerisRow]:
     """Parse the `result` string for `$$SOE` / `$$EOE` table rows.
 
@@ -130,15 +152,9 @@ def _parse_result(payload: Dict[str, Any]) -> List[EphemerisRow]:
         return existing if isinstance(existing, list) else []
 
     rows: List[EphemerisRow] = []
-    in_table = False
-    for line in raw.splitlines():
+    for line in table_lines(raw):
         stripped = line.strip()
-        if stripped == "$$SOE":
-            in_table = True
-            continue
-        if stripped == "$$EOE":
-            break
-        if not in_table or not stripped:
+        if not stripped:
             continue
 
         if "," in stripped:
@@ -199,7 +215,7 @@ def _parse_csv_row(line: str) -> Optional[EphemerisRow]:
             apmag = float(parts[5])
         except ValueError:
             apmag = None
-    return EphemerisRow(when=when, delta_au=delta_au, deldot_kms=deldot_kms, ra=ra, dec=dec, apmag=apmag)
+    return {"when": when, "delta_au": delta_au, "deldot_kms": deldot_kms, "ra": ra, "dec": dec, "apmag": apmag}
 
 
 def _parse_fixed_row(line: str) -> Optional[EphemerisRow]:
@@ -212,4 +228,4 @@ def _parse_fixed_row(line: str) -> Optional[EphemerisRow]:
         deldot_kms = float(parts[-4])
     except (IndexError, ValueError):
         return None
-    return EphemerisRow(when=when, delta_au=delta_au, deldot_kms=deldot_kms)
+    return {"when": when, "delta_au": delta_au, "deldot_kms": deldot_kms, "ra": None, "dec": None, "apmag": None}
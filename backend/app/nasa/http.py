@@ -4,6 +4,7 @@
 - Token-bucket rate limiter (settings.NASA_RATE_LIMIT_RPS)
 - Retry with exponential backoff, respects Retry-After
 - Maps non-2xx responses to ApiError subclasses
+- Sliding-window request-rate counter for the health endpoint
 """
 
 from __future__ import annotations
@@ -11,7 +12,8 @@ from __future__ import annotations
 import asyncio
 import random
 import time
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Deque, Dict, Optional
 
 import httpx
 
@@ -25,6 +27,12 @@ _client: Optional[httpx.AsyncClient] = None
 _rate_lock = asyncio.Lock()
 _last_call_at: float = 0.0
 
+# Monotonic timestamps of outbound calls inside the rate window. Appended in
+# call order, so expiring old entries is a popleft from the front — amortized
+# O(1) per call instead of re-filtering the whole history.
+RATE_WINDOW_SECONDS = 60.0
+_request_times: Deque[float] = deque()
+
 
 async def get_client() -> httpx.AsyncClient:
     global _client
@@ -59,6 +67,24 @@ async def _throttle() -> None:
         _last_call_at = time.monotonic()
 
 
+def _record_request(now: Optional[float] = None) -> None:
+    ts = time.monotonic() if now is None else now
+    _request_times.append(ts)
+    _expire_request_times(ts)
+
+
+def _expire_request_times(now: float) -> None:
+    cutoff = now - RATE_WINDOW_SECONDS
+    while _request_times and _request_times[0] < cutoff:
+        _request_times.popleft()
+
+
+def requests_per_second(now: Optional[float] = None) -> float:
+    """Average outbound request rate over the last `RATE_WINDOW_SECONDS`."""
+    _expire_request_times(time.monotonic() if now is None else now)
+    return len(_request_times) / RATE_WINDOW_SECONDS
+
+
 async def request_json(
     method: str,
     url: str,
@@ -74,6 +100,7 @@ async def request_json(
 
     for attempt in range(max_retries + 1):
         await _throttle()
+        _record_request()
         try:
             response = await client.request(method, url, params=params, json=json_body)
         except httpx.TimeoutException as exc:
@@ -105,6 +132,10 @@ async def request_json(
 
         if response.status_code == 429:
             retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is None:
+                # No server hint: use the exponential schedule rather than a
+                # flat multi-second pause on the first retry.
+                retry_after = _backoff_delay(attempt)
             log.warning(
                 "nasa.http.rate_limited",
                 upstream=upstream_label,
@@ -160,19 +191,25 @@ async def request_json(
     )
 
 
-def _parse_retry_after(value: Optional[str]) -> float:
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, clamped to [0, 60]; None
+    when the header is absent or not a number."""
     if not value:
-        return 5.0
+        return None
     try:
-        return min(60.0, max(1.0, float(value)))
+        return min(60.0, max(0.0, float(value)))
     except ValueError:
-        return 5.0
+        return None
 
 
-async def _backoff(attempt: int) -> None:
+def _backoff_delay(attempt: int) -> float:
     base = 0.5 * (2**attempt)
     jitter = random.uniform(0.0, 0.5)
-    await asyncio.sleep(min(15.0, base + jitter))
+    return min(15.0, base + jitter)
+
+
+async def _backoff(attempt: int) -> None:
+    await asyncio.sleep(_backoff_delay(attempt))
 
 
 def _safe_body(response: httpx.Response) -> str:
@@ -12,6 +12,8 @@ Cache 60 s — these feeds update on the minute.
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional
 
 from app.core.logging import get_logger
@@ -23,34 +25,32 @@ SWPC_BASE = "https://services.swpc.noaa.gov"
 CACHE_TTL_SECONDS = 60
 
 
+# GOES long-band flux class boundaries (W/m²). Each letter's number is the
+# flux in units of that band's lower bound; "A" is scaled by 1e-8.
+_FLARE_BOUNDS = (1e-7, 1e-6, 1e-5, 1e-4)
+_FLARE_BANDS = (("A", 1e-8), ("B", 1e-7), ("C", 1e-6), ("M", 1e-5), ("X", 1e-4))
+
+# NOAA G-scale: label for Kp ≥ each bound.
+_KP_BOUNDS = (4, 5, 6, 7, 8, 9)
+_KP_LABELS = ("Quiet", "Unsettled", "G1 — Minor", "G2 — Moderate", "G3 — Strong", "G4 — Severe", "G5 — Extreme")
+
+# Returned for NaN / inf readings: bisect would rank NaN above every bound.
+_UNKNOWN_LABEL = "Unknown"
+
+
 def _flare_class(flux_wm2: float) -> str:
     """Classify GOES X-ray flux into the standard A/B/C/M/X letter system."""
-    if flux_wm2 >= 1e-4:
-        return f"X{flux_wm2 / 1e-4:.1f}"
-    if flux_wm2 >= 1e-5:
-        return f"M{flux_wm2 / 1e-5:.1f}"
-    if flux_wm2 >= 1e-6:
-        return f"C{flux_wm2 / 1e-6:.1f}"
-    if flux_wm2 >= 1e-7:
-        return f"B{flux_wm2 / 1e-7:.1f}"
-    return f"A{flux_wm2 / 1e-8:.1f}"
+    if not math.isfinite(flux_wm2):
+        return _UNKNOWN_LABEL
+    letter, unit = _FLARE_BANDS[bisect_right(_FLARE_BOUNDS, flux_wm2)]
+    return f"{letter}{flux_wm2 / unit:.1f}"
 
 
 def _kp_label(kp: float) -> str:
     """Convert a Kp value to a human-readable storm level."""
-    if kp >= 9:
-        return "G5 — Extreme"
-    if kp >= 8:
-        return "G4 — Severe"
-    if kp >= 7:
-        return "G3 — Strong"
-    if kp >= 6:
-        return "G2 — Moderate"
-    if kp >= 5:
-        return "G1 — Minor"
-    if kp >= 4:
-        return "Unsettled"
-    return "Quiet"
+    if not math.isfinite(kp):
+        return _UNKNOWN_LABEL
+    return _KP_LABELS[bisect_right(_KP_BOUNDS, kp)]
 
 
 async def get_kp_index() -> Dict[str, Any]:
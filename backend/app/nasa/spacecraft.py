@@ -21,7 +21,7 @@ from typing import Any, Dict, List, Optional
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.domain.mission import Mission
-from app.nasa import cache, http
+from app.nasa import cache, horizons, http
 
 log = get_logger(__name__)
 
@@ -135,15 +135,9 @@ def _parse_first_row(payload: Dict[str, Any]) -> Optional[Dict[str, float]]:
     raw = payload.get("result")
     if not isinstance(raw, str) or "$$SOE" not in raw:
         return None
-    in_table = False
-    for line in raw.splitlines():
+    for line in horizons.table_lines(raw):
         stripped = line.strip()
-        if stripped == "$$SOE":
-            in_table = True
-            continue
-        if stripped == "$$EOE":
-            break
-        if not in_table or not stripped:
+        if not stripped:
             continue
         parts = [p.strip() for p in stripped.split(",")]
         while parts and parts[-1] == "":
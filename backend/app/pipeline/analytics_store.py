@@ -142,13 +142,21 @@ async def recent_visits(limit: int = 100) -> List[Dict[str, Any]]:
     return out
 
 
-async def _hash_total(client, key: str) -> int:
-    try:
-        vals = await client.hvals(key)
-    except Exception:
+def _sum_counts(values: Optional[List[Any]]) -> int:
+    """Sum HINCRBY counter values.
+
+    They are always integer strings, so a single `sum(map(int, ...))`
+    covers the normal case; only a hash holding a stray non-numeric value
+    falls back to the per-value loop that skips it.
+    """
+    if not values:
         return 0
+    try:
+        return sum(map(int, values))
+    except (ValueError, TypeError):
+        pass
     total = 0
-    for v in vals or []:
+    for v in values:
         try:
             total += int(v)
         except (ValueError, TypeError):
@@ -156,6 +164,14 @@ async def _hash_total(client, key: str) -> int:
     return total
 
 
+async def _hash_total(client, key: str) -> int:
+    try:
+        vals = await client.hvals(key)
+    except Exception:
+        return 0
+    return _sum_counts(vals)
+
+
 async def daily_summary(days_back: int = 7) -> Dict[str, Any]:
     """Aggregate stats for the last `days_back` UTC days plus today.
 
@@ -204,14 +220,8 @@ async def daily_summary(days_back: int = 7) -> Dict[str, Any]:
 
     last_7d: List[Dict[str, Any]] = []
     for i, d in enumerate(days):
-        page_vals = results[i * 2] or []
+        views = _sum_counts(results[i * 2])
         unique_count = int(results[i * 2 + 1] or 0)
-        views = 0
-        for v in page_vals:
-            try:
-                views += int(v)
-            except (ValueError, TypeError):
-                continue
         last_7d.append({"date": d, "views": views, "uniques": unique_count})
 
     today_row = next((r for r in last_7d if r["date"] == today), {"views": 0, "uniques": 0})
@@ -250,12 +260,7 @@ async def daily_summary(days_back: int = 7) -> Dict[str, Any]:
             for d in all_days:
                 pipe.hvals(f"{_PREFIX}:pages:{d}")
             day_vals = await pipe.execute()
-            for vals in day_vals:
-                for v in vals or []:
-                    try:
-                        totals_90d_views += int(v)
-                    except (ValueError, TypeError):
-                        continue
+            totals_90d_views = sum(_sum_counts(vals) for vals in day_vals)
     except Exception:
         totals_90d_views = sum(d["views"] for d in last_7d)
 
@@ -16,10 +16,13 @@ they appear in EONET's feed).
 
 from __future__ import annotations
 
+import math
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.domain.earth_event import SEVERITY_RANK
+
 
 class EarthCategoryMeta(BaseModel):
     code: str
@@ -37,6 +40,19 @@ class EarthCategoryMeta(BaseModel):
     sort_priority: int = 50  # lower = shown earlier in chip rail
 
 
+# Tier tables are module constants — both helpers run once per event on
+# every ingest, so they shouldn't rebuild the same literals per call. Ranks
+# come from the domain's `SEVERITY_RANK` rather than a second copy here.
+_SEVERITY_TIERS = ("low", "moderate", "high", "critical")
+_SEVERITY_BASE_SCORE: Dict[str, float] = {
+    "info": 0.0,
+    "low": 0.2,
+    "moderate": 0.45,
+    "high": 0.7,
+    "critical": 0.9,
+}
+
+
 EARTH_CATEGORIES: Dict[str, EarthCategoryMeta] = {
     "earthquakes-tr": EarthCategoryMeta(
         code="earthquakes-tr",
@@ -236,6 +252,17 @@ EARTH_CATEGORIES: Dict[str, EarthCategoryMeta] = {
 }
 
 
+# Lower-cased EONET code → category key, built once at import. Every EONET
+# event resolves its category through this, so a scan over all categories
+# (lower-casing each code) per lookup adds up across a feed. First
+# registration wins, matching the old iteration order.
+_EONET_CODE_INDEX: Dict[str, str] = {}
+for _key, _meta in EARTH_CATEGORIES.items():
+    for _code in _meta.eonet_codes:
+        _EONET_CODE_INDEX.setdefault(_code.lower(), _key)
+del _key, _meta, _code
+
+
 def severity_for_metric(category_code: str, value: Optional[float]) -> str:
     """Bucket `value` into a severity tier using the category's thresholds.
 
@@ -248,9 +275,8 @@ def severity_for_metric(category_code: str, value: Optional[float]) -> str:
     if value is None or not meta.severity_thresholds:
         return meta.min_default_severity
 
-    severities = ["low", "moderate", "high", "critical"]
     tier = "low"
-    for boundary, label in zip(meta.severity_thresholds, severities):
+    for boundary, label in zip(meta.severity_thresholds, _SEVERITY_TIERS):
         if value >= boundary:
             tier = label
         else:
@@ -258,8 +284,7 @@ def severity_for_metric(category_code: str, value: Optional[float]) -> str:
 
     # Honor min_default_severity (so e.g. volcano always ≥ moderate even
     # at low VEI).
-    rank = {"info": 0, "low": 1, "moderate": 2, "high": 3, "critical": 4}
-    if rank.get(tier, 0) < rank.get(meta.min_default_severity, 0):
+    if SEVERITY_RANK.get(tier, 0) < SEVERITY_RANK.get(meta.min_default_severity, 0):
         tier = meta.min_default_severity
     return tier
 
@@ -271,19 +296,11 @@ def severity_score(severity: str, metric_value: Optional[float] = None) -> float
     high-metric event. Within a tier the metric value provides a smooth
     intra-bucket sort so the "biggest fire of the day" floats up.
     """
-    base = {
-        "info": 0.0,
-        "low": 0.2,
-        "moderate": 0.45,
-        "high": 0.7,
-        "critical": 0.9,
-    }.get(severity, 0.0)
+    base = _SEVERITY_BASE_SCORE.get(severity, 0.0)
     bonus = 0.0
     if metric_value is not None and metric_value > 0:
         # log-ish dampener so very large values don't blow the score.
         # We keep the bonus capped at 0.099 so the tier ordering stays.
-        import math
-
         bonus = min(0.099, math.log10(metric_value + 1.0) / 50.0)
     return min(1.0, base + bonus)
 
@@ -299,11 +316,9 @@ def category_for_eonet(code: str) -> Optional[str]:
     Most are 1:1 but we leave room for renames/mappings here so the
     normalizer stays clean.
     """
-    code_lower = code.lower() if isinstance(code, str) else ""
-    for key, meta in EARTH_CATEGORIES.items():
-        if any(c.lower() == code_lower for c in meta.eonet_codes):
-            return key
-    return None
+    if not isinstance(code, str):
+        return None
+    return _EONET_CODE_INDEX.get(code.lower())
 
 
 __all__ = [
@@ -22,13 +22,19 @@ index regardless of source so the dashboard stays bounded.
 
 from __future__ import annotations
 
+import heapq
 import uuid
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import orjson
 
 from app.core import redis_client
 from app.core.logging import get_logger
 from app.domain.earth_event import (
+    SEVERITY_RANK,
     EarthEvent,
     EarthEventAlert,
     EarthEventDelta,
@@ -82,6 +88,28 @@ async def get(event_id: str) -> Optional[EarthEvent]:
         return None
 
 
+async def get_many(event_ids: Sequence[str]) -> List[Optional[EarthEvent]]:
+    """Positional batch `get`: one MGET; missing / unparseable ids map to None."""
+    if not event_ids:
+        return []
+    try:
+        client = redis_client.get_client()
+    except RuntimeError:
+        return [None] * len(event_ids)
+    raws = await client.mget(*[_event_key(eid) for eid in event_ids])
+    out: List[Optional[EarthEvent]] = []
+    for event_id, raw in zip(event_ids, raws):
+        if raw is None:
+            out.append(None)
+            continue
+        try:
+            out.append(EarthEvent.model_validate_json(raw))
+        except Exception as exc:  # noqa: BLE001
+            log.warning("earth_store.parse_failed", event_id=event_id, error=str(exc))
+            out.append(None)
+    return out
+
+
 async def total_open() -> int:
     try:
         client = redis_client.get_client()
@@ -126,6 +154,62 @@ async def fetch_many(event_ids: Sequence[str]) -> List[EarthEvent]:
     return out
 
 
+@dataclass(frozen=True, slots=True)
+class _EventHead:
+    """The scalar fields `query` and `summary` filter, count and sort on.
+
+    Times are epoch seconds: parsed once here, then every cutoff check and
+    sort-key comparison is a float compare instead of aware-datetime math.
+    """
+
+    id: str
+    category: str
+    severity: str
+    severity_score: float
+    started_ts: float
+    updated_ts: float
+
+
+async def _fetch_heads(event_ids: Sequence[str]) -> List[_EventHead]:
+    """Like `fetch_many`, but decodes only the head fields with orjson.
+
+    Full validation builds every geometry sample and source link (long-lived
+    wildfires and storms carry hundreds); filters and counters never read
+    them, so only the page that is actually returned pays for a model.
+    """
+    if not event_ids:
+        return []
+    try:
+        client = redis_client.get_client()
+    except RuntimeError:
+        return []
+    raws = await client.mget(*[_event_key(eid) for eid in event_ids])
+    out: List[_EventHead] = []
+    for raw in raws:
+        if not raw:
+            continue
+        try:
+            doc = orjson.loads(raw)
+            out.append(
+                _EventHead(
+                    id=doc["id"],
+                    category=doc["category"],
+                    severity=doc.get("severity") or "info",
+                    severity_score=float(doc.get("severity_score") or 0.0),
+                    started_ts=_stored_ts(doc["started_at"]),
+                    updated_ts=_stored_ts(doc["updated_at"]),
+                )
+            )
+        except Exception:
+            continue
+    return out
+
+
+def _stored_ts(value: str) -> float:
+    dt = datetime.fromisoformat(value)
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+
 async def query(
     *,
     categories: Optional[Iterable[str]] = None,
@@ -150,23 +234,19 @@ async def query(
     raw_ids: List[str] = await client.zrevrange(primary_index, 0, -1)
     candidate_ids: List[str] = list(raw_ids)
 
-    # Filter by category / source membership using the secondary SETs.
+    # Filter by category / source membership using the secondary SETs —
+    # Redis unions the selected sets server-side (one SUNION per facet)
+    # rather than us pulling each set and merging them here.
     if categories:
         cat_list = [c for c in categories if c]
         if cat_list:
-            allowed: set[str] = set()
-            for cat in cat_list:
-                members = await client.smembers(_category_key(cat))
-                allowed.update(members)
+            allowed: set[str] = set(await client.sunion(*[_category_key(c) for c in cat_list]))
             candidate_ids = [eid for eid in candidate_ids if eid in allowed]
 
     if sources:
         src_list = [s for s in sources if s]
         if src_list:
-            allowed_src: set[str] = set()
-            for src in src_list:
-                members = await client.smembers(_source_key(src))
-                allowed_src.update(members)
+            allowed_src: set[str] = set(await client.sunion(*[_source_key(s) for s in src_list]))
             candidate_ids = [eid for eid in candidate_ids if eid in allowed_src]
 
     if status in ("open", "closed"):
@@ -176,40 +256,50 @@ async def query(
         else:
             candidate_ids = [eid for eid in candidate_ids if eid not in open_members]
 
-    # Hydrate then filter on severity / time. We pull in chunks so the
-    # mget round-trip stays bounded even when the index is huge.
-    items: List[EarthEvent] = []
+    # Project the head fields, filter on severity / time, pick the page,
+    # then hydrate only that page. Pulled in chunks so each mget round-trip
+    # stays bounded even when the index is huge.
+    heads: List[_EventHead] = []
     severity_floor: Optional[int] = None
     if severity_min:
-        from app.domain.earth_event import SEVERITY_RANK
-
         severity_floor = SEVERITY_RANK.get(severity_min, 0)
 
-    cutoff: Optional[datetime] = None
+    cutoff: Optional[float] = None
     if days is not None and days > 0:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
 
     page_size = 200
     for start in range(0, len(candidate_ids), page_size):
-        chunk = candidate_ids[start : start + page_size]
-        events = await fetch_many(chunk)
-        for ev in events:
-            if severity_floor is not None and ev.severity_rank < severity_floor:
+        for head in await _fetch_heads(candidate_ids[start : start + page_size]):
+            if severity_floor is not None and SEVERITY_RANK.get(head.severity, 0) < severity_floor:
                 continue
-            if cutoff is not None and ev.updated_at < cutoff and ev.started_at < cutoff:
+            if cutoff is not None and head.updated_ts < cutoff and head.started_ts < cutoff:
                 continue
-            items.append(ev)
+            heads.append(head)
 
-    total = len(items)
+    total = len(heads)
     if sort_by == "severity":
-        items.sort(key=lambda e: (e.severity_score, e.updated_at), reverse=True)
+        sort_key = _severity_sort_key
     else:
-        items.sort(key=lambda e: e.updated_at, reverse=True)
-
-    page = items[offset : offset + limit]
+        sort_key = _recent_sort_key
+
+    # Only the first `offset + limit` rows are ever returned, so a bounded
+    # heap selection (O(n log k)) replaces sorting the whole filtered set.
+    # `nlargest` is stable, so ties keep the index order exactly as the
+    # previous full sort did.
+    ranked = heapq.nlargest(max(offset + limit, 0), heads, key=sort_key)
+    page = await fetch_many([head.id for head in ranked[offset:]])
     return {"items": page, "total": total}
 
 
+def _severity_sort_key(head: _EventHead) -> Tuple[float, float]:
+    return (head.severity_score, head.updated_ts)
+
+
+def _recent_sort_key(head: _EventHead) -> float:
+    return head.updated_ts
+
+
 # ---------------------------------------------------------------------------
 # Write
 # ---------------------------------------------------------------------------
@@ -224,58 +314,112 @@ async def upsert(event: EarthEvent) -> Optional[EarthEventDelta]:
         return None
 
     previous = await get(event.id)
-    payload = event.model_dump_json()
-    started_at = event.started_at if event.started_at.tzinfo else event.started_at.replace(tzinfo=timezone.utc)
-    started_score = started_at.timestamp()
-
     pipe = client.pipeline()
-    pipe.set(_event_key(event.id), payload)
-    pipe.zadd(_BY_STARTED, {event.id: started_score})
-    pipe.zadd(_BY_SEVERITY, {event.id: float(event.severity_score)})
+    _queue_upsert(pipe, event, previous)
+    await pipe.execute()
+
+    return _build_delta(previous, event)
+
+
+async def upsert_many(events: Iterable[EarthEvent]) -> List[Tuple[EarthEvent, EarthEventDelta]]:
+    """Batch `upsert`: one MGET for the stored versions, one pipeline for
+    every write — two round-trips for the whole feed instead of two per
+    event. An id repeated within the batch is compared against its earlier
+    occurrence, exactly as sequential upserts would.
+
+    Returns `(event, delta)` pairs so each delta stays tied to the exact
+    event it was built from, even when an id repeats."""
+    events = list(events)
+    if not events:
+        return []
+    try:
+        client = redis_client.get_client()
+    except RuntimeError:
+        return []
+
+    unique_ids = list(dict.fromkeys(ev.id for ev in events))
+    latest: Dict[str, Optional[EarthEvent]] = dict(zip(unique_ids, await get_many(unique_ids)))
+
+    # One clock read per batch: every delta of this pass shares the stamp
+    # instead of each model calling utcnow() through its default factory.
+    computed_at = datetime.utcnow()
+    pipe = client.pipeline(transaction=False)
+    changes: List[Tuple[EarthEvent, EarthEventDelta]] = []
+    for event in events:
+        _queue_upsert(pipe, event, latest[event.id])
+        delta = _build_delta(latest[event.id], event, computed_at=computed_at)
+        latest[event.id] = event
+        if delta is not None:
+            changes.append((event, delta))
+    await pipe.execute()
+    return changes
+
+
+def _queue_upsert(pipe: Any, event: EarthEvent, previous: Optional[EarthEvent] = None) -> None:
+    pipe.set(_event_key(event.id), event.model_dump_json())
+    # Most events come back unchanged every cycle; when nothing indexed moved
+    # the sorted-set / set entries are already right, so only the record
+    # itself (fetched_at bookkeeping) is rewritten.
+    index_fields = _index_fields(event)
+    if previous is not None and _index_fields(previous) == index_fields:
+        return
+    pipe.zadd(_BY_STARTED, {event.id: index_fields[4]})
+    pipe.zadd(_BY_SEVERITY, {event.id: index_fields[3]})
     pipe.sadd(_category_key(event.category), event.id)
     pipe.sadd(_source_key(event.source), event.id)
     if event.status == "open":
         pipe.sadd(_OPEN_SET, event.id)
     else:
         pipe.srem(_OPEN_SET, event.id)
-    await pipe.execute()
-
-    return _build_delta(previous, event)
 
 
-async def upsert_many(events: Iterable[EarthEvent]) -> List[EarthEventDelta]:
-    deltas: List[EarthEventDelta] = []
-    for event in events:
-        delta = await upsert(event)
-        if delta is not None:
-            deltas.append(delta)
-    return deltas
+def _index_fields(event: EarthEvent) -> tuple:
+    """Everything the secondary indexes are keyed on, in comparable form."""
+    started_at = event.started_at if event.started_at.tzinfo else event.started_at.replace(tzinfo=timezone.utc)
+    return (event.category, event.source, event.status, float(event.severity_score), started_at.timestamp())
 
 
 async def remove(event_id: str) -> None:
+    await remove_many([event_id])
+
+
+async def remove_many(event_ids: Sequence[str]) -> None:
+    """Drop events from every index: one MGET (for their category / source
+    sets) and one pipeline, however many ids."""
+    if not event_ids:
+        return
     try:
         client = redis_client.get_client()
     except RuntimeError:
         return
-    record = await get(event_id)
-    pipe = client.pipeline()
-    pipe.delete(_event_key(event_id))
-    pipe.zrem(_BY_STARTED, event_id)
-    pipe.zrem(_BY_SEVERITY, event_id)
-    pipe.srem(_OPEN_SET, event_id)
-    if record is not None:
-        pipe.srem(_category_key(record.category), event_id)
-        pipe.srem(_source_key(record.source), event_id)
+    records = await get_many(event_ids)
+    pipe = client.pipeline(transaction=False)
+    pipe.delete(*[_event_key(eid) for eid in event_ids])
+    pipe.zrem(_BY_STARTED, *event_ids)
+    pipe.zrem(_BY_SEVERITY, *event_ids)
+    pipe.srem(_OPEN_SET, *event_ids)
+    for event_id, record in zip(event_ids, records):
+        if record is not None:
+            pipe.srem(_category_key(record.category), event_id)
+            pipe.srem(_source_key(record.source), event_id)
     await pipe.execute()
 
 
 async def push_alert(alert: EarthEventAlert) -> None:
+    await push_alerts([alert])
+
+
+async def push_alerts(alerts: Sequence[EarthEventAlert]) -> None:
+    """LPUSH every alert in order (the last one ends up at the head, as with
+    repeated `push_alert`) and trim, in one pipeline."""
+    if not alerts:
+        return
     try:
         client = redis_client.get_client()
     except RuntimeError:
         return
     pipe = client.pipeline()
-    pipe.lpush(_ALERT_LIST, alert.model_dump_json())
+    pipe.lpush(_ALERT_LIST, *[alert.model_dump_json() for alert in alerts])
     pipe.ltrim(_ALERT_LIST, 0, _ALERT_MAX - 1)
     await pipe.execute()
 
@@ -303,38 +447,31 @@ async def recent_alerts(limit: int = 25) -> List[EarthEventAlert]:
 async def summary(top_n: int = 5) -> EarthEventSummary:
     """Stats for the dashboard KPI bar.
 
-    Counts are exact — the open-set / category-set scards are O(1) — and
-    `top_active` is the highest-severity-score open events."""
+    `total_open` is the open-set SCARD; the per-category / per-severity /
+    recency counts come from ONE pass over the open events' projected head
+    fields instead of a KEYS sweep plus a SMEMBERS per category and three
+    separate scans. `top_active` is the highest-severity-score open events."""
     try:
         client = redis_client.get_client()
     except RuntimeError:
         return EarthEventSummary()
 
     total = int(await client.scard(_OPEN_SET))
-
-    # Per-category counts (open-only).
-    by_category: Dict[str, int] = {}
-    cat_keys = await client.keys(f"{_BY_CATEGORY}:*")
-    open_members = set(await client.smembers(_OPEN_SET))
-    for ck in cat_keys:
-        members = await client.smembers(ck)
-        cat_open = len(members & open_members)
-        if cat_open > 0:
-            label = ck.rsplit(":", 1)[-1]
-            by_category[label] = cat_open
-
-    # Per-severity counts (full open-set hydration).
-    by_severity: Dict[str, int] = {}
-    open_events = await fetch_many(list(open_members))
+    open_events = await _fetch_heads(list(await client.smembers(_OPEN_SET)))
+
+    now = datetime.now(timezone.utc).timestamp()
+    cutoff_24 = now - 24 * 3600
+    cutoff_7d = now - 7 * 86400
+    by_category: Counter[str] = Counter()
+    by_severity: Counter[str] = Counter()
+    last_24h = last_7d = 0
     for ev in open_events:
-        key = ev.severity.value
-        by_severity[key] = by_severity.get(key, 0) + 1
-
-    now = datetime.now(timezone.utc)
-    cutoff_24 = now - timedelta(hours=24)
-    cutoff_7d = now - timedelta(days=7)
-    last_24h = sum(1 for ev in open_events if ev.updated_at >= cutoff_24)
-    last_7d = sum(1 for ev in open_events if ev.updated_at >= cutoff_7d)
+        by_category[ev.category] += 1
+        by_severity[ev.severity] += 1
+        if ev.updated_ts >= cutoff_7d:
+            last_7d += 1
+            if ev.updated_ts >= cutoff_24:
+                last_24h += 1
 
     top_ids = await client.zrevrange(_BY_SEVERITY, 0, top_n * 4 - 1)
     top_open: List[EarthEvent] = []
@@ -346,8 +483,8 @@ async def summary(top_n: int = 5) -> EarthEventSummary:
 
     return EarthEventSummary(
         total_open=total,
-        by_category=by_category,
-        by_severity=by_severity,
+        by_category=dict(by_category),
+        by_severity=dict(by_severity),
         last_24h=last_24h,
         last_7d=last_7d,
         top_active=top_open,
@@ -362,8 +499,7 @@ async def prune_stale(days: int = EVENT_TTL_DAYS) -> int:
         return 0
     cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
     stale_ids = await client.zrangebyscore(_BY_STARTED, "-inf", cutoff)
-    for eid in stale_ids:
-        await remove(eid)
+    await remove_many(stale_ids)
     return len(stale_ids)
 
 
@@ -386,8 +522,15 @@ async def clear_all() -> int:
 # ---------------------------------------------------------------------------
 
 
-def _build_delta(previous: Optional[EarthEvent], new: EarthEvent) -> Optional[EarthEventDelta]:
+def _build_delta(
+    previous: Optional[EarthEvent],
+    new: EarthEvent,
+    *,
+    computed_at: Optional[datetime] = None,
+) -> Optional[EarthEventDelta]:
     point = new.latest_point
+    if computed_at is None:
+        computed_at = datetime.utcnow()
     if previous is None:
         return EarthEventDelta(
             event_id=new.id,
@@ -401,6 +544,7 @@ def _build_delta(previous: Optional[EarthEvent], new: EarthEvent) -> Optional[Ea
             started_at=new.started_at,
             updated_at=new.updated_at,
             point=point,
+            computed_at=computed_at,
         )
 
     prev_rank = previous.severity_rank
@@ -432,6 +576,7 @@ def _build_delta(previous: Optional[EarthEvent], new: EarthEvent) -> Optional[Ea
         started_at=new.started_at,
         updated_at=new.updated_at,
         point=point,
+        computed_at=computed_at,
     )
 
 
@@ -457,6 +602,7 @@ def build_alert_for_delta(event: EarthEvent, delta: EarthEventDelta) -> Optional
 
 __all__ = [
     "get",
+    "get_many",
     "total_open",
     "list_ids_by_recent",
     "list_ids_by_severity",
@@ -465,7 +611,9 @@ __all__ = [
     "upsert",
     "upsert_many",
     "remove",
+    "remove_many",
     "push_alert",
+    "push_alerts",
     "recent_alerts",
     "summary",
     "prune_stale",
@@ -13,7 +13,7 @@ and are skipped by the scheduler. They never raise.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from app.core.logging import get_logger
 from app.domain.earth_event import (
@@ -38,8 +38,12 @@ log = get_logger(__name__)
 # ---------------------------------------------------------------------------
 
 
-def normalize_eonet_event(raw: Dict[str, Any]) -> Optional[EarthEvent]:
-    """Convert one EONET event dict → `EarthEvent`. Returns None on bad data."""
+def normalize_eonet_event(raw: Dict[str, Any], *, now: Optional[datetime] = None) -> Optional[EarthEvent]:
+    """Convert one EONET event dict → `EarthEvent`. Returns None on bad data.
+
+    `now` (naive UTC) stamps `fetched_at`; batch callers pass one value for
+    the whole feed instead of a clock read per event.
+    """
     if not isinstance(raw, dict):
         return None
     eonet_id = raw.get("id")
@@ -158,6 +162,7 @@ def normalize_eonet_event(raw: Dict[str, Any]) -> Optional[EarthEvent]:
         primary_metric=primary_metric,
         sources=sources,
         raw_categories=raw_codes,
+        fetched_at=now if now is not None else datetime.utcnow(),
     )
 
 
@@ -167,17 +172,7 @@ def normalize_eonet_payload(payload: Dict[str, Any]) -> List[EarthEvent]:
         return []
     if payload.get("_unavailable"):
         return []
-    raw_events = payload.get("events") or []
-    out: List[EarthEvent] = []
-    for r in raw_events:
-        try:
-            ev = normalize_eonet_event(r)
-        except Exception as exc:  # noqa: BLE001
-            log.debug("earth.normalize.eonet.skip", error=str(exc))
-            ev = None
-        if ev is not None:
-            out.append(ev)
-    return out
+    return _normalize_many(payload.get("events") or [], normalize_eonet_event, "eonet")
 
 
 # ---------------------------------------------------------------------------
@@ -185,7 +180,7 @@ def normalize_eonet_payload(payload: Dict[str, Any]) -> List[EarthEvent]:
 # ---------------------------------------------------------------------------
 
 
-def normalize_afad_row(raw: Dict[str, Any]) -> Optional[EarthEvent]:
+def normalize_afad_row(raw: Dict[str, Any], *, now: Optional[datetime] = None) -> Optional[EarthEvent]:
     """One AFAD-normalised row (USGS-shape) → `EarthEvent` under
     category `earthquakes-tr`."""
     if not isinstance(raw, dict):
@@ -207,11 +202,13 @@ def normalize_afad_row(raw: Dict[str, Any]) -> Optional[EarthEvent]:
     if lat == 0 and lon == 0:
         return None
 
+    if now is None:
+        now = datetime.utcnow()
     time_ms = raw.get("time")
     try:
-        ts = datetime.fromtimestamp(int(time_ms) / 1000, tz=timezone.utc) if time_ms else datetime.now(timezone.utc)
+        ts = datetime.fromtimestamp(int(time_ms) / 1000, tz=timezone.utc) if time_ms else now.replace(tzinfo=timezone.utc)
     except (TypeError, ValueError, OSError):
-        ts = datetime.now(timezone.utc)
+        ts = now.replace(tzinfo=timezone.utc)
 
     place = str(raw.get("place") or "Türkiye")
     depth_km = raw.get("depth_km")
@@ -266,20 +263,12 @@ def normalize_afad_row(raw: Dict[str, Any]) -> Optional[EarthEvent]:
             "depth_km": depth_km,
             "place": place,
         },
+        fetched_at=now,
     )
 
 
 def normalize_afad_rows(rows: List[Dict[str, Any]]) -> List[EarthEvent]:
-    out: List[EarthEvent] = []
-    for r in rows or []:
-        try:
-            ev = normalize_afad_row(r)
-        except Exception as exc:  # noqa: BLE001
-            log.debug("earth.normalize.afad.skip", error=str(exc))
-            ev = None
-        if ev is not None:
-            out.append(ev)
-    return out
+    return _normalize_many(rows or [], normalize_afad_row, "afad")
 
 
 # ---------------------------------------------------------------------------
@@ -287,7 +276,7 @@ def normalize_afad_rows(rows: List[Dict[str, Any]]) -> List[EarthEvent]:
 # ---------------------------------------------------------------------------
 
 
-def normalize_usgs_row(raw: Dict[str, Any]) -> Optional[EarthEvent]:
+def normalize_usgs_row(raw: Dict[str, Any], *, now: Optional[datetime] = None) -> Optional[EarthEvent]:
     """One USGS-feed row → unified `EarthEvent` under `earthquakes`.
 
     USGS rows mirror the AFAD shape (id, magnitude, place, time, lat, lon,
@@ -313,11 +302,13 @@ def normalize_usgs_row(raw: Dict[str, Any]) -> Optional[EarthEvent]:
     if lat == 0 and lon == 0:
         return None
 
+    if now is None:
+        now = datetime.utcnow()
     time_ms = raw.get("time")
     try:
-        ts = datetime.fromtimestamp(int(time_ms) / 1000, tz=timezone.utc) if time_ms else datetime.now(timezone.utc)
+        ts = datetime.fromtimestamp(int(time_ms) / 1000, tz=timezone.utc) if time_ms else now.replace(tzinfo=timezone.utc)
     except (TypeError, ValueError, OSError):
-        ts = datetime.now(timezone.utc)
+        ts = now.replace(tzinfo=timezone.utc)
 
     place = str(raw.get("place") or "").strip()
     depth_km = raw.get("depth_km")
@@ -389,27 +380,56 @@ def normalize_usgs_row(raw: Dict[str, Any]) -> Optional[EarthEvent]:
             "tsunami": tsunami,
             "alert": alert,
         },
+        fetched_at=now,
     )
 
 
 def normalize_usgs_rows(rows: List[Dict[str, Any]]) -> List[EarthEvent]:
+    return _normalize_many(rows or [], normalize_usgs_row, "usgs")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _normalize_many(
+    rows: List[Dict[str, Any]],
+    normalize_one: Callable[..., Optional[EarthEvent]],
+    source: str,
+) -> List[EarthEvent]:
+    """Apply `normalize_one` to every row, dropping rows that fail.
+
+    One clock read for the whole batch, shared as every row's `now`.
+
+    Failures are counted and reported in one summary line after the loop
+    rather than logged per row — a malformed feed can carry hundreds of
+    bad rows and per-row logging would dominate the actual parse work.
+    """
     out: List[EarthEvent] = []
-    for r in rows or []:
+    skipped = 0
+    first_error: Optional[str] = None
+    now = datetime.utcnow()
+    for r in rows:
         try:
-            ev = normalize_usgs_row(r)
+            ev = normalize_one(r, now=now)
         except Exception as exc:  # noqa: BLE001
-            log.debug("earth.normalize.usgs.skip", error=str(exc))
-            ev = None
+            skipped += 1
+            if first_error is None:
+                first_error = str(exc)
+            continue
         if ev is not None:
             out.append(ev)
+    if skipped:
+        log.debug(
+            f"earth.normalize.{source}.skip",
+            skipped=skipped,
+            total=len(rows),
+            first_error=first_error,
+        )
     return out
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
 def _parse_iso(value: Any) -> datetime:
     """Parse an ISO-8601 string (with or without `Z` / offset) → aware UTC."""
     if isinstance(value, datetime):
@@ -423,6 +443,27 @@ def _parse_iso(value: Any) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+# category → {lower-cased EONET magnitudeUnit: factor into the unit that
+# category's thresholds use}. Units not listed pass through unchanged
+# (km² for fires, knots for storms, and every other category as-is).
+_UNIT_FACTORS: Dict[str, Dict[str, float]] = {
+    "wildfires": {
+        # EONET commonly emits "acres" for fire area.
+        "acres": 0.00404686,
+        "ac": 0.00404686,
+        "hectares": 0.01,
+        "ha": 0.01,
+    },
+    "severeStorms": {
+        "mph": 0.868976,
+        "kph": 0.539957,
+        "km/h": 0.539957,
+        "m/s": 1.94384,
+        "mps": 1.94384,
+    },
+}
+
+
 def _convert_metric_value(category: str, raw_value: Optional[float], unit: Optional[str]) -> Optional[float]:
     """Convert EONET's heterogeneous magnitudeUnit into the unit our
     category thresholds use. e.g. wildfires sometimes ship 'acres' which
@@ -430,32 +471,12 @@ def _convert_metric_value(category: str, raw_value: Optional[float], unit: Optio
     """
     if raw_value is None:
         return None
-    u = (unit or "").strip().lower()
-
-    if category == "wildfires":
-        # Thresholds in km². EONET commonly emits "acres" for fire area.
-        if u in ("acres", "ac"):
-            return raw_value * 0.00404686  # acres → km²
-        if u in ("hectares", "ha"):
-            return raw_value * 0.01
-        if u in ("km^2", "km2", "sq km", "km²"):
-            return raw_value
-        return raw_value  # unknown unit — treat as already-km² best effort
-
-    if category == "severeStorms":
-        # Thresholds in knots.
-        if u in ("kts", "knots", "kt"):
-            return raw_value
-        if u in ("mph",):
-            return raw_value * 0.868976
-        if u in ("kph", "km/h"):
-            return raw_value * 0.539957
-        if u in ("m/s", "mps"):
-            return raw_value * 1.94384
+    factors = _UNIT_FACTORS.get(category)
+    if factors is None:
+        # Quakes, volcanoes, default — pass through.
         return raw_value
-
-    # Quakes, volcanoes, default — pass through.
-    return raw_value
+    factor = factors.get((unit or "").strip().lower())
+    return raw_value * factor if factor is not None else raw_value
 
 
 __all__ = [
@@ -18,10 +18,11 @@ Redis keys:
 
 from __future__ import annotations
 
-import json
 import time
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from app.core import redis_client
 from app.core.logging import get_logger
 
@@ -50,8 +51,8 @@ async def get(neo_id: str) -> Optional[Dict[str, Any]]:
     if not raw:
         return None
     try:
-        return json.loads(raw)
-    except (ValueError, TypeError):
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return None
 
 
@@ -82,7 +83,7 @@ async def put(
     except RuntimeError:
         return payload  # caller still gets the freshly-generated copy
     try:
-        await client.set(_key(neo_id), json.dumps(payload), ex=ttl_seconds)
+        await client.set(_key(neo_id), orjson.dumps(payload), ex=ttl_seconds)
     except Exception as exc:
         log.warning("explanation_store.put_failed", neo_id=neo_id, error=str(exc))
     return payload
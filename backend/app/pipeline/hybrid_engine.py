@@ -13,8 +13,11 @@ The single entry point is `analyze_target(neo_id, days_ahead=30)` which:
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+from app.core.executor import run_blocking
 from app.core.logging import get_logger
 from app.domain.neo import NormalizedNeo
 from app.domain.risk import HybridAnalysis, MCSummary, RiskClass
@@ -27,6 +30,22 @@ log = get_logger(__name__)
 AU_TO_KM = 149_597_870.7
 LUNAR_DISTANCE_KM = 384_400.0
 
+# The MC term of the hybrid score is zero once p1 is past this distance.
+# Objects whose nominal minimum sits MC_FAR_SIGMAS beyond it get a reduced
+# MC_FAR_SAMPLES run instead of the full sample count.
+MC_SCORE_HORIZON_KM = 10 * LUNAR_DISTANCE_KM
+MC_FAR_SIGMAS = 6.0
+MC_FAR_SAMPLES = 1_000
+
+# Class baseline for the hybrid score, before confidence smoothing.
+_CLASS_BASELINE: Dict[RiskClass, float] = {
+    RiskClass.MINIMAL: 0.05,
+    RiskClass.LOW: 0.20,
+    RiskClass.MODERATE: 0.45,
+    RiskClass.HIGH: 0.70,
+    RiskClass.CRITICAL: 0.90,
+}
+
 
 async def analyze_target(
     neo_id: str,
@@ -48,24 +67,25 @@ async def analyze_target(
         payload = {}
 
     rows = payload.get("_rows") or []
-    distances_km: List[float] = []
-    velocities_kms: List[float] = []
-    for row in rows:
-        delta_au = row.get("delta_au")
-        if isinstance(delta_au, (int, float)):
-            distances_km.append(float(delta_au) * AU_TO_KM)
-        deldot = row.get("deldot_kms")
-        if isinstance(deldot, (int, float)):
-            velocities_kms.append(abs(float(deldot)))
-
-    nominal_min = min(distances_km) if distances_km else None
-    velocity_avg = sum(velocities_kms) / len(velocities_kms) if velocities_kms else None
-    sigma_km = monte_carlo.estimate_sigma_from_series(distances_km) if distances_km else 0.0
-
-    # 2. Monte Carlo
+    delta_au = _column(rows, "delta_au")
+    deldot = _column(rows, "deldot_kms")
+    distances_km = delta_au[~np.isnan(delta_au)] * AU_TO_KM
+    velocities_kms = np.abs(deldot[~np.isnan(deldot)])
+
+    nominal_min = float(distances_km.min()) if distances_km.size else None
+    velocity_avg = float(velocities_kms.mean()) if velocities_kms.size else None
+    sigma_km = monte_carlo.estimate_sigma_from_series(distances_km) if distances_km.size else 0.0
+
+    # 2. Monte Carlo — a (samples × rows) draw is tens of milliseconds of
+    # NumPy; run it on the shared pool so the recompute fan-out's Horizons
+    # and AI requests keep flowing while it computes.
     mc: Optional[MCSummary] = None
-    if distances_km:
-        mc = monte_carlo.run(distances_km, sigma_km=sigma_km, samples=samples)
+    if distances_km.size:
+        if nominal_min is not None and nominal_min - MC_FAR_SIGMAS * sigma_km > MC_SCORE_HORIZON_KM:
+            # p1 can't reach the scoring horizon, so the MC only feeds the
+            # displayed spread — a small sample describes that just as well.
+            samples = min(samples, MC_FAR_SAMPLES)
+        mc = await run_blocking(monte_carlo.run, distances_km, sigma_km=sigma_km, samples=samples)
 
     # 3. Build ML feature row
     moid_au = (nominal_min / AU_TO_KM) if nominal_min is not None else 1.0
@@ -109,6 +129,20 @@ async def analyze_target(
     )
 
 
+def _column(rows: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """Pull one numeric ephemeris column into a float64 array in a single pass.
+
+    Non-numeric / missing cells become NaN so callers can drop them with one
+    mask instead of branching per row.
+    """
+    nan = float("nan")
+    return np.fromiter(
+        (v if isinstance(v := row.get(key), (int, float)) else nan for row in rows),
+        dtype=np.float64,
+        count=len(rows),
+    )
+
+
 def _compose_score(
     *,
     ml_cls: RiskClass,
@@ -117,31 +151,24 @@ def _compose_score(
     diameter_km: float,
     sentry_listed: bool,
 ) -> float:
-    """Combine the signals into a single 0..1 hybrid score."""
-    # Class baseline: minimal=0.05, low=0.20, moderate=0.45, high=0.70, critical=0.90
-    baseline = {
-        RiskClass.MINIMAL: 0.05,
-        RiskClass.LOW: 0.20,
-        RiskClass.MODERATE: 0.45,
-        RiskClass.HIGH: 0.70,
-        RiskClass.CRITICAL: 0.90,
-    }[ml_cls]
+    """Combine the signals into a single 0..1 hybrid score.
 
+    Each term is computed independently and summed once, with a single clamp
+    at the end — the bonuses are additive, so there's no intermediate state.
+    """
     # Confidence smooths the baseline toward the next level (50% confidence = 50% jump)
-    score = baseline * (0.5 + 0.5 * ml_confidence)
+    base = _CLASS_BASELINE[ml_cls] * (0.5 + 0.5 * ml_confidence)
 
     # MC bonus: closer p1 → higher score. Saturates inside lunar distance.
+    mc_bonus = 0.0
     if mc is not None and mc.p1_km > 0:
         if mc.p1_km < LUNAR_DISTANCE_KM:
-            score += 0.12 * (1.0 - mc.p1_km / LUNAR_DISTANCE_KM)
-        elif mc.p1_km < 10 * LUNAR_DISTANCE_KM:
-            score += 0.04 * (1.0 - mc.p1_km / (10 * LUNAR_DISTANCE_KM))
+            mc_bonus = 0.12 * (1.0 - mc.p1_km / LUNAR_DISTANCE_KM)
+        elif mc.p1_km < MC_SCORE_HORIZON_KM:
+            mc_bonus = 0.04 * (1.0 - mc.p1_km / MC_SCORE_HORIZON_KM)
 
     # Diameter bonus: > 140m bumps category-equivalent (PHA threshold)
-    if diameter_km >= 0.14:
-        score += min(0.08, 0.04 * (diameter_km / 0.5))
-
-    if sentry_listed:
-        score += 0.05
+    size_bonus = min(0.08, 0.04 * (diameter_km / 0.5)) if diameter_km >= 0.14 else 0.0
+    sentry_bonus = 0.05 if sentry_listed else 0.0
 
-    return max(0.0, min(1.0, score))
+    return max(0.0, min(1.0, base + mc_bonus + size_bonus + sentry_bonus))
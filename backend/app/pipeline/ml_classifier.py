@@ -12,8 +12,10 @@ The model expects a 7-feature row, in this order:
 from __future__ import annotations
 
 import os
+import threading
+from bisect import bisect_right
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -34,6 +36,25 @@ FEATURE_ORDER = (
     "uncertainty_km",
 )
 
+# Heuristic score bands: a score at or above `_SCORE_EDGES[i]` lands in
+# `_SCORE_CLASSES[i + 1]`. One bisect replaces the if/elif ladder.
+_SCORE_EDGES = (0.25, 0.45, 0.65, 0.85)
+_SCORE_CLASSES = (
+    RiskClass.MINIMAL,
+    RiskClass.LOW,
+    RiskClass.MODERATE,
+    RiskClass.HIGH,
+    RiskClass.CRITICAL,
+)
+
+# Model label -> RiskClass. Unknown labels degrade to MINIMAL rather than
+# raising from the enum constructor inside the predict path.
+_RISK_BY_LABEL: Dict[str, RiskClass] = {cls.value: cls for cls in RiskClass}
+
+
+def _to_risk_class(label: Any) -> RiskClass:
+    return _RISK_BY_LABEL.get(str(label), RiskClass.MINIMAL)
+
 
 class StringClassifierWrapper:
     """Adapter that exposes a sklearn-shaped string-label interface over a
@@ -59,13 +80,27 @@ class StringClassifierWrapper:
 class MLRiskClassifier:
     def __init__(self, model_path: Optional[Path] = None) -> None:
         self._model: Optional[Any] = None
+        # Model capabilities resolved once at load, not probed per prediction.
+        self._predict_proba: Optional[Callable[[np.ndarray], np.ndarray]] = None
+        self._labels: Sequence[RiskClass] = [_to_risk_class(label) for label in RISK_LABELS]
         self._loaded = False
+        # classify() may run on executor threads; the lock makes the first
+        # load happen exactly once, and `_loaded` is only published after it.
+        self._load_lock = threading.Lock()
         self._model_path = Path(model_path) if model_path else _MODEL_PATH
 
-    def _ensure_loaded(self) -> None:
+    def ensure_loaded(self) -> None:
+        """Load the model artifact if not done yet. Blocking (joblib) — call
+        it through `run_blocking` from async code; lifespan does at startup."""
         if self._loaded:
             return
-        self._loaded = True
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._load()
+            self._loaded = True
+
+    def _load(self) -> None:
         if not self._model_path.exists():
             log.info(
                 "ml.classifier.fallback_heuristic",
@@ -77,32 +112,43 @@ class MLRiskClassifier:
             import joblib  # local import: optional dep at runtime
 
             self._model = joblib.load(self._model_path)
+            self._predict_proba = getattr(self._model, "predict_proba", None)
+            self._labels = [_to_risk_class(label) for label in getattr(self._model, "classes_", RISK_LABELS)]
             log.info("ml.classifier.loaded", path=str(self._model_path))
         except Exception as exc:
             log.warning("ml.classifier.load_failed", error=str(exc))
             self._model = None
 
     def classify(self, features: Dict[str, float]) -> Tuple[RiskClass, float]:
-        self._ensure_loaded()
-        vec = np.array([[features.get(name, 0.0) or 0.0 for name in FEATURE_ORDER]])
+        self.ensure_loaded()
 
         if self._model is not None:
             try:
-                if hasattr(self._model, "predict_proba"):
-                    proba = self._model.predict_proba(vec)[0]
+                vec = _feature_row(features)
+                if self._predict_proba is not None:
+                    proba = self._predict_proba(vec)[0]
                     idx = int(np.argmax(proba))
-                    label = self._model.classes_[idx] if hasattr(self._model, "classes_") else RISK_LABELS[idx]
-                    confidence = float(proba[idx])
-                else:
-                    label = str(self._model.predict(vec)[0])
-                    confidence = 0.7
-                return RiskClass(label) if label in RISK_LABELS else RiskClass.MINIMAL, confidence
+                    return self._labels[idx], float(proba[idx])
+                return _to_risk_class(self._model.predict(vec)[0]), 0.7
             except Exception as exc:
                 log.warning("ml.classifier.predict_failed", error=str(exc))
 
         return _heuristic_classify(features)
 
 
+def _feature_row(features: Dict[str, float]) -> np.ndarray:
+    """The (1, 7) model input in `FEATURE_ORDER`, as one float64 array.
+
+    Filled straight into the dtype sklearn validates against, without an
+    intermediate nested list or a per-call dtype cast of the result.
+    """
+    return np.fromiter(
+        (features.get(name, 0.0) or 0.0 for name in FEATURE_ORDER),
+        dtype=np.float64,
+        count=len(FEATURE_ORDER),
+    ).reshape(1, -1)
+
+
 def _heuristic_classify(features: Dict[str, float]) -> Tuple[RiskClass, float]:
     """Conservative rule-based fallback when no trained model is available.
 
@@ -125,16 +171,7 @@ def _heuristic_classify(features: Dict[str, float]) -> Tuple[RiskClass, float]:
     score += _normalize(h_mag, low=18.0, high=27.0, invert=True) * 0.10
     score += _normalize(uncertainty_km, low=0.0, high=moid_lunar_distance) * 0.05
 
-    if score >= 0.85:
-        cls = RiskClass.CRITICAL
-    elif score >= 0.65:
-        cls = RiskClass.HIGH
-    elif score >= 0.45:
-        cls = RiskClass.MODERATE
-    elif score >= 0.25:
-        cls = RiskClass.LOW
-    else:
-        cls = RiskClass.MINIMAL
+    cls = _SCORE_CLASSES[bisect_right(_SCORE_EDGES, score)]
     return cls, float(min(0.95, max(0.4, 0.5 + abs(score - 0.5) * 0.8)))
 
 
@@ -147,12 +184,15 @@ def _normalize(value: float, *, low: float, high: float, invert: bool = False) -
 
 
 _singleton: Optional[MLRiskClassifier] = None
+_singleton_lock = threading.Lock()
 
 
 def get_classifier() -> MLRiskClassifier:
     global _singleton
     if _singleton is None:
-        _singleton = MLRiskClassifier()
+        with _singleton_lock:
+            if _singleton is None:
+                _singleton = MLRiskClassifier()
     return _singleton
 
 
@@ -7,7 +7,8 @@ this module flattens them.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from app.core.logging import get_logger
 from app.domain.neo import NormalizedNeo
@@ -15,8 +16,12 @@ from app.domain.neo import NormalizedNeo
 log = get_logger(__name__)
 
 
-def normalize_neows(raw: Dict[str, Any]) -> Optional[NormalizedNeo]:
-    """Build a NormalizedNeo from a single NeoWs feed/lookup object."""
+def normalize_neows(raw: Dict[str, Any], *, now: Optional[datetime] = None) -> Optional[NormalizedNeo]:
+    """Build a NormalizedNeo from a single NeoWs feed/lookup object.
+
+    `now` (naive UTC) decides which close approach counts as "next"; batch
+    callers pass one value for the whole feed instead of a clock read per NEO.
+    """
     if not isinstance(raw, dict):
         return None
 
@@ -37,8 +42,7 @@ def normalize_neows(raw: Dict[str, Any]) -> Optional[NormalizedNeo]:
         velocity_kms: Optional[float] = None
         orbiting = "Earth"
         if approaches:
-            best = _select_relevant_approach(approaches)
-            next_at = _parse_iso(best.get("close_approach_date_full") or best.get("close_approach_date"))
+            best, next_at = _select_relevant_approach(approaches, now)
             miss_km = _safe_float(((best.get("miss_distance") or {}).get("kilometers")))
             velocity_kms = _safe_float(((best.get("relative_velocity") or {}).get("kilometers_per_second")))
             orbiting = best.get("orbiting_body") or "Earth"
@@ -70,33 +74,40 @@ def merge_sentry_flag(neo: NormalizedNeo, sentry_designations: set[str]) -> Norm
     return neo
 
 
-def _select_relevant_approach(approaches: list) -> Dict[str, Any]:
-    """Pick the next future close approach.
+def _select_relevant_approach(
+    approaches: list, now: Optional[datetime] = None
+) -> Tuple[Dict[str, Any], Optional[datetime]]:
+    """Pick the next future close approach; returns it with its parsed date.
 
     NeoWs returns close approaches in chronological order, oldest first. The
     historical entries (some go back to 1900) are useless for an operational
     dashboard — operators want to know the *next* approach. If no future
     approach is in the dataset, fall back to the most recent past one.
+
+    One pass keeping the earliest future / latest past entry — long-period
+    objects list a couple of hundred approaches, so no lists or sorts.
     """
-    now = datetime.utcnow()
+    if now is None:
+        now = datetime.utcnow()
     earth_only = [a for a in approaches if (a.get("orbiting_body") or "Earth") == "Earth"]
     candidates = earth_only or approaches
 
-    future: list = []
-    past: list = []
+    future: Optional[Tuple[datetime, Dict[str, Any]]] = None
+    past: Optional[Tuple[datetime, Dict[str, Any]]] = None
     for a in candidates:
         when = _parse_iso(a.get("close_approach_date_full") or a.get("close_approach_date"))
         if when is None:
             continue
-        (future if when >= now else past).append((when, a))
+        if when >= now:
+            if future is None or when < future[0]:
+                future = (when, a)
+        elif past is None or when > past[0]:
+            past = (when, a)
 
-    if future:
-        future.sort(key=lambda x: x[0])
-        return future[0][1]
-    if past:
-        past.sort(key=lambda x: x[0], reverse=True)
-        return past[0][1]
-    return candidates[0]
+    best = future or past
+    if best is not None:
+        return best[1], best[0]
+    return candidates[0], None
 
 
 def _safe_float(value: object) -> Optional[float]:
@@ -111,9 +122,18 @@ def _safe_float(value: object) -> Optional[float]:
 def _parse_iso(value: object) -> Optional[datetime]:
     if not value or not isinstance(value, str):
         return None
-    # NeoWs "close_approach_date_full" → "2029-Apr-13 21:46"
-    formats = ["%Y-%b-%d %H:%M", "%Y-%m-%d %H:%M", "%Y-%m-%d"]
-    for fmt in formats:
+    return _parse_approach_date(value)
+
+
+# NeoWs "close_approach_date_full" → "2029-Apr-13 21:46"
+_APPROACH_DATE_FORMATS = ("%Y-%b-%d %H:%M", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+@lru_cache(maxsize=4096)
+def _parse_approach_date(value: str) -> Optional[datetime]:
+    """strptime is slow and every ingest cycle re-reads the same approach
+    tables, so parsed dates are memoised (datetimes are immutable)."""
+    for fmt in _APPROACH_DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt)
         except ValueError:
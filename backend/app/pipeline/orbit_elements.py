@@ -22,9 +22,10 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 GM_SUN_AU3_PER_DAY2 = 0.0002959122082855911  # Gauss gravitational constant²
+_SQRT_GM_SUN = math.sqrt(GM_SUN_AU3_PER_DAY2)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrbitalElements:
     """Heliocentric Keplerian elements for a small body."""
 
@@ -48,7 +49,9 @@ class OrbitalElements:
         """Mean motion."""
         if self.a_au <= 0:
             return 0.0
-        return math.sqrt(GM_SUN_AU3_PER_DAY2 / self.a_au**3)
+        # a^1.5 as a·√a — avoids a general pow() call.
+        a = self.a_au
+        return _SQRT_GM_SUN / (a * math.sqrt(a))
 
     @property
     def period_days(self) -> Optional[float]:
@@ -99,13 +102,21 @@ def from_neows(orbital_data: Dict[str, Any]) -> Optional[OrbitalElements]:
     )
 
 
+# Below this eccentricity the closed-form starter atan2(sin M, cos M − e) is
+# already within O(e²) of the root, so Newton typically finishes in 1–2 steps.
+_LOW_E_STARTER = 0.3
+
+
 def solve_kepler(M: float, e: float, tol: float = 1e-10, max_iter: int = 50) -> float:
     """Solve M = E - e·sin(E) for E (Newton-Raphson).
 
     Stable for e in [0, 0.999].
     """
     M = (M + math.pi) % (2 * math.pi) - math.pi  # wrap to [-π, π]
-    E = M if e < 0.8 else math.pi
+    if e < _LOW_E_STARTER:
+        E = math.atan2(math.sin(M), math.cos(M) - e)
+    else:
+        E = M if e < 0.8 else math.pi
     for _ in range(max_iter):
         f = E - e * math.sin(E) - M
         fp = 1 - e * math.cos(E)
@@ -116,6 +127,27 @@ def solve_kepler(M: float, e: float, tol: float = 1e-10, max_iter: int = 50) ->
     return E
 
 
+def solve_kepler_array(M: np.ndarray, e: float, tol: float = 1e-10, max_iter: int = 50) -> np.ndarray:
+    """Vectorized `solve_kepler` over an array of mean anomalies.
+
+    Same starters and Newton update, applied to the whole array per step;
+    iteration stops once every element has converged.
+    """
+    M = (np.asarray(M, dtype=float) + math.pi) % (2 * math.pi) - math.pi
+    if e < _LOW_E_STARTER:
+        E = np.arctan2(np.sin(M), np.cos(M) - e)
+    elif e < 0.8:
+        E = M.copy()
+    else:
+        E = np.full_like(M, math.pi)
+    for _ in range(max_iter):
+        dE = -(E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+        E += dE
+        if not E.size or float(np.max(np.abs(dE))) < tol:
+            break
+    return E
+
+
 def state_at(elements: OrbitalElements, jd: float) -> Dict[str, np.ndarray]:
     """Heliocentric ecliptic Cartesian position + velocity at Julian Day `jd`.
 
@@ -154,29 +186,16 @@ def sample_orbit(
 
     Returns a list of [x, y, z] AU triples — useful for drawing the orbit line.
     """
-    pts: List[List[float]] = []
-    cosi = math.cos(elements.i_rad)
-    sini = math.sin(elements.i_rad)
-    cosO = math.cos(elements.omega_rad)
-    sinO = math.sin(elements.omega_rad)
-    cosw = math.cos(elements.arg_peri_rad)
-    sinw = math.sin(elements.arg_peri_rad)
-    R = np.array(
-        [
-            [cosO * cosw - sinO * sinw * cosi, -cosO * sinw - sinO * cosw * cosi, sinO * sini],
-            [sinO * cosw + cosO * sinw * cosi, -sinO * sinw + cosO * cosw * cosi, -cosO * sini],
-            [sinw * sini, cosw * sini, cosi],
-        ]
-    )
-
-    for k in range(points + 1):  # close the loop with extra point
-        M = (k / points) * 2 * math.pi
-        E = solve_kepler(M, elements.e)
-        x_p = elements.a_au * (math.cos(E) - elements.e)
-        y_p = elements.a_au * math.sqrt(max(0.0, 1 - elements.e**2)) * math.sin(E)
-        r = R @ np.array([x_p, y_p, 0.0])
-        pts.append([float(r[0]), float(r[1]), float(r[2])])
-    return pts
+    R = _rotation(elements.omega_rad, elements.i_rad, elements.arg_peri_rad)
+    # Close the loop with an extra point at M = 2π.
+    M = np.arange(points + 1) * (2 * math.pi / points)
+    E = solve_kepler_array(M, elements.e)
+    a = elements.a_au
+    e = elements.e
+    perifocal = np.zeros((points + 1, 3))
+    perifocal[:, 0] = a * (np.cos(E) - e)
+    perifocal[:, 1] = a * math.sqrt(max(0.0, 1 - e * e)) * np.sin(E)
+    return (perifocal @ R.T).tolist()
 
 
 def _rotation(omega: float, i: float, arg_peri: float) -> np.ndarray:
@@ -28,7 +28,7 @@ from typing import List, Tuple
 
 import numpy as np
 
-from app.pipeline.orbit_elements import GM_SUN_AU3_PER_DAY2, OrbitalElements, solve_kepler
+from app.pipeline.orbit_elements import GM_SUN_AU3_PER_DAY2, OrbitalElements, _rotation, solve_kepler
 
 # Planet GM (= G·M / GM_sun · GM_sun_au_day_units)
 PLANETS_GM = {
@@ -79,7 +79,31 @@ PLANET_ELEMENTS = {
 }
 
 
-@dataclass(frozen=True)
+# Perturber order for the stacked arrays used by `acceleration`. The
+# perifocal → ecliptic rotation of each planet only depends on its fixed
+# elements, so it is built once here rather than on every evaluation.
+_PERTURBERS = tuple(PLANETS_GM)
+_PERTURBER_GM = np.array([PLANETS_GM[name] for name in _PERTURBERS])
+_PLANET_ROTATION = {
+    name: _rotation(elem.omega_rad, elem.i_rad, elem.arg_peri_rad) for name, elem in PLANET_ELEMENTS.items()
+}
+
+
+def _perturber_kernel_row(name: str) -> Tuple[float, ...]:
+    elem = PLANET_ELEMENTS[name]
+    R = _PLANET_ROTATION[name]
+    b = elem.a_au * math.sqrt(max(0.0, 1 - elem.e * elem.e))
+    # z_p is always 0, so only the first two rotation columns are needed.
+    return (elem.M0_rad, elem.n_rad_per_day, elem.epoch_jd, elem.e, elem.a_au, b, *R[:, 0].tolist(), *R[:, 1].tolist())
+
+
+# Per-perturber (M0, n, epoch, e, a, b, first rotation column, second
+# rotation column) as plain floats, for the scalar kernel in
+# `_perturber_positions`.
+_PERTURBER_KERNEL = tuple(_perturber_kernel_row(name) for name in _PERTURBERS)
+
+
+@dataclass(frozen=True, slots=True)
 class TrajectorySample:
     jd: float
     r_au: List[float]  # [x, y, z]
@@ -95,20 +119,24 @@ def planet_position(name: str, jd: float) -> np.ndarray:
     e = elem.e
     x_p = a * (math.cos(E) - e)
     y_p = a * math.sqrt(max(0.0, 1 - e * e)) * math.sin(E)
-    cosO = math.cos(elem.omega_rad)
-    sinO = math.sin(elem.omega_rad)
-    cosi = math.cos(elem.i_rad)
-    sini = math.sin(elem.i_rad)
-    cosw = math.cos(elem.arg_peri_rad)
-    sinw = math.sin(elem.arg_peri_rad)
-    R = np.array(
-        [
-            [cosO * cosw - sinO * sinw * cosi, -cosO * sinw - sinO * cosw * cosi, sinO * sini],
-            [sinO * cosw + cosO * sinw * cosi, -sinO * sinw + cosO * cosw * cosi, -cosO * sini],
-            [sinw * sini, cosw * sini, cosi],
-        ]
-    )
-    return R @ np.array([x_p, y_p, 0.0])
+    return _PLANET_ROTATION[name] @ np.array([x_p, y_p, 0.0])
+
+
+def _perturber_positions(jd: float) -> np.ndarray:
+    """(len(_PERTURBERS), 3) heliocentric positions of every perturber at `jd`.
+
+    Same maths as `planet_position`, but with the per-planet constants
+    pre-unpacked and the rotation written out in plain floats. This runs
+    four times per RK4 step, and at four bodies NumPy's per-call overhead
+    costs more than the arithmetic, so only the result becomes one array.
+    """
+    rows = []
+    for M0, n, epoch, e, a, b, px, py, pz, qx, qy, qz in _PERTURBER_KERNEL:
+        E = solve_kepler(M0 + n * (jd - epoch), e)
+        x_p = a * (math.cos(E) - e)
+        y_p = b * math.sin(E)
+        rows.append((px * x_p + qx * y_p, py * x_p + qy * y_p, pz * x_p + qz * y_p))
+    return np.array(rows)
 
 
 def acceleration(r: np.ndarray, jd: float) -> np.ndarray:
@@ -121,16 +149,18 @@ def acceleration(r: np.ndarray, jd: float) -> np.ndarray:
         return np.zeros(3)
     a = -GM_SUN_AU3_PER_DAY2 * r / r_norm**3
 
-    # Planetary perturbations
-    for name, gm in PLANETS_GM.items():
-        rp = planet_position(name, jd)
-        d = r - rp
-        d_norm = float(np.linalg.norm(d))
-        rp_norm = float(np.linalg.norm(rp))
-        if d_norm < 1e-9 or rp_norm < 1e-9:
-            continue
-        # Direct + indirect terms (heliocentric formulation)
-        a -= gm * (d / d_norm**3 + rp / rp_norm**3)
+    # Planetary perturbations — body→planet offsets for every perturber in
+    # one broadcast (n_planets × 3) instead of a Python loop per planet.
+    rp = _perturber_positions(jd)
+    d = r - rp
+    d_norm = np.linalg.norm(d, axis=1)
+    rp_norm = np.linalg.norm(rp, axis=1)
+    gm = _PERTURBER_GM
+    ok = (d_norm >= 1e-9) & (rp_norm >= 1e-9)
+    if not ok.all():
+        gm, d, rp, d_norm, rp_norm = gm[ok], d[ok], rp[ok], d_norm[ok], rp_norm[ok]
+    # Direct + indirect terms (heliocentric formulation)
+    a -= (gm[:, None] * (d / d_norm[:, None] ** 3 + rp / rp_norm[:, None] ** 3)).sum(axis=0)
     return a
 
 
@@ -12,7 +12,7 @@ from __future__ import annotations
 import time
 import uuid
 from datetime import datetime
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from app.core import redis_client
 from app.core.logging import get_logger
@@ -59,10 +59,53 @@ async def upsert(record: RiskRecord) -> Optional[RiskDelta]:
     return _build_delta(previous, record)
 
 
-async def upsert_many(records: Iterable[RiskRecord]) -> List[RiskDelta]:
-    deltas: List[RiskDelta] = []
+async def get_many(neo_ids: List[str]) -> List[Optional[RiskRecord]]:
+    """Fetch several records in one MGET; missing / unparseable ids map to None."""
+    if not neo_ids:
+        return []
+    raws = await redis_client.get_client().mget(*[_record_key(nid) for nid in neo_ids])
+    out: List[Optional[RiskRecord]] = []
+    for neo_id, raw in zip(neo_ids, raws):
+        if raw is None:
+            out.append(None)
+            continue
+        try:
+            out.append(RiskRecord.model_validate_json(raw))
+        except Exception as exc:
+            log.warning("risk_store.parse_failed", neo_id=neo_id, error=str(exc))
+            out.append(None)
+    return out
+
+
+async def upsert_many(
+    records: Iterable[RiskRecord],
+    *,
+    previous: Optional[Sequence[Optional[RiskRecord]]] = None,
+) -> List[RiskDelta]:
+    """Batch `upsert`: one MGET for the previous records, one pipeline for
+    every write — two round-trips total instead of two per record.
+
+    Callers that already hold the stored versions (aligned with `records`)
+    pass them as `previous` and skip the MGET."""
+    records = list(records)
+    if not records:
+        return []
+    client = redis_client.get_client()
+    if previous is None:
+        previous = await get_many([r.neo_id for r in records])
+
+    now = time.time()
+    pipe = client.pipeline()
     for record in records:
-        delta = await upsert(record)
+        pipe.set(_record_key(record.neo_id), record.model_dump_json())
+    pipe.zadd(_BY_SCORE_KEY, {r.neo_id: float(r.hybrid_score) for r in records})
+    pipe.zadd(_BY_RECOMPUTE_KEY, {r.neo_id: now for r in records})
+    await pipe.execute()
+
+    deltas: List[RiskDelta] = []
+    computed_at = datetime.utcnow()
+    for prev, record in zip(previous, records):
+        delta = _build_delta(prev, record, computed_at)
         if delta is not None:
             deltas.append(delta)
     return deltas
@@ -78,12 +121,27 @@ async def remove(neo_id: str) -> None:
 
 
 async def top_n_by_score(n: int = 50) -> List[RiskRecord]:
-    client = redis_client.get_client()
-    neo_ids = await client.zrevrange(_BY_SCORE_KEY, 0, n - 1)
-    if not neo_ids:
-        return []
-    keys = [_record_key(nid) for nid in neo_ids]
-    raws = await client.mget(*keys)
+    raws = await redis_client.get_client().sort(_BY_SCORE_KEY, **_top_n_sort_args(n))
+    return _decode_records(raws)
+
+
+async def top_n_with_total(n: int = 50) -> Tuple[List[RiskRecord], int]:
+    """`top_n_by_score` + `total` in a single pipelined round-trip."""
+    pipe = redis_client.get_client().pipeline(transaction=False)
+    pipe.sort(_BY_SCORE_KEY, **_top_n_sort_args(n))
+    pipe.zcard(_BY_SCORE_KEY)
+    raws, count = await pipe.execute()
+    return _decode_records(raws), int(count)
+
+
+def _top_n_sort_args(n: int) -> dict:
+    # SORT BY nosort on a ZSET keeps score order; GET dereferences each
+    # member's record key server-side, so rank + fetch is one command
+    # instead of ZREVRANGE followed by MGET.
+    return {"by": "nosort", "get": f"{_RECORD_KEY}:*", "desc": True, "start": 0, "num": n}
+
+
+def _decode_records(raws: Iterable[Optional[str]]) -> List[RiskRecord]:
     out: List[RiskRecord] = []
     for raw in raws:
         if raw is None:
@@ -127,7 +185,13 @@ async def recent_alerts(limit: int = 50) -> List[ThreatAlert]:
     return out
 
 
-def _build_delta(previous: Optional[RiskRecord], new: RiskRecord) -> Optional[RiskDelta]:
+def _build_delta(
+    previous: Optional[RiskRecord],
+    new: RiskRecord,
+    computed_at: Optional[datetime] = None,
+) -> Optional[RiskDelta]:
+    if computed_at is None:
+        computed_at = datetime.utcnow()
     if previous is None:
         return RiskDelta(
             neo_id=new.neo_id,
@@ -137,7 +201,7 @@ def _build_delta(previous: Optional[RiskRecord], new: RiskRecord) -> Optional[Ri
             previous_score=None,
             new_score=new.hybrid_score,
             direction="new",
-            computed_at=datetime.utcnow(),
+            computed_at=computed_at,
         )
 
     if previous.risk_class == new.risk_class and abs(previous.hybrid_score - new.hybrid_score) < 0.02:
@@ -158,7 +222,7 @@ def _build_delta(previous: Optional[RiskRecord], new: RiskRecord) -> Optional[Ri
         previous_score=previous.hybrid_score,
         new_score=new.hybrid_score,
         direction=direction,
-        computed_at=datetime.utcnow(),
+        computed_at=computed_at,
     )
 
 
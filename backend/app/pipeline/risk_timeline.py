@@ -16,7 +16,7 @@ Why Redis (not TimescaleDB)?
 from __future__ import annotations
 
 import time
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -55,8 +55,9 @@ async def append(record: RiskRecord, retention_seconds: int = _DEFAULT_RETENTION
     except RuntimeError:
         return
 
+    now = time.time()
     sample = TimelineSample(
-        ts=time.time(),
+        ts=now,
         risk_class=record.risk_class,
         hybrid_score=record.hybrid_score,
         ml_confidence=record.ml_confidence,
@@ -65,7 +66,7 @@ async def append(record: RiskRecord, retention_seconds: int = _DEFAULT_RETENTION
     )
     payload = sample.model_dump_json()
 
-    cutoff = time.time() - retention_seconds
+    cutoff = now - retention_seconds
     pipe = client.pipeline()
     pipe.zadd(_key(record.neo_id), {payload: sample.ts})
     pipe.zremrangebyscore(_key(record.neo_id), "-inf", cutoff)
@@ -75,6 +76,36 @@ async def append(record: RiskRecord, retention_seconds: int = _DEFAULT_RETENTION
         log.warning("timeline.append_failed", neo_id=record.neo_id, error=str(exc))
 
 
+async def append_many(records: Iterable[RiskRecord], retention_seconds: int = _DEFAULT_RETENTION_SECONDS) -> None:
+    """`append` for a batch of records, sent as a single pipeline."""
+    records = list(records)
+    if not records:
+        return
+    try:
+        client = redis_client.get_client()
+    except RuntimeError:
+        return
+
+    now = time.time()
+    cutoff = now - retention_seconds
+    pipe = client.pipeline()
+    for record in records:
+        sample = TimelineSample(
+            ts=now,
+            risk_class=record.risk_class,
+            hybrid_score=record.hybrid_score,
+            ml_confidence=record.ml_confidence,
+            miss_distance_km=record.miss_distance_km,
+            geo_distance_au=record.geo_distance_au,
+        )
+        pipe.zadd(_key(record.neo_id), {sample.model_dump_json(): sample.ts})
+        pipe.zremrangebyscore(_key(record.neo_id), "-inf", cutoff)
+    try:
+        await pipe.execute()
+    except Exception as exc:
+        log.warning("timeline.append_many_failed", count=len(records), error=str(exc))
+
+
 async def fetch(neo_id: str, days: int = 30, limit: int = 720) -> TimelineSeries:
     """Fetch up to `limit` samples for `neo_id` over the last `days`.
 
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import random
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -46,12 +47,18 @@ from app.ws.manager import manager as ws_manager
 
 log = get_logger(__name__)
 
+# Floor between live-count pushes so a reconnect storm yields one update, not hundreds.
+_LIVE_COUNT_MIN_INTERVAL = 1.0
+# Heartbeat push when the count has not changed.
+_LIVE_COUNT_HEARTBEAT = 30.0
+
 
 class AutonomousLoop:
     def __init__(self) -> None:
         self._task: Optional[asyncio.Task] = None
         self._live_task: Optional[asyncio.Task] = None
         self._earth_task: Optional[asyncio.Task] = None
+        self._manual_task: Optional[asyncio.Task] = None
         self._stop_event: Optional[asyncio.Event] = None
         self._cycle_count = 0
         self._earth_cycle_count = 0
@@ -103,8 +110,26 @@ class AutonomousLoop:
             except asyncio.TimeoutError:
                 self._earth_task.cancel()
             self._earth_task = None
+        if self._manual_task:
+            try:
+                await asyncio.wait_for(self._manual_task, timeout=15)
+            except asyncio.TimeoutError:
+                pass  # wait_for already cancelled it
+            self._manual_task = None
         log.info("scheduler.stopped")
 
+    def trigger_cycle(self) -> bool:
+        """Kick off one out-of-band ingest cycle (manual refresh).
+
+        The task is kept on the loop so it can't be garbage-collected
+        mid-flight and is awaited on `stop()`. Returns False when a manual
+        cycle is already running — repeated clicks coalesce into that one.
+        """
+        if self._manual_task is not None and not self._manual_task.done():
+            return False
+        self._manual_task = asyncio.create_task(self._safe_cycle(), name="cliff-manual-cycle")
+        return True
+
     async def _earth_loop(self) -> None:
         """Independent ingest loop for unified Earth events.
 
@@ -136,75 +161,48 @@ class AutonomousLoop:
 
     async def _earth_cycle(self, *, initial: bool) -> None:
         started = datetime.now(timezone.utc)
+        started_mono = time.monotonic()
         self._earth_cycle_count += 1
         log.info("scheduler.earth.start", cycle=self._earth_cycle_count, initial=initial)
 
-        # 1. EONET — global natural events.
-        eonet_events: list = []
-        try:
-            payload = await eonet.get_events(
-                days=settings.EARTH_REFRESH_DAYS,
-                status="all",
-                limit=400,
-            )
-            eonet_events = earth_normalizer.normalize_eonet_payload(payload)
-        except Exception as exc:  # noqa: BLE001
-            log.warning("scheduler.earth.eonet_failed", error=str(exc))
+        # 1–3. EONET, AFAD and USGS are independent upstreams — fetch them
+        # concurrently so the cycle waits for the slowest, not the sum.
+        eonet_events, afad_events, usgs_events = await asyncio.gather(
+            self._fetch_eonet_events(),
+            self._fetch_afad_events(),
+            self._fetch_usgs_events(),
+        )
 
-        # 2. AFAD — Türkiye earthquakes.
-        afad_events: list = []
-        try:
-            rows = await afad.get_recent_earthquakes(
-                min_magnitude=2.0,
-                hours=settings.EARTH_AFAD_WINDOW_HOURS,
-                limit=200,
-            )
-            afad_events = earth_normalizer.normalize_afad_rows(rows)
-        except Exception as exc:  # noqa: BLE001
-            log.warning("scheduler.earth.afad_failed", error=str(exc))
+        all_events = eonet_events + afad_events + usgs_events
 
-        # 3. USGS — global earthquakes (M4.5+ last 7 days).
-        usgs_events: list = []
+        # 4. Upsert + collect deltas + alerts — one batched write for the
+        # whole merged feed instead of a read + pipeline per event.
+        # A failed batch falls back to per-event upserts so one bad event
+        # only costs its own delta, not the whole cycle's.
         try:
-            rows = await usgs.get_recent_earthquakes(min_magnitude=4.5, window="week")
-            usgs_events = earth_normalizer.normalize_usgs_rows(rows)
+            changes = await earth_event_store.upsert_many(all_events)
         except Exception as exc:  # noqa: BLE001
-            log.warning("scheduler.earth.usgs_failed", error=str(exc))
-
-        all_events = eonet_events + afad_events + usgs_events
-
-        # 3. Upsert + collect deltas + alerts.
-        deltas = []
+            log.warning("scheduler.earth.upsert_batch_failed", events=len(all_events), error=str(exc))
+            changes = await self._upsert_events_one_by_one(all_events)
+        deltas = [delta for _event, delta in changes]
         alerts = []
-        for event in all_events:
-            try:
-                delta = await earth_event_store.upsert(event)
-            except Exception as exc:  # noqa: BLE001
-                log.warning(
-                    "scheduler.earth.upsert_failed",
-                    event_id=event.id,
-                    error=str(exc),
-                )
-                continue
-            if delta is None:
-                continue
-            deltas.append(delta)
+        for event, delta in changes:
             alert = earth_event_store.build_alert_for_delta(event, delta)
             if alert is not None:
                 alerts.append(alert)
-                try:
-                    await earth_event_store.push_alert(alert)
-                except Exception:
-                    pass
+        try:
+            await earth_event_store.push_alerts(alerts)
+        except Exception:
+            pass
 
-        # 4. Periodic prune so the indexes don't grow forever.
+        # 5. Periodic prune so the indexes don't grow forever.
         if initial or self._earth_cycle_count % 20 == 0:
             try:
                 await earth_event_store.prune_stale()
             except Exception as exc:  # noqa: BLE001
                 log.warning("scheduler.earth.prune_failed", error=str(exc))
 
-        # 5. Broadcast.
+        # 6. Broadcast.
         if deltas:
             try:
                 await ws_manager.broadcast(
@@ -231,31 +229,96 @@ class AutonomousLoop:
             usgs=len(usgs_events),
             deltas=len(deltas),
             alerts=len(alerts),
-            duration_ms=int((datetime.now(timezone.utc) - started).total_seconds() * 1000),
+            duration_ms=int((time.monotonic() - started_mono) * 1000),
         )
 
-    async def _live_count_loop(self) -> None:
-        """Broadcast live WebSocket connection count every 30 s on the
-        `analytics_updates` channel. Cheap — single integer + JSON encode.
-        Failures are swallowed so an admin-feed glitch can't crash ingest."""
-        assert self._stop_event is not None
-        while not self._stop_event.is_set():
+    async def _upsert_events_one_by_one(self, events: list) -> list:
+        """Per-event fallback for `upsert_many`: failures are isolated."""
+        changes = []
+        for event in events:
             try:
-                from app.ws.events import LiveCountEvent
-                from app.ws.manager import get_manager
-
-                wsmgr = get_manager()
-                count = wsmgr.current_active_count()
-                event = LiveCountEvent(count=count)
-                await wsmgr.broadcast("analytics_updates", event)
-            except Exception as exc:
-                log.warning("live_count.broadcast_failed", error=str(exc))
-            try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=30.0)
-            except asyncio.TimeoutError:
+                delta = await earth_event_store.upsert(event)
+            except Exception as exc:  # noqa: BLE001
+                log.warning("scheduler.earth.upsert_failed", event_id=event.id, error=str(exc))
                 continue
-            else:
-                break
+            if delta is not None:
+                changes.append((event, delta))
+        return changes
+
+    async def _fetch_eonet_events(self) -> list:
+        """EONET — global natural events."""
+        try:
+            payload = await eonet.get_events(
+                days=settings.EARTH_REFRESH_DAYS,
+                status="all",
+                limit=400,
+            )
+            return earth_normalizer.normalize_eonet_payload(payload)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("scheduler.earth.eonet_failed", error=str(exc))
+            return []
+
+    async def _fetch_afad_events(self) -> list:
+        """AFAD — Türkiye earthquakes."""
+        try:
+            rows = await afad.get_recent_earthquakes(
+                min_magnitude=2.0,
+                hours=settings.EARTH_AFAD_WINDOW_HOURS,
+                limit=200,
+            )
+            return earth_normalizer.normalize_afad_rows(rows)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("scheduler.earth.afad_failed", error=str(exc))
+            return []
+
+    async def _fetch_usgs_events(self) -> list:
+        """USGS — global earthquakes (M4.5+ last 7 days)."""
+        try:
+            rows = await usgs.get_recent_earthquakes(min_magnitude=4.5, window="week")
+            return earth_normalizer.normalize_usgs_rows(rows)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("scheduler.earth.usgs_failed", error=str(exc))
+            return []
+
+    async def _live_count_loop(self) -> None:
+        """Broadcast the live WebSocket connection count on the
+        `analytics_updates` channel whenever it changes, plus a periodic
+        heartbeat (`_LIVE_COUNT_HEARTBEAT`) so a freshly opened admin tile
+        fills in. Bursts of connects/disconnects coalesce into one push per
+        `_LIVE_COUNT_MIN_INTERVAL`. Failures are swallowed so an admin-feed
+        glitch can't crash ingest."""
+        assert self._stop_event is not None
+        from app.ws.events import LiveCountEvent
+        from app.ws.manager import get_manager
+
+        wsmgr = get_manager()
+        stopped = asyncio.create_task(self._stop_event.wait())
+        # One change-waiter lives across heartbeat ticks and is only replaced
+        # after it fires — an idle feed doesn't spawn and cancel a task every
+        # 30 s.
+        changed: Optional[asyncio.Task] = None
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    event = LiveCountEvent(count=wsmgr.current_active_count())
+                    await wsmgr.broadcast("analytics_updates", event)
+                except Exception as exc:
+                    log.warning("live_count.broadcast_failed", error=str(exc))
+
+                if changed is None:
+                    changed = asyncio.create_task(wsmgr.wait_count_changed())
+                done, _ = await asyncio.wait(
+                    {stopped, changed}, timeout=_LIVE_COUNT_HEARTBEAT, return_when=asyncio.FIRST_COMPLETED
+                )
+                if stopped in done:
+                    break
+                if changed in done:
+                    changed = None
+                    await asyncio.wait({stopped}, timeout=_LIVE_COUNT_MIN_INTERVAL)
+        finally:
+            stopped.cancel()
+            if changed is not None:
+                changed.cancel()
 
     @property
     def cycle_count(self) -> int:
@@ -295,14 +358,17 @@ class AutonomousLoop:
 
     async def _cycle(self, *, initial: bool) -> None:
         started = datetime.now(timezone.utc)
+        started_mono = time.monotonic()
         self._cycle_count += 1
         log.info("scheduler.cycle.start", cycle=self._cycle_count, initial=initial)
 
-        # 1. Ingest NeoWs feed — wider window on first boot, then incremental.
-        feed_result = await self._ingest_feed(deep=initial)
-
-        # 2. Sentry overlay.
-        sentry_designations = await self._fetch_sentry_designations()
+        # 1. Ingest NeoWs feed (wider window on first boot, then incremental)
+        # and 2. fetch the Sentry overlay — independent upstreams, so overlap
+        # them. Both swallow their own fetch failures.
+        feed_result, sentry_designations = await asyncio.gather(
+            self._ingest_feed(deep=initial),
+            self._fetch_sentry_designations(),
+        )
 
         # 3. Recompute risk for stale records (or all on first cycle).
         recompute_count, deltas, alerts = await self._recompute_top_n(
@@ -338,7 +404,7 @@ class AutonomousLoop:
             recomputed=recompute_count,
             deltas=len(deltas),
             alerts=len(alerts),
-            duration_ms=int((datetime.now(timezone.utc) - started).total_seconds() * 1000),
+            duration_ms=int((time.monotonic() - started_mono) * 1000),
         )
 
     # ----- helpers -----
@@ -367,36 +433,41 @@ class AutonomousLoop:
         # De-dup by neo_id — wider windows can cross-list the same NEO.
         seen: set[str] = set()
         normalized: List[NormalizedNeo] = []
+        now = datetime.utcnow()  # one clock read for the whole feed
         for raw in raws:
             neo_id = str(raw.get("id") or raw.get("neo_reference_id") or "")
             if not neo_id or neo_id in seen:
                 continue
             seen.add(neo_id)
-            n = normalizer.normalize_neows(raw)
+            n = normalizer.normalize_neows(raw, now=now)
             if n is not None:
                 normalized.append(n)
 
-        new_count = 0
-        for n in normalized:
-            existing = await risk_store.get(n.neo_id)
-            if existing is None:
-                # Seed a placeholder MINIMAL record so it appears in the watchlist
-                # before the first hybrid analysis runs.
-                placeholder = RiskRecord(
-                    neo_id=n.neo_id,
-                    designation=n.designation,
-                    name=n.name,
-                    risk_class=RiskClass.MINIMAL,
-                    hybrid_score=0.0,
-                    diameter_max_km=n.diameter_max_km,
-                    next_approach_at=n.next_approach_at,
-                    miss_distance_km=n.miss_distance_km,
-                    relative_velocity_kms=n.relative_velocity_kms,
-                    is_potentially_hazardous=n.is_potentially_hazardous,
-                    sentry_listed=n.sentry_listed,
-                )
-                await risk_store.upsert(placeholder)
-                new_count += 1
+        # One MGET for the whole feed, one pipeline for the new placeholders —
+        # not a GET + write per NEO.
+        existing = await risk_store.get_many([n.neo_id for n in normalized])
+        # Seed a placeholder MINIMAL record for each unseen NEO so it appears
+        # in the watchlist before the first hybrid analysis runs.
+        placeholders = [
+            RiskRecord(
+                neo_id=n.neo_id,
+                designation=n.designation,
+                name=n.name,
+                risk_class=RiskClass.MINIMAL,
+                hybrid_score=0.0,
+                diameter_max_km=n.diameter_max_km,
+                next_approach_at=n.next_approach_at,
+                miss_distance_km=n.miss_distance_km,
+                relative_velocity_kms=n.relative_velocity_kms,
+                is_potentially_hazardous=n.is_potentially_hazardous,
+                sentry_listed=n.sentry_listed,
+            )
+            for n, record in zip(normalized, existing)
+            if record is None
+        ]
+        # Placeholders are exactly the ids the MGET above found missing.
+        await risk_store.upsert_many(placeholders, previous=[None] * len(placeholders))
+        new_count = len(placeholders)
 
         return {"fetched": len(raws), "new": new_count}
 
@@ -430,42 +501,72 @@ class AutonomousLoop:
         if not neo_ids:
             return 0, [], []
 
-        deltas: List[RiskDelta] = []
-        alerts: List[ThreatAlert] = []
-        recompute_count = 0
+        # Fetch + analyze concurrently (each target is an independent NeoWs
+        # round-trip plus Horizons/Monte Carlo), bounded so a 200-entry
+        # watchlist doesn't fire 200 upstream calls at once. Persistence below
+        # keeps watchlist order. A TaskGroup rather than a bare gather: if the
+        # cycle is cancelled (shutdown) or a task fails outside
+        # `_analyze_one`'s own handling, the remaining fetches are cancelled
+        # instead of left running detached.
+        slots = asyncio.Semaphore(settings.RECOMPUTE_CONCURRENCY)
+        # One clock read + one Earth ephemeris for the whole batch.
+        epoch = self._position_epoch()
+
+        async def _analyze_bounded(neo_id: str):
+            async with slots:
+                return await self._analyze_one(neo_id, sentry_designations, epoch)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_analyze_bounded(neo_id)) for neo_id in neo_ids]
+        results = [task.result() for task in tasks]
+
+        records = [
+            self._build_record(neo, analysis, helio_pos, geo_dist)
+            for neo, analysis, helio_pos, geo_dist in (r for r in results if r is not None)
+        ]
+        if not records:
+            return 0, [], []
 
-        for neo_id in neo_ids:
-            try:
-                raw_neo = await neows.get_neo(neo_id)
-                neo: Optional[NormalizedNeo] = None
-                if raw_neo is not None:
-                    n = normalizer.normalize_neows(raw_neo)
-                    if n is not None:
-                        neo = normalizer.merge_sentry_flag(n, sentry_designations)
-                analysis: HybridAnalysis = await hybrid_engine.analyze_target(
-                    neo_id=neo_id,
-                    days_ahead=30,
-                    neo=neo,
-                )
-                helio_pos, geo_dist = self._compute_position(raw_neo)
-            except Exception as exc:
-                log.warning("scheduler.recompute_failed", neo_id=neo_id, error=str(exc))
-                continue
+        # One MGET + one pipeline for the whole batch instead of several
+        # round-trips per record.
+        deltas: List[RiskDelta] = await risk_store.upsert_many(records)
+        await risk_timeline.append_many(records)
 
-            record = self._build_record(neo, analysis, helio_pos, geo_dist)
-            previous = await risk_store.get(neo_id)
-            delta = await risk_store.upsert(record)
-            await risk_timeline.append(record)
-            recompute_count += 1
+        # Brand-new records produce "new" deltas, which never alert; only
+        # upward transitions on known records do.
+        by_id = {r.neo_id: r for r in records}
+        alerts: List[ThreatAlert] = []
+        for delta in deltas:
+            alert = risk_store.build_alert_for_delta(by_id[delta.neo_id], delta)
+            if alert is not None:
+                alerts.append(alert)
 
-            if delta is not None:
-                deltas.append(delta)
-                if previous is not None:
-                    alert = risk_store.build_alert_for_delta(record, delta)
-                    if alert is not None:
-                        alerts.append(alert)
+        return len(records), deltas, alerts
 
-        return recompute_count, deltas, alerts
+    async def _analyze_one(
+        self,
+        neo_id: str,
+        sentry_designations: set[str],
+        epoch: Optional[tuple[float, Any]] = None,
+    ) -> Optional[tuple[Optional[NormalizedNeo], HybridAnalysis, Optional[list[float]], Optional[float]]]:
+        """Fetch, normalize and analyze one target. Returns None on failure."""
+        try:
+            raw_neo = await neows.get_neo(neo_id)
+            neo: Optional[NormalizedNeo] = None
+            if raw_neo is not None:
+                n = normalizer.normalize_neows(raw_neo)
+                if n is not None:
+                    neo = normalizer.merge_sentry_flag(n, sentry_designations)
+            analysis: HybridAnalysis = await hybrid_engine.analyze_target(
+                neo_id=neo_id,
+                days_ahead=30,
+                neo=neo,
+            )
+            helio_pos, geo_dist = self._compute_position(raw_neo, epoch)
+        except Exception as exc:
+            log.warning("scheduler.recompute_failed", neo_id=neo_id, error=str(exc))
+            return None
+        return neo, analysis, helio_pos, geo_dist
 
     async def _build_normalized_neo(self, neo_id: str, sentry_designations: set[str]) -> Optional[NormalizedNeo]:
         raw = await neows.get_neo(neo_id)
@@ -476,11 +577,26 @@ class AutonomousLoop:
             return None
         return normalizer.merge_sentry_flag(n, sentry_designations)
 
+    def _position_epoch(self) -> Optional[tuple[float, Any]]:
+        """(Julian Day now, Earth heliocentric position) — shared by every
+        target in a recompute batch. None if the ephemeris can't be built."""
+        try:
+            from app.pipeline import orbit_elements as oe
+            from app.pipeline.propagator import planet_position
+
+            jd = oe.jd_now()
+            return jd, planet_position("earth", jd)
+        except Exception as exc:
+            log.warning("scheduler.position_epoch_failed", error=str(exc))
+            return None
+
     def _compute_position(
         self,
         raw_neo: Optional[dict],
+        epoch: Optional[tuple[float, Any]] = None,
     ) -> tuple[Optional[list[float]], Optional[float]]:
-        """Heliocentric position (AU) + Earth-distance (AU) at current time.
+        """Heliocentric position (AU) + Earth-distance (AU) at `epoch`
+        (from `_position_epoch`; current time when omitted).
 
         Returns (None, None) if `orbital_data` missing or invalid.
         """
@@ -489,20 +605,22 @@ class AutonomousLoop:
         orbital_data = raw_neo.get("orbital_data") if isinstance(raw_neo, dict) else None
         if not orbital_data:
             return None, None
+        if epoch is None:
+            epoch = self._position_epoch()
+            if epoch is None:
+                return None, None
 
         try:
             import numpy as np
 
             from app.pipeline import orbit_elements as oe
-            from app.pipeline.propagator import planet_position
 
             elem = oe.from_neows(orbital_data)
             if elem is None:
                 return None, None
-            jd = oe.jd_now()
+            jd, r_earth = epoch
             state = oe.state_at(elem, jd)
             r_helio = state["r"]  # numpy array
-            r_earth = planet_position("earth", jd)
             geo = float(np.linalg.norm(r_helio - r_earth))
             return [float(c) for c in r_helio], geo
         except Exception as exc:
@@ -11,9 +11,11 @@ HTTP 503 with code FIRMS_NOT_CONFIGURED (mirrors the AI endpoint behavior).
 from __future__ import annotations
 
 import csv
+import heapq
 from datetime import datetime, timezone
+from functools import lru_cache
 from io import StringIO
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import httpx
 
@@ -105,45 +107,66 @@ async def get_active_fires(
     rows = await cache.get_or_fetch(cache_key, CACHE_TTL_SECONDS, loader)
     if not isinstance(rows, list):
         return []
-    rows.sort(key=lambda r: r.get("acq_at") or 0, reverse=True)
-    return rows[:limit]
+    # The world feed runs to tens of thousands of detections but at most
+    # `limit` are returned: a bounded heap selection (O(n log limit)) picks
+    # them without sorting the whole decoded list on every request.
+    # `nlargest` is stable, so ties keep the feed order as the full sort did.
+    return heapq.nlargest(limit, rows, key=_acq_sort_key)
+
+
+def _acq_sort_key(row: Dict[str, Any]) -> int:
+    return row.get("acq_at") or 0
 
 
 def _parse_csv(text: str, source: str) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
     if not text or "Invalid" in text[:200]:
         return out
-    reader = csv.DictReader(StringIO(text))
+    reader = csv.reader(StringIO(text))
+    header = next(reader, None)
+    if not header:
+        return out
+
+    # Resolve column positions once from the header; the world feed runs to
+    # tens of thousands of rows, so per-row DictReader dicts + key lookups
+    # dominate the parse otherwise.
+    columns = {name: i for i, name in enumerate(header)}
+    idx_lat = columns.get("latitude")
+    idx_lon = columns.get("longitude")
+    # MODIS uses 'brightness'; VIIRS uses 'bright_ti4'
+    # (either may be present but empty on a row — fall back per cell).
+    idx_bright = columns.get("brightness")
+    idx_bright_ti4 = columns.get("bright_ti4")
+    idx_frp = columns.get("frp")
+    idx_date = columns.get("acq_date")
+    idx_time = columns.get("acq_time")
+    idx_conf = columns.get("confidence")
+    idx_sat = columns.get("satellite")
+    idx_instr = columns.get("instrument")
+    idx_dn = columns.get("daynight")
+
+    def cell(row: List[str], idx: Optional[int]) -> str:
+        return row[idx] if idx is not None and idx < len(row) else ""
+
     for row in reader:
+        # csv.reader yields [] for a blank line (DictReader skipped these).
+        if not row:
+            continue
         try:
-            lat = float(row.get("latitude") or 0)
-            lon = float(row.get("longitude") or 0)
-        except (TypeError, ValueError):
+            lat = float(cell(row, idx_lat) or 0)
+            lon = float(cell(row, idx_lon) or 0)
+        except ValueError:
             continue
-        # MODIS uses 'brightness'; VIIRS uses 'bright_ti4'
-        brightness_raw = row.get("brightness") or row.get("bright_ti4") or "0"
         try:
-            brightness = float(brightness_raw)
+            brightness = float(cell(row, idx_bright) or cell(row, idx_bright_ti4) or 0)
         except ValueError:
             brightness = 0.0
         try:
-            frp = float(row.get("frp") or 0)
+            frp = float(cell(row, idx_frp) or 0)
         except ValueError:
             frp = 0.0
 
-        acq_date = row.get("acq_date") or ""
-        acq_time = row.get("acq_time") or "0000"
-        # acq_time is e.g. "1234" → 12:34 UTC
-        time_padded = str(acq_time).zfill(4)
-        epoch_ms = 0
-        try:
-            dt = datetime.strptime(
-                f"{acq_date} {time_padded[:2]}:{time_padded[2:4]}",
-                "%Y-%m-%d %H:%M",
-            ).replace(tzinfo=timezone.utc)
-            epoch_ms = int(dt.timestamp() * 1000)
-        except ValueError:
-            pass
+        epoch_ms = _acq_epoch_ms(cell(row, idx_date), cell(row, idx_time))
 
         out.append(
             {
@@ -151,12 +174,32 @@ def _parse_csv(text: str, source: str) -> List[Dict[str, Any]]:
                 "lon": lon,
                 "brightness_k": brightness,
                 "frp": frp,
-                "confidence": row.get("confidence") or "",
+                "confidence": cell(row, idx_conf),
                 "acq_at": epoch_ms,
-                "satellite": row.get("satellite") or "",
-                "instrument": row.get("instrument") or "",
-                "daynight": row.get("daynight") or "",
+                "satellite": cell(row, idx_sat),
+                "instrument": cell(row, idx_instr),
+                "daynight": cell(row, idx_dn),
                 "source": source,
             }
         )
     return out
+
+
+@lru_cache(maxsize=4096)
+def _acq_epoch_ms(acq_date: str, acq_time: str) -> int:
+    """(acq_date, acq_time) → epoch ms (UTC), 0 if unparseable.
+
+    Detections are stamped per satellite scan, so even the world feed's
+    tens of thousands of rows share a few hundred distinct pairs — each
+    one goes through `strptime` once per process instead of once per row.
+    """
+    # acq_time is e.g. "1234" → 12:34 UTC
+    time_padded = (acq_time or "0000").zfill(4)
+    try:
+        dt = datetime.strptime(
+            f"{acq_date} {time_padded[:2]}:{time_padded[2:4]}",
+            "%Y-%m-%d %H:%M",
+        ).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return 0
+    return int(dt.timestamp() * 1000)
@@ -16,21 +16,27 @@ Algoritma:
 
 from __future__ import annotations
 
+import hashlib
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Tuple
 
 import httpx
+import numpy as np
 from sgp4.api import Satrec, jday
 
+from app.core.executor import run_blocking
 from app.core.logging import get_logger
-from app.nasa import cache
+from app.nasa import cache, http
 
 log = get_logger(__name__)
 
 CACHE_TTL_SECONDS = 6 * 60 * 60  # 6 saat
 TLE_CACHE_TTL = 24 * 60 * 60  # 24 saat
+TLE_MISS_TTL = 5 * 60  # 5 dk — başarısız TLE çekimi (negatif cache)
+TLE_CACHE_KEY = "iss:tle"
+TLE_MISS_KEY = "iss:tle:miss"
 HTTP_TIMEOUT = 12.0
 TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=TLE"
 
@@ -43,8 +49,12 @@ TURKISH_CITIES = [
     ("Antalya", 36.8841, 30.7056),
 ]
 
+# Sabit ekliptik eğikliği (J2000) — her adımda yeniden hesaplanmasın.
+_OBLIQUITY_SIN = math.sin(math.radians(23.439))
+_OBLIQUITY_COS = math.cos(math.radians(23.439))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class IssPass:
     city: str
     starts_at: str  # ISO 8601 UTC
@@ -65,12 +75,20 @@ class IssPass:
 
 
 async def _fetch_tle() -> Optional[Tuple[str, str]]:
-    """CelesTrak'tan ISS TLE çek, (line1, line2) döndür. 24h cache."""
-    cached = await cache.get_or_fetch(
-        "iss:tle",
-        TLE_CACHE_TTL,
-        _tle_loader,
-    )
+    """CelesTrak'tan ISS TLE çek, (line1, line2) döndür. 24h cache.
+
+    Başarısız çekim `TLE_MISS_TTL` boyunca hatırlanır: CelesTrak kesintisinde
+    her /iss isteği `HTTP_TIMEOUT` beklemesin.
+    """
+    cached = await cache.get(TLE_CACHE_KEY)
+    if cached is None:
+        if await cache.get(TLE_MISS_KEY):
+            return None
+        cached = await _tle_loader()
+        if cached is None:
+            await cache.set(TLE_MISS_KEY, True, TLE_MISS_TTL)
+            return None
+        await cache.set(TLE_CACHE_KEY, cached, TLE_CACHE_TTL)
     if isinstance(cached, list) and len(cached) == 2:
         return cached[0], cached[1]
     return None
@@ -78,12 +96,13 @@ async def _fetch_tle() -> Optional[Tuple[str, str]]:
 
 async def _tle_loader() -> Optional[List[str]]:
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            response = await client.get(
-                TLE_URL,
-                headers={"User-Agent": "CLIFF/2.0 (+https://notcome.app)"},
-            )
-            response.raise_for_status()
+        client = await http.get_client()
+        response = await client.get(
+            TLE_URL,
+            headers={"User-Agent": "CLIFF/2.0 (+https://notcome.app)"},
+            timeout=HTTP_TIMEOUT,
+        )
+        response.raise_for_status()
         text = response.text.strip()
         lines = [ln for ln in text.splitlines() if ln.strip()]
         # CelesTrak: name, line1, line2 (3 satır)
@@ -117,43 +136,67 @@ def _ecef_to_geodetic(x: float, y: float, z: float) -> Tuple[float, float, float
     return math.degrees(lat), math.degrees(lon), alt
 
 
-def _eci_to_topocentric(
-    sat_xyz: Tuple[float, float, float],
-    obs_lat_deg: float,
-    obs_lng_deg: float,
-    jd_ut1: float,
-) -> Tuple[float, float, float]:
-    """Uydunun TEME ECI konumunu observer için (azimuth, elevation, range_km) döndür.
+def _eci_to_ecef(sat_xyz: np.ndarray, jd_ut1: np.ndarray) -> np.ndarray:
+    """TEME ECI konumlarını (N, 3) ECEF'e çevir — Greenwich Sidereal Time rotasyonu.
 
-    Greenwich Sidereal Time → ECEF rotation → topocentric ENU.
+    Gözlemciden bağımsız; tüm şehirler aynı sonucu paylaşır.
     """
     # GMST (Meeus, basit)
     t = (jd_ut1 - 2451545.0) / 36525.0
     gmst_deg = (280.46061837 + 360.98564736629 * (jd_ut1 - 2451545.0) + 0.000387933 * t * t - (t * t * t) / 38710000.0) % 360.0
-    gmst_rad = math.radians(gmst_deg)
+    gmst_rad = np.radians(gmst_deg)
 
     # ECI → ECEF (Z ekseni etrafında -GMST rotasyonu)
-    cos_g = math.cos(gmst_rad)
-    sin_g = math.sin(gmst_rad)
-    x_e = sat_xyz[0] * cos_g + sat_xyz[1] * sin_g
-    y_e = -sat_xyz[0] * sin_g + sat_xyz[1] * cos_g
-    z_e = sat_xyz[2]
+    cos_g = np.cos(gmst_rad)
+    sin_g = np.sin(gmst_rad)
+    ecef = np.empty_like(sat_xyz)
+    ecef[:, 0] = sat_xyz[:, 0] * cos_g + sat_xyz[:, 1] * sin_g
+    ecef[:, 1] = -sat_xyz[:, 0] * sin_g + sat_xyz[:, 1] * cos_g
+    ecef[:, 2] = sat_xyz[:, 2]
+    return ecef
 
-    # Observer ECEF
-    obs_lat = math.radians(obs_lat_deg)
-    obs_lng = math.radians(obs_lng_deg)
+
+def _observer_ecef(obs_lat: float, obs_lng: float) -> Tuple[float, float, float]:
+    """Gözlemcinin WGS84 ECEF konumu (km); enlem/boylam radyan."""
     a = 6378.137
     f = 1 / 298.257223563
     e2 = 2 * f - f * f
     n_radius = a / math.sqrt(1 - e2 * math.sin(obs_lat) ** 2)
-    obs_x = n_radius * math.cos(obs_lat) * math.cos(obs_lng)
-    obs_y = n_radius * math.cos(obs_lat) * math.sin(obs_lng)
-    obs_z = (n_radius * (1 - e2)) * math.sin(obs_lat)
+    return (
+        n_radius * math.cos(obs_lat) * math.cos(obs_lng),
+        n_radius * math.cos(obs_lat) * math.sin(obs_lng),
+        (n_radius * (1 - e2)) * math.sin(obs_lat),
+    )
+
+
+def _above_horizon(ecef: np.ndarray, obs_lat_deg: float, obs_lng_deg: float) -> np.ndarray:
+    """Uydu gözlemcinin yerel ufuk düzleminin üstünde mi (elevation > 0)?
+
+    `_ecef_to_topocentric`'teki "up" bileşeninin işareti — tek matris-vektör
+    çarpımı, trig yok; pahalı dönüşümden önce ucuz ön eleme için.
+    """
+    obs_lat = math.radians(obs_lat_deg)
+    obs_lng = math.radians(obs_lng_deg)
+    up_dir = np.array(
+        [math.cos(obs_lat) * math.cos(obs_lng), math.cos(obs_lat) * math.sin(obs_lng), math.sin(obs_lat)]
+    )
+    return ecef @ up_dir > float(np.dot(_observer_ecef(obs_lat, obs_lng), up_dir))
+
+
+def _ecef_to_topocentric(
+    ecef: np.ndarray,
+    obs_lat_deg: float,
+    obs_lng_deg: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Uydunun ECEF konumlarını observer için (azimuth, elevation, range_km) dizilerine çevir (ENU)."""
+    obs_lat = math.radians(obs_lat_deg)
+    obs_lng = math.radians(obs_lng_deg)
+    obs_x, obs_y, obs_z = _observer_ecef(obs_lat, obs_lng)
 
     # Range vector (ECEF)
-    rx = x_e - obs_x
-    ry = y_e - obs_y
-    rz = z_e - obs_z
+    rx = ecef[:, 0] - obs_x
+    ry = ecef[:, 1] - obs_y
+    rz = ecef[:, 2] - obs_z
 
     # ECEF → ENU (East-North-Up)
     sin_lat = math.sin(obs_lat)
@@ -164,148 +207,222 @@ def _eci_to_topocentric(
     north = -sin_lat * cos_lng * rx - sin_lat * sin_lng * ry + cos_lat * rz
     up = cos_lat * cos_lng * rx + cos_lat * sin_lng * ry + sin_lat * rz
 
-    range_km = math.sqrt(rx * rx + ry * ry + rz * rz)
-    elevation = math.degrees(math.asin(up / range_km)) if range_km > 0 else 0.0
-    azimuth = (math.degrees(math.atan2(east, north)) + 360.0) % 360.0
+    range_km = np.sqrt(rx * rx + ry * ry + rz * rz)
+    sin_el = np.divide(up, range_km, out=np.zeros_like(up), where=range_km > 0)
+    elevation = np.degrees(np.arcsin(sin_el))
+    azimuth = (np.degrees(np.arctan2(east, north)) + 360.0) % 360.0
     return azimuth, elevation, range_km
 
 
-def _sun_elevation(obs_lat_deg: float, obs_lng_deg: float, jd: float) -> float:
-    """Güneşin observer için yüksekliği (yaklaşık, ±0.5°)."""
+def _sun_longitude(jd: np.ndarray) -> np.ndarray:
+    """Güneşin görünür ekliptik boylamı λ (radyan) — yükseklik ve aydınlatma bunu paylaşır."""
     n = jd - 2451545.0
-    L = math.radians((280.460 + 0.9856474 * n) % 360.0)
-    g = math.radians((357.528 + 0.9856003 * n) % 360.0)
-    lam = L + math.radians(1.915) * math.sin(g) + math.radians(0.020) * math.sin(2 * g)
-    eps = math.radians(23.439 - 0.0000004 * n)
-    ra = math.atan2(math.cos(eps) * math.sin(lam), math.cos(lam))
-    dec = math.asin(math.sin(eps) * math.sin(lam))
+    L = np.radians((280.460 + 0.9856474 * n) % 360.0)
+    g = np.radians((357.528 + 0.9856003 * n) % 360.0)
+    return L + math.radians(1.915) * np.sin(g) + math.radians(0.020) * np.sin(2 * g)
+
+
+@dataclass(frozen=True, slots=True)
+class _SunTrack:
+    """Güneşin gözlemciden bağımsız ekvatoral konumu (zaman dizisi boyunca)."""
+
+    gmst_deg: np.ndarray
+    ra: np.ndarray
+    sin_dec: np.ndarray
+    cos_dec: np.ndarray
+
+    def take(self, idx: np.ndarray) -> "_SunTrack":
+        """Yalnızca `idx` adımlarını içeren alt iz."""
+        return _SunTrack(self.gmst_deg[idx], self.ra[idx], self.sin_dec[idx], self.cos_dec[idx])
+
+
+def _sun_track(jd: np.ndarray, lam: np.ndarray) -> _SunTrack:
+    n = jd - 2451545.0
+    eps = np.radians(23.439 - 0.0000004 * n)
+    sin_lam = np.sin(lam)
+    ra = np.arctan2(np.cos(eps) * sin_lam, np.cos(lam))
+    dec = np.arcsin(np.sin(eps) * sin_lam)
     # GMST
     t = n / 36525.0
     gmst = (280.46061837 + 360.98564736629 * n + 0.000387933 * t * t) % 360.0
-    lst = math.radians((gmst + obs_lng_deg) % 360.0)
-    h = lst - ra
+    return _SunTrack(gmst_deg=gmst, ra=ra, sin_dec=np.sin(dec), cos_dec=np.cos(dec))
+
+
+def _sun_elevation(obs_lat_deg: float, obs_lng_deg: float, sun: _SunTrack) -> np.ndarray:
+    """Güneşin observer için yüksekliği (yaklaşık, ±0.5°), zaman dizisi boyunca."""
+    lst = np.radians((sun.gmst_deg + obs_lng_deg) % 360.0)
+    h = lst - sun.ra
     obs_lat = math.radians(obs_lat_deg)
-    elev = math.asin(math.sin(obs_lat) * math.sin(dec) + math.cos(obs_lat) * math.cos(dec) * math.cos(h))
-    return math.degrees(elev)
+    elev = np.arcsin(math.sin(obs_lat) * sun.sin_dec + math.cos(obs_lat) * sun.cos_dec * np.cos(h))
+    return np.degrees(elev)
 
 
-def _is_satellite_illuminated(
-    sat_xyz: Tuple[float, float, float],
-    jd: float,
-) -> bool:
-    """Uydu Dünya umbrası dışında mı (Güneş ışığında mı)? Basit yaklaşım."""
-    # Sun ECI vector (yaklaşık)
-    n = jd - 2451545.0
-    L = math.radians((280.460 + 0.9856474 * n) % 360.0)
-    g = math.radians((357.528 + 0.9856003 * n) % 360.0)
-    lam = L + math.radians(1.915) * math.sin(g) + math.radians(0.020) * math.sin(2 * g)
-    R_au = 1.00014 - 0.01671 * math.cos(g) - 0.00014 * math.cos(2 * g)
-    sun_dist_km = R_au * 149_597_870.7
-    sun_x = sun_dist_km * math.cos(lam)
-    sun_y = sun_dist_km * math.sin(lam) * math.cos(math.radians(23.439))
-    sun_z = sun_dist_km * math.sin(lam) * math.sin(math.radians(23.439))
+def _is_satellite_illuminated(sat_xyz: np.ndarray, lam: np.ndarray) -> np.ndarray:
+    """Uydu Dünya umbrası dışında mı (Güneş ışığında mı)? Basit yaklaşım, adım başına bool."""
+    # Güneş yön birim vektörü (ECI); açı için mesafe sadeleşir, R_au gerekmez.
+    sin_lam = np.sin(lam)
+    sun_x = np.cos(lam)
+    sun_y = sin_lam * _OBLIQUITY_COS
+    sun_z = sin_lam * _OBLIQUITY_SIN
 
     # Uydunun Güneş'e açısı
-    sat_dot_sun = sat_xyz[0] * sun_x + sat_xyz[1] * sun_y + sat_xyz[2] * sun_z
-    sat_mag = math.sqrt(sum(s * s for s in sat_xyz))
-    cos_angle = sat_dot_sun / (sat_mag * sun_dist_km)
-    angle = math.degrees(math.acos(max(-1.0, min(1.0, cos_angle))))
+    sat_dot_sun = sat_xyz[:, 0] * sun_x + sat_xyz[:, 1] * sun_y + sat_xyz[:, 2] * sun_z
+    sat_mag = np.sqrt(np.einsum("ij,ij->i", sat_xyz, sat_xyz))
+    cos_angle = sat_dot_sun / sat_mag
+    angle = np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
     # Earth radius / sat altitude → umbra cone yarı-açısı ≈ 18° (basit yaklaşım)
     # Sat-Sun açısı > 100° → umbra olası
     return angle < 102.0
 
 
+_COMPASS_POINTS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
 def _bearing_to_compass(deg: float) -> str:
-    dirs = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-    return dirs[int(((deg + 22.5) % 360) // 45)]
+    return _COMPASS_POINTS[int(((deg + 22.5) % 360) // 45)]
 
 
-def _compute_passes_for_city(
+@dataclass(frozen=True, slots=True)
+class _PassGrid:
+    """Şehirden bağımsız tarama ızgarası: SGP4, ECEF, Güneş ve aydınlatma bir kez."""
+
+    now: datetime
+    offsets_s: np.ndarray  # geçerli (SGP4 hatasız) adımların `now`'dan saniye ofseti
+    ecef: np.ndarray  # (N, 3) km
+    sun: _SunTrack
+    illuminated: np.ndarray
+
+
+def _build_pass_grid(
     line1: str,
     line2: str,
-    city: str,
-    lat: float,
-    lng: float,
-    hours_ahead: int = 48,
+    hours_ahead: float = 48,
     step_seconds: int = 30,
-) -> List[IssPass]:
+    now: Optional[datetime] = None,
+) -> _PassGrid:
     sat = Satrec.twoline2rv(line1, line2)
-    now = datetime.now(timezone.utc)
-    end = now + timedelta(hours=hours_ahead)
+    now = now or datetime.now(timezone.utc)
+    steps = math.ceil(hours_ahead * 3600 / step_seconds)
+    offsets_s = np.arange(steps, dtype=np.float64) * step_seconds
+
+    # Tüm ızgara tek SGP4 çağrısı + dizi aritmetiği; adım başına Python döngüsü yok.
+    jd0, fr0 = jday(now.year, now.month, now.day, now.hour, now.minute, now.second + now.microsecond / 1e6)
+    jd = np.full(steps, jd0)
+    fr = fr0 + offsets_s / 86400.0
+    err, r, _ = sat.sgp4_array(jd, fr)
+
+    # SGP4 hatalı adımlar atlanır (geçiş durumu değişmez) — sadece geçerli adımlar üzerinde çalış.
+    ok = np.flatnonzero(err == 0)
+    r = r[ok]
+    jd_full = jd[ok] + fr[ok]
+    lam = _sun_longitude(jd_full)
+    return _PassGrid(
+        now=now,
+        offsets_s=offsets_s[ok],
+        ecef=_eci_to_ecef(r, jd_full),
+        sun=_sun_track(jd_full, lam),
+        illuminated=_is_satellite_illuminated(r, lam),
+    )
+
+
+def _passes_from_grid(grid: _PassGrid, city: str, lat: float, lng: float) -> List[IssPass]:
+    # Ucuz ön eleme: uydu karanlıktaysa ya da ufkun altındaysa (adımların
+    # büyük çoğunluğu) zaten görünmez. arcsin/arctan2 ve Güneş yüksekliği
+    # yalnızca kalan aday adımlar için hesaplanır; sonuç tam ızgarayla aynı.
+    n = grid.offsets_s.size
+    cand = np.flatnonzero(grid.illuminated & _above_horizon(grid.ecef, lat, lng))
+    az = np.zeros(n)
+    el = np.full(n, -90.0)
+    visible = np.zeros(n, dtype=bool)
+    if cand.size:
+        az[cand], el[cand], _rng = _ecef_to_topocentric(grid.ecef[cand], lat, lng)
+        sun_el = _sun_elevation(lat, lng, grid.sun.take(cand))
+        visible[cand] = (el[cand] > 10.0) & (sun_el < -6.0)
+
+    # Görünür blokların [başlangıç, bitiş) sınırları; pencere sonunda kapanmayan geçiş sayılmaz.
+    edges = np.diff(visible.astype(np.int8), prepend=np.int8(0))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
 
     passes: List[IssPass] = []
-    in_pass = False
-    pass_start: Optional[datetime] = None
-    pass_max_el = 0.0
-    pass_start_az = 0.0
-    pass_end_az = 0.0
-
-    t = now
-    while t < end:
-        jd, fr = jday(t.year, t.month, t.day, t.hour, t.minute, t.second + t.microsecond / 1e6)
-        e, r, _ = sat.sgp4(jd, fr)
-        if e == 0:
-            jd_full = jd + fr
-            az, el, _rng = _eci_to_topocentric((r[0], r[1], r[2]), lat, lng, jd_full)
-            sun_el = _sun_elevation(lat, lng, jd_full)
-            illuminated = _is_satellite_illuminated((r[0], r[1], r[2]), jd_full)
-            visible = el > 10.0 and sun_el < -6.0 and illuminated
-
-            if visible and not in_pass:
-                in_pass = True
-                pass_start = t
-                pass_max_el = el
-                pass_start_az = az
-                pass_end_az = az
-            elif visible and in_pass:
-                if el > pass_max_el:
-                    pass_max_el = el
-                pass_end_az = az
-            elif not visible and in_pass:
-                in_pass = False
-                if pass_start and pass_max_el >= 15:
-                    duration_s = (t - pass_start).total_seconds()
-                    if duration_s >= 60:  # min 1 dk
-                        passes.append(
-                            IssPass(
-                                city=city,
-                                starts_at=pass_start.isoformat(),
-                                duration_min=int(round(duration_s / 60)),
-                                max_elevation_deg=int(round(pass_max_el)),
-                                appears_dir=_bearing_to_compass(pass_start_az),
-                                disappears_dir=_bearing_to_compass(pass_end_az),
-                            )
-                        )
-
-        t += timedelta(seconds=step_seconds)
+    for first, stop in zip(run_starts, run_ends):
+        pass_max_el = float(el[first:stop].max())
+        if pass_max_el < 15:
+            continue
+        duration_s = float(grid.offsets_s[stop] - grid.offsets_s[first])
+        if duration_s < 60:  # min 1 dk
+            continue
+        passes.append(
+            IssPass(
+                city=city,
+                starts_at=(grid.now + timedelta(seconds=float(grid.offsets_s[first]))).isoformat(),
+                duration_min=int(round(duration_s / 60)),
+                max_elevation_deg=int(round(pass_max_el)),
+                appears_dir=_bearing_to_compass(float(az[first])),
+                disappears_dir=_bearing_to_compass(float(az[stop - 1])),
+            )
+        )
 
     return passes
 
 
+def _compute_passes_for_city(
+    line1: str,
+    line2: str,
+    city: str,
+    lat: float,
+    lng: float,
+    hours_ahead: float = 48,
+    step_seconds: int = 30,
+    now: Optional[datetime] = None,
+) -> List[IssPass]:
+    grid = _build_pass_grid(line1, line2, hours_ahead, step_seconds, now)
+    return _passes_from_grid(grid, city, lat, lng)
+
+
 async def get_passes(limit: int = 10) -> List[dict]:
     """Tüm Türk şehirleri için 48 saatlik geçiş taraması (lokal SGP4 hesap)."""
-    cache_key = f"iss:tr-passes:sgp4:{limit}"
+    tle = await _fetch_tle()
+    if not tle:
+        log.warning("iss.tle.unavailable")
+        return []
+    line1, line2 = tle
+    # Anahtar `limit` değil TLE içeriği: farklı limitli istekler aynı tam
+    # listeyi paylaşır, yeni TLE gelince anahtar kendiliğinden değişir.
+    cache_key = f"iss:tr-passes:sgp4:{_tle_digest(line1, line2)}"
 
     async def loader() -> List[dict]:
         log.info("iss.sgp4.start", cities=len(TURKISH_CITIES))
-        tle = await _fetch_tle()
-        if not tle:
-            log.warning("iss.tle.unavailable")
-            return []
-        line1, line2 = tle
-
-        # Hesap CPU-bound; thread pool'da yapacak değiliz, basit serial.
-        all_passes: List[IssPass] = []
-        for city, lat, lng in TURKISH_CITIES:
-            try:
-                ps = _compute_passes_for_city(line1, line2, city, lat, lng)
-                all_passes.extend(ps)
-            except Exception as exc:
-                log.warning("iss.sgp4.city_failed", city=city, error=str(exc))
-
-        all_passes.sort(key=lambda p: p.starts_at)
-        log.info("iss.sgp4.done", passes=len(all_passes))
-        return [p.to_dict() for p in all_passes[:limit]]
+        # Hesap CPU-bound (SGP4 ızgarası + şehir başına dönüşümler, birkaç ms);
+        # paylaşılan havuzda çalışır ki event loop WS push'larını bekletmesin.
+        return await run_blocking(_compute_all_passes, line1, line2)
 
     raw = await cache.get_or_fetch(cache_key, CACHE_TTL_SECONDS, loader)
-    return raw if isinstance(raw, list) else []
+    return raw[:limit] if isinstance(raw, list) else []
+
+
+def _tle_digest(line1: str, line2: str) -> str:
+    """TLE satırlarının kısa içerik özeti (cache anahtarı için)."""
+    return hashlib.sha1(f"{line1}\n{line2}".encode()).hexdigest()[:16]
+
+
+def _compute_all_passes(line1: str, line2: str) -> List[dict]:
+    """Tüm şehirler için sıralı tam geçiş listesi (senkron; `run_blocking` ile çağrılır)."""
+    # SGP4 + Güneş/aydınlatma ızgarası şehirden bağımsız → bir kez kur,
+    # şehir başına sadece topocentric dönüşüm + maske kalır.
+    try:
+        grid = _build_pass_grid(line1, line2)
+    except Exception as exc:
+        log.warning("iss.sgp4.grid_failed", error=str(exc))
+        return []
+    all_passes: List[IssPass] = []
+    for city, lat, lng in TURKISH_CITIES:
+        try:
+            ps = _passes_from_grid(grid, city, lat, lng)
+            all_passes.extend(ps)
+        except Exception as exc:
+            log.warning("iss.sgp4.city_failed", city=city, error=str(exc))
+
+    all_passes.sort(key=lambda p: p.starts_at)
+    log.info("iss.sgp4.done", passes=len(all_passes))
+    return [p.to_dict() for p in all_passes]
@@ -15,10 +15,8 @@ import re
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from app.core.logging import get_logger
-from app.nasa import cache
+from app.nasa import cache, http
 
 log = get_logger(__name__)
 
@@ -47,12 +45,14 @@ _PRE_RE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.IGNORECASE | re.DOTALL)
 
 
 def _maybe_float(value: str) -> Optional[float]:
-    """KOERI uses '-.-' for missing magnitude readings."""
-    if not value or value.strip() in {"-.-", "--", "-"}:
-        return None
+    """KOERI uses '-.-' for missing magnitude readings.
+
+    Those placeholders (and blanks) already fail `float()`, so a single
+    try/except covers them without a strip + membership pre-check.
+    """
     try:
         return float(value)
-    except ValueError:
+    except (TypeError, ValueError):
         return None
 
 
@@ -145,16 +145,18 @@ def parse_koeri_html(html: str) -> List[Dict[str, Any]]:
 
 
 async def _fetch_html() -> str:
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-        response = await client.get(
-            KOERI_URL,
-            headers={
-                "User-Agent": "CLIFF/2.0 (asteroit izleme; +https://notcome.app)",
-                "Accept": "text/html,*/*",
-            },
-        )
-        response.raise_for_status()
-        return response.content.decode("windows-1254", errors="replace")
+    # Paylaşılan havuz — her çekimde yeni TCP/TLS bağlantısı açılmasın.
+    client = await http.get_client()
+    response = await client.get(
+        KOERI_URL,
+        headers={
+            "User-Agent": "CLIFF/2.0 (asteroit izleme; +https://notcome.app)",
+            "Accept": "text/html,*/*",
+        },
+        timeout=HTTP_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.content.decode("windows-1254", errors="replace")
 
 
 async def get_recent_earthquakes(
@@ -14,7 +14,7 @@ import asyncio
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import List, Optional
 
@@ -41,7 +41,7 @@ KEYWORDS_RE = re.compile(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PressArticle:
     id: str
     date: str  # ISO 8601
@@ -65,7 +65,7 @@ class PressArticle:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeedConfig:
     """RSS/Atom kaynak konfigürasyonu."""
 
@@ -301,6 +301,25 @@ async def _fetch_feed(client: httpx.AsyncClient, feed: FeedConfig) -> List[Press
     return _parse_feed_xml(response.content, feed)
 
 
+def _dedupe_and_window(articles: List[PressArticle], days: int, today: Optional[date] = None) -> List[PressArticle]:
+    """URL'e göre tekilleştir + son `days` gün penceresi, tek geçişte.
+
+    `date` sıfır dolgulu ISO gün (YYYY-MM-DD) olduğu için string karşılaştırması
+    kronolojik — makale başına fromisoformat gerekmez.
+    """
+    cutoff_min = ((today or datetime.now(timezone.utc).date()) - timedelta(days=days)).isoformat()
+    seen_urls = set()
+    out: List[PressArticle] = []
+    for a in articles:
+        # Aynı URL'i birden fazla feed verebilir
+        if a.url in seen_urls:
+            continue
+        seen_urls.add(a.url)
+        if a.date >= cutoff_min:
+            out.append(a)
+    return out
+
+
 async def get_articles(days: int = 30, limit: int = 24) -> List[dict]:
     """Tüm Türkçe basın feed'lerini paralel çek, asteroit/uzay filtreliyle birleştir.
 
@@ -323,21 +342,7 @@ async def get_articles(days: int = 30, limit: int = 24) -> List[dict]:
             if isinstance(r, list):
                 articles.extend(r)
 
-        # Dedupe — aynı URL'i birden fazla feed verebilir
-        seen_urls = set()
-        unique: List[PressArticle] = []
-        for a in articles:
-            if a.url in seen_urls:
-                continue
-            seen_urls.add(a.url)
-            unique.append(a)
-
-        # Pencere ve sıralama
-        cutoff = datetime.now(timezone.utc).date()
-        from datetime import timedelta as _td
-
-        cutoff_min = cutoff - _td(days=days)
-        windowed = [a for a in unique if datetime.fromisoformat(a.date).date() >= cutoff_min]
+        windowed = _dedupe_and_window(articles, days)
         windowed.sort(key=lambda a: a.date, reverse=True)
         log.info("press.aggregate.done", total=len(windowed))
         return [a.to_dict() for a in windowed[:limit]]
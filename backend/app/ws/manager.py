@@ -10,7 +10,8 @@ from __future__ import annotations
 
 import asyncio
 import uuid
-from typing import Any, Dict, Set
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
 
 from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
@@ -31,19 +32,57 @@ from app.ws.events import (
 log = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _ClientSession:
+    """Per-connection state. Slotted: thousands of these can be live at once.
+    Frozen: fields are never rebound — `channels` is mutated in place."""
+
+    websocket: WebSocket
+    # Reverse index (client → channels) so disconnect only touches the
+    # channels a client actually joined.
+    channels: Set[str] = field(default_factory=set)
+
+
 class WebSocketManager:
     def __init__(self) -> None:
-        self._connections: Dict[str, WebSocket] = {}
+        self._connections: Dict[str, _ClientSession] = {}
         self._subscriptions: Dict[str, Set[str]] = {channel: set() for channel in CHANNELS}
         self._lock = asyncio.Lock()
+        # Slots reserved by handshakes still inside `websocket.accept()`;
+        # counted against WS_MAX_CONNECTIONS so concurrent accepts can't overshoot.
+        self._reserved = 0
+        # Set whenever the connection count changes; lets the live-count
+        # feed push on change instead of on a fixed clock.
+        self._count_changed = asyncio.Event()
 
     # ----- lifecycle -----
 
-    async def accept(self, websocket: WebSocket) -> str:
-        await websocket.accept()
+    async def accept(self, websocket: WebSocket) -> Optional[str]:
+        """Accept and register `websocket`. Returns None when
+        `WS_MAX_CONNECTIONS` clients are already open: the socket is then
+        accepted and immediately closed with 1013 (try again later)."""
+        async with self._lock:
+            full = len(self._connections) + self._reserved >= settings.WS_MAX_CONNECTIONS
+            if not full:
+                self._reserved += 1
+        if full:
+            log.warning("ws.capacity_refused", total=len(self._connections))
+            # Closing before accept() rejects the handshake with HTTP 403 and
+            # browsers only see 1006; accept first so the 1013 reaches them.
+            await websocket.accept()
+            await websocket.close(code=1013)
+            return None
+        try:
+            await websocket.accept()
+        except BaseException:
+            async with self._lock:
+                self._reserved -= 1
+            raise
         client_id = str(uuid.uuid4())
         async with self._lock:
-            self._connections[client_id] = websocket
+            self._reserved -= 1
+            self._connections[client_id] = _ClientSession(websocket)
+        self._count_changed.set()
         log.info("ws.connected", client_id=client_id, total=len(self._connections))
 
         await self._send(
@@ -58,16 +97,18 @@ class WebSocketManager:
 
     async def disconnect(self, client_id: str) -> None:
         async with self._lock:
-            self._connections.pop(client_id, None)
-            for subscribers in self._subscriptions.values():
-                subscribers.discard(client_id)
+            session = self._connections.pop(client_id, None)
+            if session is not None:
+                self._count_changed.set()
+                for channel in session.channels:
+                    self._subscriptions[channel].discard(client_id)
         log.info("ws.disconnected", client_id=client_id, total=len(self._connections))
 
     async def shutdown(self) -> None:
         async with self._lock:
-            for client_id, ws in list(self._connections.items()):
+            for client_id, session in list(self._connections.items()):
                 try:
-                    await ws.close()
+                    await session.websocket.close()
                 except Exception:
                     pass
                 self._connections.pop(client_id, None)
@@ -99,7 +140,11 @@ class WebSocketManager:
             await self._send(client_id, ErrorEvent(code="UNKNOWN_CHANNEL", message=channel))
             return
         async with self._lock:
+            session = self._connections.get(client_id)
+            if session is None:
+                return
             self._subscriptions[channel].add(client_id)
+            session.channels.add(channel)
         log.info("ws.subscribed", client_id=client_id, channel=channel)
         await self._send(client_id, SubscribedEvent(channel=channel))
 
@@ -108,6 +153,9 @@ class WebSocketManager:
             return
         async with self._lock:
             self._subscriptions[channel].discard(client_id)
+            session = self._connections.get(client_id)
+            if session is not None:
+                session.channels.discard(channel)
         await self._send(client_id, UnsubscribedEvent(channel=channel))
 
     # ----- outbound -----
@@ -135,11 +183,11 @@ class WebSocketManager:
         return await self._send(client_id, event)
 
     async def _send(self, client_id: str, event: ServerEvent) -> bool:
-        ws = self._connections.get(client_id)
-        if ws is None:
+        session = self._connections.get(client_id)
+        if session is None:
             return False
         try:
-            await ws.send_text(event.model_dump_json())
+            await session.websocket.send_text(event.model_dump_json())
             return True
         except (WebSocketDisconnect, RuntimeError) as exc:
             log.info("ws.send_failed_drop", client_id=client_id, error=str(exc))
@@ -157,6 +205,11 @@ class WebSocketManager:
             "subscriptions": {ch: len(subs) for ch, subs in self._subscriptions.items()},
         }
 
+    async def wait_count_changed(self) -> None:
+        """Block until a client connects or disconnects."""
+        await self._count_changed.wait()
+        self._count_changed.clear()
+
     def current_active_count(self) -> int:
         """Number of clients with an open WebSocket right now. Cheap O(1)
         getter — used by the analytics endpoint as the "live" online count."""
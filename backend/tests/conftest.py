@@ -4,7 +4,23 @@ from __future__ import annotations
 
 import os
 
+import fakeredis.aioredis
+import pytest
+
 # Force test environment before app imports config.
 os.environ.setdefault("ENVIRONMENT", "test")
 os.environ.setdefault("SCHEDULER_ENABLED", "false")
 os.environ.setdefault("REDIS_URL", "redis://localhost:6379/15")
+
+
+@pytest.fixture
+async def fake_redis(monkeypatch):
+    """Swap the global Redis client for an in-memory fake. Cleaned up
+    automatically after every test so state doesn't leak between cases."""
+    from app.core import redis_client
+
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", fake)
+    yield fake
+    await fake.flushall()
+    monkeypatch.setattr(redis_client, "_client", None)
@@ -0,0 +1,81 @@
+"""AIClient transport tests (httpx MockTransport, no network)."""
+
+from __future__ import annotations
+
+import httpx
+
+from app.ai.client import AIClient
+
+
+async def test_chat_reuses_one_pooled_http_client():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "merhaba"}}]})
+
+    client = AIClient(base_url="https://llm.test", api_key="k", model="m")
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await client.chat([{"role": "user", "content": "hi"}]) == "merhaba"
+    assert await client.chat([{"role": "user", "content": "hi"}]) == "merhaba"
+    assert seen == ["/v1/chat/completions"] * 2
+    assert client._http_client() is client._http
+
+    await client.aclose()
+    assert client._http is None
+    assert client._http_client() is not None  # recreated lazily after close
+    await client.aclose()
+
+
+async def test_prompt_cache_key_routing_per_provider():
+    import orjson
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.host, request.headers.get("x-grok-conv-id"), orjson.loads(request.content)))
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+    messages = [{"role": "user", "content": "hi"}]
+    for base_url in ("https://api.openai.com", "https://api.x.ai", "https://llm.test"):
+        client = AIClient(base_url=base_url, api_key="k", model="m")
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await client.chat(messages, prompt_cache_key="brief:tr")
+        await client.aclose()
+
+    (_, oa_header, oa_body), (_, xai_header, xai_body), (_, other_header, other_body) = seen
+    assert oa_body["prompt_cache_key"] == "brief:tr" and oa_header is None
+    assert xai_header == "brief:tr" and "prompt_cache_key" not in xai_body
+    assert other_header is None and "prompt_cache_key" not in other_body
+
+
+async def test_responses_stream_skips_events_it_does_not_use():
+    body = (
+        "event: response.created\n"
+        "data: {not json at all\n\n"
+        "event: response.output_text.delta\n"
+        'data: {"type": "response.output_text.delta", "delta": "Mer"}\n\n'
+        "event: response.output_text.delta\n"
+        'data: {"type": "response.output_text.delta", "delta": "haba"}\n\n'
+        "event: response.output_text.done\n"
+        "data: {also not json\n\n"
+        "event: response.completed\n"
+        'data: {"type": "response.completed", "response": {"output": [{"type": "message", "content": '
+        '[{"annotations": [{"type": "url_citation", "url": "https://nasa.gov/a"}]}]}]}}\n\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    client = AIClient(base_url="https://api.x.ai", api_key="k", model="m")
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    events = [evt async for evt in client.stream([{"role": "user", "content": "hi"}], with_search=True)]
+    await client.aclose()
+
+    assert events == [
+        {"type": "delta", "content": "Mer"},
+        {"type": "delta", "content": "haba"},
+        {"type": "citations", "urls": ["https://nasa.gov/a"]},
+    ]
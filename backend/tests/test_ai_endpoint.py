@@ -0,0 +1,17 @@
+"""AI endpoint helpers (no upstream calls)."""
+
+from __future__ import annotations
+
+import json
+
+from app.api.v1.endpoints.ai import _sse
+
+
+def test_sse_frames_utf8_json_event():
+    frame = _sse({"request_id": "r1", "event": "delta", "content": "Çelyabinsk ~20 m"})
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    assert json.loads(frame[len(b"data: ") : -2]) == {
+        "request_id": "r1",
+        "event": "delta",
+        "content": "Çelyabinsk ~20 m",
+    }
@@ -0,0 +1,212 @@
+"""AI service orchestration tests (no upstream calls)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.ai import response_cache
+from app.ai.service import AIService
+from app.core.config import settings
+from app.core.exceptions import UpstreamError
+from app.domain.risk import MCSummary, RiskClass, RiskRecord
+
+
+class _StubClient:
+    """Minimal AIClient stand-in: records peak concurrency."""
+
+    supports_web_search = False
+
+    def __init__(self, service_ref: list) -> None:
+        self._service_ref = service_ref
+        self.peak_active = 0
+
+    async def chat(self, messages, **kwargs) -> str:
+        service = self._service_ref[0]
+        self.peak_active = max(self.peak_active, service.active_generations)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+
+async def test_generation_slots_cap_concurrency():
+    ref: list = []
+    client = _StubClient(ref)
+    service = AIService(client=client)  # type: ignore[arg-type]
+    ref.append(service)
+    service.set_generation_limit(2)
+
+    replies = await asyncio.gather(*[service.chat([], "q") for _ in range(5)])
+
+    assert replies == ["ok"] * 5
+    assert client.peak_active == 2
+    assert service.active_generations == 0
+
+
+class _RateLimitedClient:
+    supports_web_search = False
+
+    def __init__(self) -> None:
+        self.fail = True
+
+    async def chat(self, messages, **kwargs) -> str:
+        if self.fail:
+            raise UpstreamError("AI provider returned 429", code="AI_UPSTREAM", details={"status": 429})
+        return "ok"
+
+
+async def test_rate_limit_halves_generation_limit_then_recovers():
+    client = _RateLimitedClient()
+    service = AIService(client=client)  # type: ignore[arg-type]
+    service.set_generation_limit(8)
+
+    for expected in (4, 2, 1, 1):
+        with pytest.raises(UpstreamError):
+            await service.chat([], "q")
+        assert service.generation_limit == expected
+
+    client.fail = False
+    for _ in range(1 + 2):  # one clean window at limit 1, then one at limit 2
+        await service.chat([], "q")
+    assert service.generation_limit == 3
+    for _ in range(3 + 4 + 5 + 6 + 7):
+        await service.chat([], "q")
+    assert service.generation_limit == 8  # capped at the ceiling
+    await service.chat([], "q")
+    assert service.generation_limit == 8
+
+
+class _CountingClient:
+    supports_web_search = False
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def chat(self, messages, **kwargs) -> str:
+        self.calls += 1
+        return f"briefing {self.calls}"
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    response_cache.clear_local()
+    yield
+    response_cache.clear_local()
+
+
+_MC = MCSummary(
+    samples=1_000, mean_km=7.5e6, std_km=1e4, p1_km=7.4e6, p50_km=7.5e6, p99_km=7.6e6, closest_p1_km=7.4e6
+)
+
+
+def _record(score: float) -> RiskRecord:
+    return RiskRecord(neo_id="3542519", name="(2010 PK9)", risk_class=RiskClass.LOW, hybrid_score=score)
+
+
+async def test_explain_threat_record_serves_identical_prompt_from_cache(fake_redis):
+    client = _CountingClient()
+    service = AIService(client=client)  # type: ignore[arg-type]
+
+    first = await service.explain_threat_record(_record(0.31))
+    second = await service.explain_threat_record(_record(0.31))
+    assert first == second and client.calls == 1
+
+    # A material change in the facts misses.
+    third = await service.explain_threat_record(_record(0.42))
+    assert third["text"] == "briefing 2" and client.calls == 2
+
+
+async def test_refresh_regenerates_and_overwrites_the_cached_briefing(fake_redis):
+    client = _CountingClient()
+    service = AIService(client=client)  # type: ignore[arg-type]
+
+    await service.explain_threat_record(_record(0.31))
+    refreshed = await service.explain_threat_record(_record(0.31), refresh=True)
+    assert refreshed["text"] == "briefing 2" and client.calls == 2
+    # The regenerated text replaces the cached one for later readers.
+    assert (await service.explain_threat_record(_record(0.31)))["text"] == "briefing 2"
+    assert client.calls == 2
+
+
+async def test_explain_cache_ignores_recompute_jitter(fake_redis):
+    client = _CountingClient()
+    service = AIService(client=client)  # type: ignore[arg-type]
+    base = _record(0.312).model_copy(update={"miss_distance_km": 4_812_330.0, "diameter_max_km": 0.21})
+
+    await service.explain_threat_record(base)
+    jittered = base.model_copy(update={"hybrid_score": 0.309, "miss_distance_km": 4_809_950.0})
+    assert (await service.explain_threat_record(jittered))["text"] == "briefing 1"
+    assert client.calls == 1
+
+    moved = base.model_copy(update={"miss_distance_km": 2_100_000.0})
+    assert (await service.explain_threat_record(moved))["text"] == "briefing 2"
+    english = await service.explain_threat_record(base, language="en")
+    assert english["text"] == "briefing 3"
+
+
+async def test_response_cache_serves_hot_entries_without_redis(fake_redis, monkeypatch):
+    digest = response_cache.key_for({"q": 1})
+    await response_cache.put(digest, {"text": "brief"}, 60)
+    await fake_redis.flushall()  # the local LRU answers on its own
+
+    assert await response_cache.get(digest) == {"text": "brief"}
+    assert response_cache.cache_info()["hits"] == 1
+
+    monkeypatch.setattr(response_cache, "_LOCAL_MAX", 1)
+    await response_cache.put(response_cache.key_for({"q": 2}), {"text": "other"}, 60)
+    assert await response_cache.get(digest) is None  # evicted, and gone from Redis too
+
+
+async def test_read_through_hit_never_outlives_the_redis_entry(fake_redis):
+    digest = response_cache.key_for({"q": 3})
+    await fake_redis.set(f"cliff:ai:resp:{digest}", '{"text": "brief"}', ex=2)
+
+    before = time.monotonic()
+    assert await response_cache.get(digest) == {"text": "brief"}
+    expires_at = response_cache._local[digest][0]
+    assert expires_at <= before + 2.0 + 0.5
+    assert expires_at < before + response_cache._LOCAL_TTL_SECONDS
+
+
+async def test_explain_cache_disabled_with_zero_ttl(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "AI_EXPLAIN_CACHE_TTL_SECONDS", 0)
+    client = _CountingClient()
+    service = AIService(client=client)  # type: ignore[arg-type]
+
+    await service.explain_threat_record(_record(0.31))
+    await service.explain_threat_record(_record(0.31))
+    assert client.calls == 2
+
+
+async def test_routine_record_skips_the_model(fake_redis):
+    client = _CountingClient()
+    service = AIService(client=client)  # type: ignore[arg-type]
+    record = RiskRecord(
+        neo_id="54321",
+        name="(2020 AB)",
+        risk_class=RiskClass.MINIMAL,
+        hybrid_score=0.01,
+        diameter_max_km=0.04,
+        miss_distance_km=7_500_000.0,
+        relative_velocity_kms=9.3,
+        monte_carlo=_MC,
+    )
+
+    result = await service.explain_threat_record(record, language="tr")
+    assert client.calls == 0
+    assert "7,5 milyon km" in result["text"] and result["citations"] == []
+
+    # A PHA flag always earns a real briefing.
+    await service.explain_threat_record(record.model_copy(update={"is_potentially_hazardous": True}))
+    assert client.calls == 1
+
+
+async def test_unscored_placeholder_gets_a_real_briefing(fake_redis):
+    client = _CountingClient()
+    service = AIService(client=client)  # type: ignore[arg-type]
+    # Seeded but never analysed: MINIMAL with score 0 and no Monte Carlo.
+    placeholder = RiskRecord(neo_id="98765", name="(2024 XY)", risk_class=RiskClass.MINIMAL, hybrid_score=0.0)
+
+    result = await service.explain_threat_record(placeholder)
+    assert client.calls == 1 and result["text"] == "briefing 1"
@@ -0,0 +1,29 @@
+"""Visitor analytics aggregation tests against fakeredis."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.pipeline import analytics_store
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis")
+
+
+def test_sum_counts_skips_non_numeric_values():
+    assert analytics_store._sum_counts(["3", "4", "5"]) == 12
+    assert analytics_store._sum_counts(["3", "oops", None, "5"]) == 8
+    assert analytics_store._sum_counts(None) == 0
+
+
+async def test_daily_summary_totals_page_views(fake_redis):
+    for path, country in (("/", "TR"), ("/", "TR"), ("/earth", "DE")):
+        await analytics_store.record_visit(ip="1.2.3.4", user_agent="ua", path=path, country=country, status_code=200)
+    today = analytics_store._today_utc()
+    await fake_redis.hset(f"cliff:analytics:pages:{today}", "/broken", "n/a")
+
+    res = await analytics_store.daily_summary(days_back=7)
+    assert res["today"] == {"views": 3, "uniques": 1}
+    assert res["last_7d"][-1]["views"] == 3
+    assert res["totals_90d"] == {"views": 3}
+    assert res["top_countries"] == [{"country": "TR", "count": 2}, {"country": "DE", "count": 1}]
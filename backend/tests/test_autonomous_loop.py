@@ -0,0 +1,355 @@
+"""AutonomousLoop recompute tests (fakeredis, upstream analysis stubbed)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.domain.risk import HybridAnalysis, RiskClass, RiskRecord
+from app.pipeline import risk_store
+from app.scheduler.autonomous_loop import AutonomousLoop
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis")
+
+
+async def test_recompute_is_bounded_and_keeps_watchlist_order(monkeypatch):
+    neo_ids = [str(i) for i in range(10)]
+    in_flight = 0
+    peak = 0
+
+    async def fake_stale(older_than_seconds, limit=100):
+        return neo_ids
+
+    async def fake_analyze_one(self, neo_id, sentry_designations, epoch=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later ids finish first — persistence order must not depend on it.
+        await asyncio.sleep(0.001 * (10 - int(neo_id)))
+        in_flight -= 1
+        if neo_id == "3":
+            return None
+        return None, HybridAnalysis(neo_id=neo_id, days_ahead=30, hybrid_score=0.1), None, None
+
+    monkeypatch.setattr(settings, "RECOMPUTE_CONCURRENCY", 3)
+    monkeypatch.setattr(risk_store, "stale_neo_ids", fake_stale)
+    monkeypatch.setattr(AutonomousLoop, "_analyze_one", fake_analyze_one)
+
+    count, deltas, alerts = await AutonomousLoop()._recompute_top_n(set(), force_all=False)
+
+    assert peak == 3
+    assert count == 9
+    assert [d.neo_id for d in deltas] == [i for i in neo_ids if i != "3"]
+    assert alerts == []
+
+
+async def test_earth_cycle_fetches_sources_concurrently(monkeypatch):
+    from app.scheduler import autonomous_loop as al
+
+    trace = []
+
+    def fake(name, *, fail=False):
+        async def _fetch(**kwargs):
+            trace.append(f"{name}:start")
+            await asyncio.sleep(0.01)
+            trace.append(f"{name}:end")
+            if fail:
+                raise RuntimeError(f"{name} down")
+            return [] if name != "eonet" else {"events": []}
+
+        return _fetch
+
+    monkeypatch.setattr(al.eonet, "get_events", fake("eonet", fail=True))
+    monkeypatch.setattr(al.afad, "get_recent_earthquakes", fake("afad"))
+    monkeypatch.setattr(al.usgs, "get_recent_earthquakes", fake("usgs"))
+
+    await AutonomousLoop()._earth_cycle(initial=False)
+
+    # Every source starts before any finishes; one failing doesn't stop the rest.
+    assert [t.split(":")[1] for t in trace[:3]] == ["start"] * 3
+    assert sorted(trace[3:]) == ["afad:end", "eonet:end", "usgs:end"]
+
+
+async def test_earth_cycle_falls_back_to_per_event_upserts(monkeypatch):
+    from datetime import datetime, timezone
+
+    from app.domain.earth_event import EarthEvent, EarthEventGeometry, EventSeverity
+    from app.scheduler import autonomous_loop as al
+
+    now = datetime.now(timezone.utc)
+
+    def quake(id_: str) -> EarthEvent:
+        point = EarthEventGeometry(date=now, type="Point", coordinates=[35.0, 39.0], magnitude_value=6.1, magnitude_unit="Mw")
+        return EarthEvent(
+            id=id_,
+            source="afad",
+            category="earthquakes-tr",
+            title=f"Quake {id_}",
+            geometries=[point],
+            started_at=now,
+            updated_at=now,
+            severity=EventSeverity.HIGH,
+            severity_score=0.7,
+        )
+
+    async def batch_down(events):
+        raise RuntimeError("pipeline failed")
+
+    real_upsert = al.earth_event_store.upsert
+
+    async def flaky_upsert(event):
+        if event.id == "bad":
+            raise ValueError("bad event")
+        return await real_upsert(event)
+
+    async def feed(self):
+        return [quake("ok-1"), quake("bad"), quake("ok-2")]
+
+    async def empty(self):
+        return []
+
+    sent = []
+
+    async def fake_broadcast(channel, event):
+        sent.append(channel)
+
+    monkeypatch.setattr(al.earth_event_store, "upsert_many", batch_down)
+    monkeypatch.setattr(al.earth_event_store, "upsert", flaky_upsert)
+    monkeypatch.setattr(AutonomousLoop, "_fetch_afad_events", feed)
+    monkeypatch.setattr(AutonomousLoop, "_fetch_eonet_events", empty)
+    monkeypatch.setattr(AutonomousLoop, "_fetch_usgs_events", empty)
+    monkeypatch.setattr(al.ws_manager, "broadcast", fake_broadcast)
+
+    await AutonomousLoop()._earth_cycle(initial=False)
+
+    assert await al.earth_event_store.get("ok-1") is not None and await al.earth_event_store.get("ok-2") is not None
+    assert await al.earth_event_store.get("bad") is None
+    assert sent == ["earth_updates", "earth_alerts", "earth_alerts"]
+
+
+async def test_recompute_raises_alert_only_for_upward_transition(monkeypatch):
+    await risk_store.upsert(
+        RiskRecord(neo_id="1", name="NEO 1", risk_class=RiskClass.LOW, hybrid_score=0.3),
+    )
+
+    async def fake_stale(older_than_seconds, limit=100):
+        return ["1", "2"]
+
+    async def fake_analyze_one(self, neo_id, sentry_designations, epoch=None):
+        return None, HybridAnalysis(neo_id=neo_id, days_ahead=30, ml_class=RiskClass.HIGH, hybrid_score=0.8), None, None
+
+    monkeypatch.setattr(risk_store, "stale_neo_ids", fake_stale)
+    monkeypatch.setattr(AutonomousLoop, "_analyze_one", fake_analyze_one)
+
+    count, deltas, alerts = await AutonomousLoop()._recompute_top_n(set(), force_all=False)
+
+    assert count == 2
+    assert [(d.neo_id, d.direction) for d in deltas] == [("1", "up"), ("2", "new")]
+    assert [a.neo_id for a in alerts] == ["1"]
+
+
+async def test_trigger_cycle_tracks_and_coalesces_manual_runs(monkeypatch):
+    gate = asyncio.Event()
+    runs = 0
+
+    async def fake_safe_cycle(self, *, initial=False):
+        nonlocal runs
+        runs += 1
+        await gate.wait()
+
+    monkeypatch.setattr(AutonomousLoop, "_safe_cycle", fake_safe_cycle)
+    loop = AutonomousLoop()
+
+    assert loop.trigger_cycle() is True
+    assert loop.trigger_cycle() is False  # still running → coalesced
+    await asyncio.sleep(0)
+    gate.set()
+    await loop._manual_task
+    assert runs == 1
+
+    assert loop.trigger_cycle() is True
+    await loop.stop()
+    assert runs == 2 and loop._manual_task is None
+
+
+async def test_live_count_pushes_on_connection_change(monkeypatch):
+    from app.scheduler import autonomous_loop as al
+    from app.ws import manager as ws_module
+
+    class _Socket:
+        async def accept(self):
+            pass
+
+        async def send_text(self, text):
+            pass
+
+    mgr = ws_module.WebSocketManager()
+    pushed: list[int] = []
+
+    async def record(channel, event):
+        pushed.append(event.count)
+        return 0
+
+    monkeypatch.setattr(mgr, "broadcast", record)
+    monkeypatch.setattr(ws_module, "get_manager", lambda: mgr)
+    monkeypatch.setattr(al, "_LIVE_COUNT_MIN_INTERVAL", 0.0)
+
+    loop = AutonomousLoop()
+    loop._stop_event = asyncio.Event()
+    task = asyncio.create_task(loop._live_count_loop())
+    await asyncio.sleep(0.01)
+    client_id = await mgr.accept(_Socket())
+    await asyncio.sleep(0.01)
+    await mgr.disconnect(client_id)
+    await asyncio.sleep(0.01)
+    loop._stop_event.set()
+    await asyncio.wait_for(task, timeout=1)
+
+    # Initial heartbeat, then one push per change — long before the 30 s tick.
+    assert pushed == [0, 1, 0]
+
+
+async def test_live_count_heartbeats_reuse_one_change_waiter(monkeypatch):
+    from app.scheduler import autonomous_loop as al
+    from app.ws import manager as ws_module
+
+    mgr = ws_module.WebSocketManager()
+    pushed: list[int] = []
+    waiters = 0
+    real_wait = mgr.wait_count_changed
+
+    async def record(channel, event):
+        pushed.append(event.count)
+        return 0
+
+    async def counting_wait():
+        nonlocal waiters
+        waiters += 1
+        await real_wait()
+
+    monkeypatch.setattr(mgr, "broadcast", record)
+    monkeypatch.setattr(mgr, "wait_count_changed", counting_wait)
+    monkeypatch.setattr(ws_module, "get_manager", lambda: mgr)
+    monkeypatch.setattr(al, "_LIVE_COUNT_HEARTBEAT", 0.01)
+
+    loop = AutonomousLoop()
+    loop._stop_event = asyncio.Event()
+    task = asyncio.create_task(loop._live_count_loop())
+    await asyncio.sleep(0.1)
+    loop._stop_event.set()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert len(pushed) >= 3
+    assert waiters == 1
+
+
+async def test_ingest_feed_seeds_only_unseen_neos_in_one_batch(monkeypatch):
+    from app.nasa import neows
+
+    def raw(neo_id):
+        return {"id": neo_id, "name": f"({neo_id})", "close_approach_data": []}
+
+    async def fake_feed(days):
+        return {}
+
+    monkeypatch.setattr(neows, "get_feed_today", fake_feed)
+    monkeypatch.setattr(neows, "iter_neos_from_feed", lambda feed: [raw("1"), raw("2"), raw("2"), raw("3")])
+    await risk_store.upsert(RiskRecord(neo_id="2", name="(2)", risk_class=RiskClass.HIGH, hybrid_score=0.7))
+    mgets = []
+    real_get_many = risk_store.get_many
+
+    async def counting_get_many(neo_ids):
+        mgets.append(list(neo_ids))
+        return await real_get_many(neo_ids)
+
+    monkeypatch.setattr(risk_store, "get_many", counting_get_many)
+    result = await AutonomousLoop()._ingest_feed()
+    monkeypatch.setattr(risk_store, "get_many", real_get_many)
+
+    assert result == {"fetched": 4, "new": 2}
+    assert mgets == [["1", "2", "3"]]  # the prefetch is reused by upsert_many
+    records = await risk_store.get_many(["1", "2", "3"])
+    assert [r.risk_class for r in records] == [RiskClass.MINIMAL, RiskClass.HIGH, RiskClass.MINIMAL]
+
+
+async def test_cycle_overlaps_feed_ingest_and_sentry_fetch(monkeypatch):
+    trace = []
+
+    async def fake_ingest(self, *, deep=False):
+        trace.append("feed:start")
+        await asyncio.sleep(0.01)
+        trace.append("feed:end")
+        return {"fetched": 0, "new": 0}
+
+    async def fake_sentry(self):
+        trace.append("sentry:start")
+        await asyncio.sleep(0.01)
+        trace.append("sentry:end")
+        return {"2024 AB"}
+
+    seen = {}
+
+    async def fake_recompute(self, sentry_designations, *, force_all):
+        seen["sentry"] = sentry_designations
+        return 0, [], []
+
+    monkeypatch.setattr(AutonomousLoop, "_ingest_feed", fake_ingest)
+    monkeypatch.setattr(AutonomousLoop, "_fetch_sentry_designations", fake_sentry)
+    monkeypatch.setattr(AutonomousLoop, "_recompute_top_n", fake_recompute)
+
+    await AutonomousLoop()._cycle(initial=False)
+
+    assert trace[:2] == ["feed:start", "sentry:start"]
+    assert seen["sentry"] == {"2024 AB"}
+
+
+async def test_recompute_builds_one_position_epoch_per_batch(monkeypatch):
+    epochs = []
+    seen = []
+
+    def fake_epoch(self):
+        epochs.append(1)
+        return 2460000.5, None
+
+    async def fake_stale(older_than_seconds, limit=100):
+        return ["1", "2", "3"]
+
+    async def fake_analyze_one(self, neo_id, sentry_designations, epoch=None):
+        seen.append(epoch)
+        return None, HybridAnalysis(neo_id=neo_id, days_ahead=30, hybrid_score=0.1), None, None
+
+    monkeypatch.setattr(AutonomousLoop, "_position_epoch", fake_epoch)
+    monkeypatch.setattr(risk_store, "stale_neo_ids", fake_stale)
+    monkeypatch.setattr(AutonomousLoop, "_analyze_one", fake_analyze_one)
+
+    await AutonomousLoop()._recompute_top_n(set(), force_all=False)
+
+    assert len(epochs) == 1
+    assert seen == [(2460000.5, None)] * 3
+
+
+async def test_recompute_cancels_remaining_targets_on_unexpected_failure(monkeypatch):
+    cancelled = []
+
+    async def fake_stale(older_than_seconds, limit=100):
+        return ["1", "2", "3"]
+
+    async def fake_analyze_one(self, neo_id, sentry_designations, epoch=None):
+        if neo_id == "1":
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(neo_id)
+            raise
+
+    monkeypatch.setattr(risk_store, "stale_neo_ids", fake_stale)
+    monkeypatch.setattr(AutonomousLoop, "_analyze_one", fake_analyze_one)
+
+    with pytest.raises(ExceptionGroup):
+        await AutonomousLoop()._recompute_top_n(set(), force_all=False)
+    assert sorted(cancelled) == ["2", "3"]
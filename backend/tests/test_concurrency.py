@@ -0,0 +1,71 @@
+"""AdjustableSemaphore tests."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.concurrency import AdjustableSemaphore
+
+
+async def test_caps_concurrency_and_tracks_active():
+    sem = AdjustableSemaphore(2)
+    peak = 0
+
+    async def worker():
+        nonlocal peak
+        async with sem:
+            peak = max(peak, sem.active)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[worker() for _ in range(6)])
+    assert peak == 2
+    assert sem.active == 0 and sem.waiting == 0
+
+
+async def test_raising_limit_wakes_existing_waiters():
+    sem = AdjustableSemaphore(1)
+    await sem.acquire()
+    waiter = asyncio.create_task(sem.acquire())
+    await asyncio.sleep(0)
+    assert sem.waiting == 1 and not waiter.done()
+
+    sem.set_limit(2)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert sem.active == 2
+
+
+async def test_lowering_limit_drains_before_admitting():
+    sem = AdjustableSemaphore(2)
+    await sem.acquire()
+    await sem.acquire()
+    sem.set_limit(1)
+    waiter = asyncio.create_task(sem.acquire())
+    await asyncio.sleep(0)
+
+    sem.release()  # active 1 == limit 1 → waiter still queued
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    sem.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert sem.active == 1
+
+
+async def test_cancelled_waiter_leaves_queue():
+    sem = AdjustableSemaphore(1)
+    await sem.acquire()
+    waiter = asyncio.create_task(sem.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert sem.waiting == 0
+    sem.release()
+    assert sem.active == 0
+
+
+def test_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        AdjustableSemaphore(0)
@@ -111,6 +111,57 @@ async def test_upsert_status_close_emits_closed_direction():
     assert delta.direction == "closed"
 
 
+@pytest.mark.asyncio
+async def test_upsert_many_matches_sequential_deltas_in_one_batch():
+    await earth_event_store.upsert(_wildfire("a", 50))
+    b = _wildfire("b", 100)
+    closed_b = b.model_copy(update={"status": "closed"})
+    changes = await earth_event_store.upsert_many([_wildfire("a", 300), b, b, closed_b])
+    assert [(d.event_id, d.direction) for _, d in changes] == [("a", "escalated"), ("b", "new"), ("b", "closed")]
+    # Each delta comes back with the occurrence it was built from.
+    assert [ev.status for ev, _ in changes] == ["open", "open", "closed"]
+    assert (await earth_event_store.get("a")).severity == EventSeverity.HIGH
+    assert (await earth_event_store.query(status="closed"))["total"] == 1
+
+
+async def test_upsert_many_stamps_every_delta_with_one_clock_read():
+    changes = await earth_event_store.upsert_many([_wildfire(f"w{i}", 100) for i in range(5)])
+    assert len(changes) == 5
+    assert len({d.computed_at for _, d in changes}) == 1
+
+
+class _RecordingPipe:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append(name)
+
+
+def test_queue_upsert_skips_index_writes_when_indexed_fields_unchanged():
+    ev = _wildfire("a", 100)
+    unchanged, rescored, fresh = _RecordingPipe(), _RecordingPipe(), _RecordingPipe()
+
+    earth_event_store._queue_upsert(unchanged, ev.model_copy(update={"title": "renamed"}), ev)
+    earth_event_store._queue_upsert(rescored, ev.model_copy(update={"severity_score": 0.9}), ev)
+    earth_event_store._queue_upsert(fresh, ev, None)
+
+    assert unchanged.calls == ["set"]
+    assert rescored.calls == fresh.calls == ["set", "zadd", "zadd", "sadd", "sadd", "sadd"]
+
+
+@pytest.mark.asyncio
+async def test_remove_many_clears_every_index(_fake_redis):
+    await earth_event_store.upsert_many([_wildfire("x", 100), _wildfire("y", 100), _quake("z", 6.0)])
+    await earth_event_store.remove_many(["x", "z", "missing"])
+
+    assert await earth_event_store.get_many(["x", "y", "z"]) == [None, await earth_event_store.get("y"), None]
+    res = await earth_event_store.query(categories=["earthquakes-tr"])
+    assert res["total"] == 0
+    assert await _fake_redis.smembers("cliff:earth:open") == {"y"}
+    assert await _fake_redis.smembers("cliff:earth:by_category:earthquakes-tr") == set()
+
+
 @pytest.mark.asyncio
 async def test_query_filters_by_category():
     await earth_event_store.upsert(_wildfire("w1", 100))
@@ -124,6 +175,11 @@ async def test_query_filters_by_category():
     only_fires = await earth_event_store.query(categories=["wildfires"])
     assert only_fires["total"] == 2
 
+    both = await earth_event_store.query(categories=["wildfires", "earthquakes-tr", "volcanoes"])
+    assert both["total"] == 3
+    by_source = await earth_event_store.query(categories=["wildfires", "earthquakes-tr"], sources=["afad"])
+    assert [e.id for e in by_source["items"]] == ["q1"]
+
 
 @pytest.mark.asyncio
 async def test_query_filters_by_severity_min():
@@ -145,6 +201,37 @@ async def test_query_pagination():
     assert len(res2["items"]) == 2
 
 
+@pytest.mark.asyncio
+async def test_query_severity_pages_follow_full_ranking():
+    for i, area in enumerate((10, 5_000, 200, 80_000, 1_500, 40)):
+        await earth_event_store.upsert(_wildfire(f"w{i}", area))
+    full = await earth_event_store.query(sort_by="severity", limit=50)
+    ranked_ids = [e.id for e in full["items"]]
+    assert [e.severity_score for e in full["items"]] == sorted((e.severity_score for e in full["items"]), reverse=True)
+
+    page = await earth_event_store.query(sort_by="severity", limit=2, offset=2)
+    assert [e.id for e in page["items"]] == ranked_ids[2:4]
+    assert page["total"] == 6
+
+
+@pytest.mark.asyncio
+async def test_query_hydrates_only_the_returned_page(monkeypatch):
+    await earth_event_store.upsert_many([_wildfire(f"w{i}", 100 * (i + 1)) for i in range(6)])
+    hydrated = []
+    real_fetch_many = earth_event_store.fetch_many
+
+    async def spy_fetch_many(ids):
+        hydrated.append(list(ids))
+        return await real_fetch_many(ids)
+
+    monkeypatch.setattr(earth_event_store, "fetch_many", spy_fetch_many)
+    res = await earth_event_store.query(sort_by="severity", severity_min="moderate", limit=2, offset=1)
+
+    assert hydrated == [[e.id for e in res["items"]]] and len(res["items"]) == 2
+    assert all(e.severity_rank >= 2 for e in res["items"])
+    assert res["total"] == sum(1 for i in range(6) if _wildfire("t", 100 * (i + 1)).severity_rank >= 2)
+
+
 @pytest.mark.asyncio
 async def test_summary_counts_open_only():
     await earth_event_store.upsert(_wildfire("open", 100, status="open"))
@@ -154,6 +241,20 @@ async def test_summary_counts_open_only():
     assert summary.by_category.get("wildfires") == 1
 
 
+@pytest.mark.asyncio
+async def test_summary_breakdowns_from_one_pass():
+    stale = _wildfire("old", 300).model_copy(update={"updated_at": datetime.now(timezone.utc) - timedelta(days=3)})
+    for ev in (_wildfire("a", 50), stale, _quake("q", 4.0), _wildfire("gone", 300, status="closed")):
+        await earth_event_store.upsert(ev)
+
+    summary = await earth_event_store.summary()
+
+    assert summary.total_open == 3
+    assert summary.by_category == {"wildfires": 2, "earthquakes-tr": 1}
+    assert sum(summary.by_severity.values()) == 3 and summary.by_severity["high"] == 1
+    assert (summary.last_24h, summary.last_7d) == (2, 3)
+
+
 @pytest.mark.asyncio
 async def test_get_then_remove():
     ev = _wildfire("xx", 100)
@@ -200,3 +301,9 @@ async def test_prune_drops_old_events():
     assert deleted == 1
     assert await earth_event_store.get("ancient") is None
     assert await earth_event_store.get("fresh") is not None
+
+
+def test_stored_ts_treats_naive_timestamps_as_utc():
+    aware = datetime(2026, 5, 1, 12, 30, tzinfo=timezone.utc)
+    assert earth_event_store._stored_ts("2026-05-01T12:30:00") == aware.timestamp()
+    assert earth_event_store._stored_ts("2026-05-01T15:30:00+03:00") == aware.timestamp()
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
+import pytest
+
 from app.domain.earth_event import EventSeverity
+from app.pipeline.earth_categories import EARTH_CATEGORIES, category_for_eonet, severity_for_metric
 from app.pipeline.earth_normalizer import (
+    _convert_metric_value,
     normalize_afad_row,
+    normalize_afad_rows,
     normalize_eonet_event,
     normalize_eonet_payload,
 )
@@ -81,6 +88,21 @@ def test_normalize_eonet_volcano_min_severity_moderate():
     assert 0.4 <= ev.severity_score < 0.7
 
 
+@pytest.mark.parametrize(
+    "category, value, expected",
+    [
+        ("volcanoes", 0.5, "moderate"),  # below every boundary → floor wins
+        ("volcanoes", 3, "high"),
+        ("earthquakes", 3.9, "low"),
+        ("earthquakes", 7.2, "critical"),
+        ("seaLakeIce", None, "info"),
+        ("unknownCategory", 5.0, "info"),
+    ],
+)
+def test_severity_for_metric_tiers_and_floor(category, value, expected):
+    assert severity_for_metric(category, value) == expected
+
+
 def test_normalize_eonet_skips_unknown_category():
     raw = {
         "id": "EONET_X",
@@ -159,6 +181,22 @@ def test_normalize_afad_row_basic():
     assert ev.geometries[0].coordinates == [26.5, 38.6]
 
 
+def test_normalize_afad_rows_share_one_clock_read():
+    rows = [
+        {"id": "1", "magnitude": 4.1, "lat": 38.6, "lon": 26.5, "time": 1746440000000},
+        {"id": "2", "magnitude": 3.2, "lat": 39.9, "lon": 32.8},  # no timestamp → batch clock
+    ]
+    events = normalize_afad_rows(rows)
+
+    assert len(events) == 2
+    assert events[0].fetched_at == events[1].fetched_at
+    assert events[1].started_at == events[1].fetched_at.replace(tzinfo=timezone.utc)
+    assert events[0].started_at == datetime.fromtimestamp(1746440000, tz=timezone.utc)
+
+    pinned = datetime(2026, 1, 2, 3, 4, 5)
+    assert normalize_afad_row(rows[1], now=pinned).fetched_at == pinned
+
+
 def test_normalize_afad_row_skips_zero_magnitude():
     raw = {"id": "x", "magnitude": 0, "lat": 1, "lon": 1, "time": 1}
     assert normalize_afad_row(raw) is None
@@ -167,3 +205,21 @@ def test_normalize_afad_row_skips_zero_magnitude():
 def test_normalize_afad_row_skips_zero_coords():
     raw = {"id": "x", "magnitude": 4.0, "lat": 0, "lon": 0, "time": 1}
     assert normalize_afad_row(raw) is None
+
+
+def test_category_for_eonet_resolves_every_registered_code_case_insensitively():
+    for key, meta in EARTH_CATEGORIES.items():
+        for code in meta.eonet_codes:
+            assert category_for_eonet(code) == key
+            assert category_for_eonet(code.upper()) == key
+    assert category_for_eonet("notACategory") is None
+    assert category_for_eonet(None) is None  # type: ignore[arg-type]
+
+
+def test_convert_metric_value_unit_table():
+    assert _convert_metric_value("wildfires", 100.0, " HA ") == pytest.approx(1.0)
+    assert _convert_metric_value("wildfires", 12.0, "km²") == 12.0
+    assert _convert_metric_value("severeStorms", 10.0, "m/s") == pytest.approx(19.4384)
+    assert _convert_metric_value("severeStorms", 80.0, "kts") == 80.0
+    assert _convert_metric_value("volcanoes", 3.0, "mph") == 3.0
+    assert _convert_metric_value("wildfires", None, "acres") is None
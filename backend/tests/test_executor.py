@@ -0,0 +1,17 @@
+"""Shared CPU executor tests."""
+
+from __future__ import annotations
+
+from app.core import executor
+
+
+async def test_run_blocking_creates_pool_lazily_and_shuts_down():
+    executor.shutdown()
+    assert executor._executor is None
+
+    result = await executor.run_blocking(sum, [1, 2, 3], start=10)
+
+    assert result == 16
+    assert executor._executor is not None
+    executor.shutdown()
+    assert executor._executor is None
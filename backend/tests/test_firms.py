@@ -0,0 +1,79 @@
+"""NASA FIRMS CSV parser tests."""
+
+from __future__ import annotations
+
+from app.sources import firms
+from app.sources.firms import _parse_csv
+
+VIIRS_CSV = (
+    "latitude,longitude,bright_ti4,scan,track,acq_date,acq_time,satellite,instrument,"
+    "confidence,version,bright_ti5,frp,daynight\n"
+    "38.1,27.2,330.5,0.4,0.4,2026-07-01,945,N,VIIRS,n,2.0NRT,290.1,5.3,D\n"
+    "bad,1,,,,,,,,,,,,\n"
+)
+
+
+def test_parse_viirs_row_uses_bright_ti4_and_pads_time():
+    rows = _parse_csv(VIIRS_CSV, "VIIRS_SNPP_NRT")
+    assert len(rows) == 1  # malformed latitude row dropped
+    row = rows[0]
+    assert row["lat"] == 38.1 and row["lon"] == 27.2
+    assert row["brightness_k"] == 330.5
+    assert row["frp"] == 5.3
+    assert row["confidence"] == "n"
+    assert row["daynight"] == "D"
+    # 945 → 09:45 UTC on 2026-07-01
+    assert row["acq_at"] == 1782899100000
+
+
+def test_parse_modis_row_missing_columns_default_empty():
+    rows = _parse_csv("latitude,longitude,brightness,acq_date,acq_time,frp\n1,2,300,2026-07-01,1200,\n", "MODIS")
+    assert rows[0]["brightness_k"] == 300.0
+    assert rows[0]["frp"] == 0.0
+    assert rows[0]["satellite"] == ""
+
+
+def test_parse_falls_back_to_bright_ti4_when_brightness_cell_is_empty():
+    rows = _parse_csv("latitude,longitude,brightness,bright_ti4,acq_date,acq_time\n1,2,,331.2,2026-07-01,1200\n", "VIIRS")
+    assert rows[0]["brightness_k"] == 331.2
+
+
+def test_parse_skips_blank_lines():
+    text = (
+        "latitude,longitude,bright_ti4,acq_date,acq_time,frp\n"
+        "38.1,27.2,330.5,2026-07-01,945,5.3\n"
+        "\n"
+        "39.0,28.0,320.0,2026-07-01,1000,2.1\n"
+        "\n"
+    )
+    rows = _parse_csv(text, "VIIRS_SNPP_NRT")
+    assert [(r["lat"], r["lon"]) for r in rows] == [(38.1, 27.2), (39.0, 28.0)]
+    assert all(r["acq_at"] for r in rows)
+
+
+def test_parse_reuses_acquisition_time_parse_for_repeated_scans():
+    firms._acq_epoch_ms.cache_clear()
+    body = "".join(f"38.{i},27.2,330.5,2026-07-01,945,5.0\n" for i in range(50))
+    rows = _parse_csv("latitude,longitude,bright_ti4,acq_date,acq_time,frp\n" + body, "VIIRS_SNPP_NRT")
+    assert {r["acq_at"] for r in rows} == {1782899100000}
+    info = firms._acq_epoch_ms.cache_info()
+    assert (info.misses, info.hits) == (1, 49)
+
+
+def test_parse_invalid_key_response():
+    assert _parse_csv("Invalid MAP_KEY.", "VIIRS_SNPP_NRT") == []
+    assert _parse_csv("", "VIIRS_SNPP_NRT") == []
+
+
+async def test_get_active_fires_returns_newest_limit_in_stable_order(monkeypatch):
+    rows = [{"id": i, "acq_at": at} for i, at in enumerate([5, 9, 0, 9, 7, 3, 9, 1])]
+
+    async def cached(key, ttl, loader):
+        return [dict(r) for r in rows]
+
+    monkeypatch.setattr(firms.settings, "FIRMS_API_KEY", "test-key")
+    monkeypatch.setattr(firms.cache, "get_or_fetch", cached)
+
+    out = await firms.get_active_fires(limit=4)
+    expected = sorted(rows, key=lambda r: r["acq_at"], reverse=True)[:4]
+    assert [r["id"] for r in out] == [r["id"] for r in expected] == [1, 3, 6, 4]
@@ -0,0 +1,36 @@
+"""Horizons ephemeris parser tests."""
+
+from __future__ import annotations
+
+from app.nasa.horizons import _parse_result, table_lines
+
+RESULT = """\
+*******************************************************************************
+$$SOE
+ 2026-Oct-17 00:00, , ,12 34 56.78,+12 34 56.7,  18.512,  1.234, 0.03120000, -5.4300000, 120.5,/L,
+ 2026-Oct-18 00:00, , ,12 35 56.78,+12 35 56.7,  18.401,  1.210, 0.03010000, -5.1000000, 121.0,/L,
+$$EOE
+*******************************************************************************
+"""
+
+
+def test_parse_result_returns_plain_row_dicts():
+    rows = _parse_result({"result": RESULT})
+    assert len(rows) == 2
+    first = rows[0]
+    assert isinstance(first, dict)
+    assert first["when"] == "2026-Oct-17 00:00"
+    assert first["delta_au"] == 0.0312
+    assert first["deldot_kms"] == -5.43
+    assert first["apmag"] == 18.512
+    assert set(first) == {"when", "delta_au", "deldot_kms", "ra", "dec", "apmag"}
+
+
+def test_parse_result_without_table_is_empty():
+    assert _parse_result({"result": "No ephemeris for target"}) == []
+
+
+def test_table_lines_slices_between_markers():
+    assert [ln.strip()[:11] for ln in table_lines(RESULT)] == ["2026-Oct-17", "2026-Oct-18"]
+    assert table_lines("header only") == []
+    assert table_lines("$$SOE\n a\n b\n") == [" a", " b"]
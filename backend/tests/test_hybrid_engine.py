@@ -0,0 +1,110 @@
+"""Hybrid engine tests (Horizons fetch monkeypatched)."""
+
+from __future__ import annotations
+
+import math
+import threading
+
+import pytest
+
+from app.domain.risk import MCSummary, RiskClass
+from app.pipeline import hybrid_engine
+from app.pipeline.hybrid_engine import AU_TO_KM, _column
+
+
+def test_column_maps_missing_and_non_numeric_to_nan():
+    rows = [{"delta_au": 0.1}, {"delta_au": None}, {}, {"delta_au": "x"}, {"delta_au": 2}]
+    col = _column(rows, "delta_au")
+    assert col.shape == (5,)
+    assert col[0] == 0.1 and col[4] == 2.0
+    assert all(math.isnan(v) for v in col[1:4])
+
+
+async def test_analyze_target_uses_numeric_rows_only(monkeypatch):
+    rows = [
+        {"delta_au": 0.02, "deldot_kms": -6.0},
+        {"delta_au": 0.01, "deldot_kms": 4.0},
+        {"delta_au": None, "deldot_kms": None},
+        {"delta_au": 0.03, "deldot_kms": -5.0},
+    ]
+
+    async def fake_positions(neo_id, days_ahead=30, step="1d"):
+        return {"_rows": rows}
+
+    monkeypatch.setattr(hybrid_engine.horizons, "get_future_positions", fake_positions)
+    analysis = await hybrid_engine.analyze_target("123", samples=500)
+
+    assert analysis.rows_count == 4
+    assert analysis.nominal_min_distance_km == pytest.approx(0.01 * AU_TO_KM)
+    assert analysis.nominal_velocity_kms == pytest.approx(5.0)
+    assert analysis.monte_carlo is not None and analysis.monte_carlo.samples == 500
+    assert 0.0 <= analysis.hybrid_score <= 1.0
+
+
+async def test_analyze_target_without_rows_skips_monte_carlo(monkeypatch):
+    async def fake_positions(neo_id, days_ahead=30, step="1d"):
+        return {"_rows": []}
+
+    monkeypatch.setattr(hybrid_engine.horizons, "get_future_positions", fake_positions)
+    analysis = await hybrid_engine.analyze_target("123")
+
+    assert analysis.nominal_min_distance_km is None
+    assert analysis.monte_carlo is None
+    assert analysis.sigma_km == 0.0
+
+
+async def test_analyze_target_runs_monte_carlo_off_the_event_loop(monkeypatch):
+    async def fake_positions(neo_id, days_ahead=30, step="1d"):
+        return {"_rows": [{"delta_au": 0.02, "deldot_kms": 5.0}, {"delta_au": 0.01, "deldot_kms": 5.0}]}
+
+    real_run = hybrid_engine.monte_carlo.run
+    threads = []
+
+    def spy_run(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr(hybrid_engine.horizons, "get_future_positions", fake_positions)
+    monkeypatch.setattr(hybrid_engine.monte_carlo, "run", spy_run)
+    analysis = await hybrid_engine.analyze_target("123", samples=200)
+
+    assert analysis.monte_carlo is not None and analysis.monte_carlo.samples == 200
+    assert threads and threads[0] is not threading.main_thread()
+
+
+async def test_analyze_target_reduces_samples_when_far_beyond_score_horizon(monkeypatch):
+    far = [{"delta_au": au, "deldot_kms": 5.0} for au in (0.2, 0.21, 0.22)]
+    near = [{"delta_au": 0.004, "deldot_kms": 5.0}, {"delta_au": 0.005, "deldot_kms": 5.0}]
+    payloads = {"far": {"_rows": far}, "near": {"_rows": near}}
+
+    async def fake_positions(neo_id, days_ahead=30, step="1d"):
+        return payloads[neo_id]
+
+    monkeypatch.setattr(hybrid_engine.horizons, "get_future_positions", fake_positions)
+    far_analysis = await hybrid_engine.analyze_target("far", samples=5_000)
+    near_analysis = await hybrid_engine.analyze_target("near", samples=5_000)
+
+    assert far_analysis.monte_carlo.samples == hybrid_engine.MC_FAR_SAMPLES
+    assert far_analysis.monte_carlo.p1_km > hybrid_engine.MC_SCORE_HORIZON_KM
+    assert near_analysis.monte_carlo.samples == 5_000
+
+
+def test_compose_score_sums_terms_and_clamps_once():
+    def mc_at(p1_km):
+        return MCSummary(samples=10, mean_km=p1_km, std_km=0.0, p1_km=p1_km, p50_km=p1_km, p99_km=p1_km, closest_p1_km=p1_km)
+
+    ld = hybrid_engine.LUNAR_DISTANCE_KM
+    score = hybrid_engine._compose_score(
+        ml_cls=RiskClass.HIGH, ml_confidence=1.0, mc=mc_at(0.5 * ld), diameter_km=0.5, sentry_listed=True
+    )
+    assert score == pytest.approx(0.70 + 0.06 + 0.04 + 0.05)
+
+    capped = hybrid_engine._compose_score(
+        ml_cls=RiskClass.CRITICAL, ml_confidence=1.0, mc=mc_at(0.1 * ld), diameter_km=2.0, sentry_listed=True
+    )
+    assert capped == 1.0
+
+    quiet = hybrid_engine._compose_score(
+        ml_cls=RiskClass.MINIMAL, ml_confidence=0.0, mc=mc_at(20 * ld), diameter_km=0.01, sentry_listed=False
+    )
+    assert quiet == pytest.approx(0.025)
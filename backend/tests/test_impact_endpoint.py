@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+
+from app.api.v1.endpoints import impact
 from app.api.v1.endpoints.impact import ImpactRequest, _compute
 
 
@@ -31,3 +34,52 @@ def test_compute_scales_with_diameter():
     )
     big = base.model_copy(update={"diameter_m": 1000})
     assert _compute(big).energy_megatons > _compute(base).energy_megatons
+
+
+async def test_list_presets_fetches_active_neos_concurrently(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_get_body(designation: str):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if designation == "101955":
+            return None
+        return {"phys_par": [{"name": "diameter", "value": "0.34"}]}
+
+    monkeypatch.setattr(impact.sbdb, "get_body", fake_get_body)
+    res = await impact.list_presets()
+
+    assert peak == len(impact.ACTIVE_NEO_PRESETS)
+    active = {p.id: p for p in res.items if p.kind == "active_neo"}
+    assert active["apophis"].source == "JPL SBDB"
+    assert active["apophis"].input.diameterM == 340
+    assert active["bennu"].source == "Cached fallback"
+    assert active["bennu"].input.diameterM == 490
+
+
+async def test_historical_presets_load_once(monkeypatch):
+    calls = 0
+    real_load = impact._load_historical_impacts
+
+    def counting_load():
+        nonlocal calls
+        calls += 1
+        return real_load()
+
+    async def fake_get_body(designation: str):
+        return None
+
+    impact._historical_presets.cache_clear()
+    monkeypatch.setattr(impact, "_load_historical_impacts", counting_load)
+    monkeypatch.setattr(impact.sbdb, "get_body", fake_get_body)
+    first = await impact.list_presets()
+    second = await impact.list_presets()
+    impact._historical_presets.cache_clear()
+
+    assert calls == 1
+    historical = [p.id for p in first.items if p.kind == "historical"]
+    assert historical and historical == [p.id for p in second.items if p.kind == "historical"]
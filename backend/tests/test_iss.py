@@ -0,0 +1,154 @@
+"""ISS pass predictor tests (fixed TLE + fixed clock, no network)."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import numpy as np
+from sgp4.api import Satrec, jday
+
+from app.nasa import http
+from app.sources import iss
+
+LINE1 = "1 25544U 98067A   26289.50000000  .00016717  00000-0  30306-3 0  9993"
+LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.50376040 12345"
+NOW = datetime(2026, 6, 1, 18, 0, tzinfo=timezone.utc)
+
+
+def _scalar_elevation(when: datetime, lat: float, lng: float) -> float:
+    sat = Satrec.twoline2rv(LINE1, LINE2)
+    jd, fr = jday(when.year, when.month, when.day, when.hour, when.minute, when.second + when.microsecond / 1e6)
+    _e, r, _v = sat.sgp4(jd, fr)
+    ecef = iss._eci_to_ecef(np.array([r]), np.array([jd + fr]))
+    _az, el, _rng = iss._ecef_to_topocentric(ecef, lat, lng)
+    return float(el[0])
+
+
+def test_vectorised_passes_start_on_grid_and_above_horizon():
+    _city, lat, lng = iss.TURKISH_CITIES[1]
+    passes = iss._compute_passes_for_city(LINE1, LINE2, "Ankara", lat, lng, hours_ahead=240, now=NOW)
+
+    assert passes
+    starts = [datetime.fromisoformat(p.starts_at) for p in passes]
+    assert starts == sorted(starts)
+    for p, start in zip(passes, starts):
+        assert (start - NOW).total_seconds() % 30 == 0
+        assert start < NOW + timedelta(hours=240)
+        assert p.max_elevation_deg >= 15 and p.duration_min >= 1
+        assert p.appears_dir in iss._COMPASS_POINTS and p.disappears_dir in iss._COMPASS_POINTS
+        assert _scalar_elevation(start, lat, lng) > 10.0
+
+
+def test_above_horizon_prefilter_matches_topocentric_elevation():
+    grid = iss._build_pass_grid(LINE1, LINE2, 24, now=NOW)
+    for _city, lat, lng in iss.TURKISH_CITIES:
+        _az, el, _rng = iss._ecef_to_topocentric(grid.ecef, lat, lng)
+        assert np.array_equal(iss._above_horizon(grid.ecef, lat, lng), el > 0.0)
+
+
+def test_open_pass_at_window_end_is_dropped():
+    _city, lat, lng = iss.TURKISH_CITIES[1]
+    full = iss._compute_passes_for_city(LINE1, LINE2, "Ankara", lat, lng, hours_ahead=240, now=NOW)
+    first = datetime.fromisoformat(full[0].starts_at)
+    cut_hours = (first - NOW).total_seconds() / 3600 + 1 / 60
+
+    truncated = iss._compute_passes_for_city(LINE1, LINE2, "Ankara", lat, lng, hours_ahead=cut_hours, now=NOW)
+    assert all(p.starts_at != full[0].starts_at for p in truncated)
+
+
+async def test_get_passes_builds_one_grid_for_all_cities(monkeypatch):
+    real_build = iss._build_pass_grid
+    builds = []
+
+    def pinned_build(line1, line2, *args, **kwargs):
+        builds.append((line1, threading.current_thread().name))
+        return real_build(line1, line2, 240, now=NOW)
+
+    async def fake_tle():
+        return LINE1, LINE2
+
+    async def no_cache(key, ttl, loader):
+        return await loader()
+
+    monkeypatch.setattr(iss, "_build_pass_grid", pinned_build)
+    monkeypatch.setattr(iss, "_fetch_tle", fake_tle)
+    monkeypatch.setattr(iss.cache, "get_or_fetch", no_cache)
+
+    passes = await iss.get_passes(limit=100)
+
+    # One grid, built on the shared CPU pool rather than the event loop thread.
+    assert len(builds) == 1
+    assert builds[0][0] == LINE1 and builds[0][1].startswith("cliff-cpu")
+    expected = [
+        p.to_dict()
+        for city, lat, lng in iss.TURKISH_CITIES
+        for p in iss._compute_passes_for_city(LINE1, LINE2, city, lat, lng, 240, now=NOW)
+    ]
+    expected.sort(key=lambda d: d["starts_at"])
+    assert passes and passes == expected
+
+
+async def test_get_passes_shares_one_computation_across_limits(monkeypatch):
+    store = {}
+    computed = []
+
+    async def fake_tle():
+        return LINE1, LINE2
+
+    async def dict_cache(key, ttl, loader):
+        if key not in store:
+            store[key] = await loader()
+        return store[key]
+
+    def fake_compute(line1, line2):
+        computed.append((line1, line2))
+        return [{"starts_at": f"2026-06-01T{h:02d}:00:00+00:00"} for h in range(12)]
+
+    monkeypatch.setattr(iss, "_fetch_tle", fake_tle)
+    monkeypatch.setattr(iss, "_compute_all_passes", fake_compute)
+    monkeypatch.setattr(iss.cache, "get_or_fetch", dict_cache)
+
+    assert len(await iss.get_passes(limit=3)) == 3
+    assert len(await iss.get_passes(limit=10)) == 10
+    assert computed == [(LINE1, LINE2)]
+    assert list(store) == [f"iss:tr-passes:sgp4:{iss._tle_digest(LINE1, LINE2)}"]
+    assert iss._tle_digest(LINE1, LINE2.replace("12345", "12346")) != iss._tle_digest(LINE1, LINE2)
+
+
+async def test_tle_loader_reuses_shared_http_client(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.host)
+        return httpx.Response(200, text=f"ISS (ZARYA)\n{LINE1}\n{LINE2}\n")
+
+    monkeypatch.setattr(http, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await iss._tle_loader() == [LINE1, LINE2]
+    assert await iss._tle_loader() == [LINE1, LINE2]
+    assert seen == ["celestrak.org", "celestrak.org"]
+    await http.close_client()
+
+
+async def test_failed_tle_fetch_is_negatively_cached(fake_redis, monkeypatch):
+    calls = []
+
+    async def down():
+        calls.append(1)
+        return None
+
+    monkeypatch.setattr(iss, "_tle_loader", down)
+    assert await iss._fetch_tle() is None
+    assert await iss._fetch_tle() is None
+    assert len(calls) == 1  # outage remembered for TLE_MISS_TTL
+    assert 0 < await fake_redis.ttl(iss.cache.NAMESPACE + iss.TLE_MISS_KEY) <= iss.TLE_MISS_TTL
+
+    async def up():
+        return [LINE1, LINE2]
+
+    await fake_redis.delete(iss.cache.NAMESPACE + iss.TLE_MISS_KEY)
+    monkeypatch.setattr(iss, "_tle_loader", up)
+    assert await iss._fetch_tle() == (LINE1, LINE2)
+    assert await fake_redis.ttl(iss.cache.NAMESPACE + iss.TLE_CACHE_KEY) > iss.TLE_MISS_TTL
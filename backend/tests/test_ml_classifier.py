@@ -0,0 +1,139 @@
+"""Heuristic fallback classifier tests."""
+
+from __future__ import annotations
+
+import joblib
+import numpy as np
+import pytest
+
+from app.domain.risk import RiskClass
+from app.pipeline import ml_classifier
+from app.pipeline.ml_classifier import _heuristic_classify
+
+
+# Every heuristic term at its zero end; each override saturates (or nearly
+# saturates) one weighted term, so the score lands on or just under a band edge.
+_LUNAR_AU = 384_400.0 / 149_597_870.7
+_NO_SIGNAL = {"moid_au": 1.0, "velocity_kms": 10.0, "diameter_km": 0.05, "h_magnitude": 27.0, "uncertainty_km": 0.0}
+
+
+@pytest.mark.parametrize(
+    "overrides, expected",
+    [
+        ({}, RiskClass.MINIMAL),  # 0.0
+        ({"velocity_kms": 39.9, "uncertainty_km": 384_400.0}, RiskClass.MINIMAL),  # just under 0.25
+        ({"velocity_kms": 40.0, "uncertainty_km": 384_400.0}, RiskClass.LOW),  # 0.20 + 0.05
+        ({"velocity_kms": 40.0, "diameter_km": 2.0, "uncertainty_km": 384_000.0}, RiskClass.LOW),  # just under 0.45
+        ({"moid_au": _LUNAR_AU}, RiskClass.MODERATE),  # 0.45
+        ({"moid_au": _LUNAR_AU, "velocity_kms": 39.9}, RiskClass.MODERATE),  # just under 0.65
+        ({"moid_au": _LUNAR_AU, "velocity_kms": 40.0}, RiskClass.HIGH),  # 0.65
+        ({"moid_au": _LUNAR_AU, "velocity_kms": 40.0, "diameter_km": 1.99}, RiskClass.HIGH),  # just under 0.85
+        ({"moid_au": _LUNAR_AU, "velocity_kms": 40.0, "diameter_km": 2.0}, RiskClass.CRITICAL),  # 0.85
+    ],
+)
+def test_score_bands_are_inclusive_lower_bounds(overrides, expected):
+    cls, _confidence = _heuristic_classify({**_NO_SIGNAL, **overrides})
+    assert cls is expected
+
+
+def test_heuristic_close_large_fast_is_critical():
+    cls, confidence = _heuristic_classify(
+        {
+            "moid_au": 0.0001,
+            "velocity_kms": 40.0,
+            "diameter_km": 2.0,
+            "h_magnitude": 17.0,
+            "uncertainty_km": 400_000.0,
+        }
+    )
+    assert cls is RiskClass.CRITICAL
+    assert 0.4 <= confidence <= 0.95
+
+
+def test_heuristic_distant_small_is_minimal():
+    cls, _ = _heuristic_classify({"moid_au": 0.5, "velocity_kms": 5.0, "diameter_km": 0.01, "h_magnitude": 28.0})
+    assert cls is RiskClass.MINIMAL
+
+
+class _ProbaModel:
+    classes_ = ["low", "high"]
+
+    def predict_proba(self, X):
+        return np.array([[0.2, 0.8]])
+
+
+class _PredictOnlyModel:
+    def predict(self, X):
+        return np.array(["moderate"])
+
+
+@pytest.mark.parametrize(
+    "model, expected, confidence",
+    [(_ProbaModel(), RiskClass.HIGH, 0.8), (_PredictOnlyModel(), RiskClass.MODERATE, 0.7)],
+)
+def test_classify_uses_capabilities_resolved_at_load(tmp_path, model, expected, confidence):
+    path = tmp_path / "model.joblib"
+    joblib.dump(model, path)
+    clf = ml_classifier.MLRiskClassifier(model_path=path)
+
+    for _ in range(2):
+        cls, conf = clf.classify({"moid_au": 0.01})
+        assert cls is expected
+        assert conf == pytest.approx(confidence)
+
+
+def test_feature_row_is_float64_in_feature_order():
+    features = {name: float(i) for i, name in enumerate(ml_classifier.FEATURE_ORDER)}
+    features["observation_count"] = 12
+    features["uncertainty_km"] = None
+
+    row = ml_classifier._feature_row(features)
+
+    assert row.shape == (1, len(ml_classifier.FEATURE_ORDER)) and row.dtype == np.float64
+    assert row.flags.c_contiguous
+    assert row[0].tolist() == [0.0, 1.0, 2.0, 3.0, 12.0, 5.0, 0.0]
+
+
+class _UnknownLabelModel:
+    classes_ = ["bogus", "high"]
+
+    def predict_proba(self, X):
+        return np.array([[0.9, 0.1]])
+
+
+def test_unknown_model_label_degrades_to_minimal(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(_UnknownLabelModel(), path)
+    clf = ml_classifier.MLRiskClassifier(model_path=path)
+
+    cls, conf = clf.classify({"moid_au": 0.01})
+    assert cls is RiskClass.MINIMAL
+    assert conf == pytest.approx(0.9)
+
+
+def test_concurrent_first_use_loads_once(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    path = tmp_path / "model.joblib"
+    joblib.dump(_ProbaModel(), path)
+    clf = ml_classifier.MLRiskClassifier(model_path=path)
+    loads = []
+    real_load = clf._load
+
+    def slow_load():
+        loads.append(1)
+        time.sleep(0.05)
+        real_load()
+
+    monkeypatch.setattr(clf, "_load", slow_load)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(clf.classify({"moid_au": 0.01}))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loads) == 1
+    # Nobody classified against a half-loaded model (heuristic fallback).
+    assert [cls for cls, _ in results] == [RiskClass.HIGH] * 4
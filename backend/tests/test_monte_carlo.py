@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import threading
+
+import numpy as np
+
+from app.pipeline import monte_carlo
 from app.pipeline.monte_carlo import estimate_sigma_from_series, run
 
 
@@ -24,3 +29,36 @@ def test_sigma_estimator_floors_to_one_km():
     assert estimate_sigma_from_series([100.0, 100.0, 100.0]) == 1.0
     assert estimate_sigma_from_series([100.0, 101.0]) == 1.0
     assert estimate_sigma_from_series([100.0, 200.0, 150.0, 175.0, 125.0]) > 1.0
+
+
+def test_run_percentiles_match_per_quantile_reference():
+    distances = [500_000.0, 420_000.0, 610_000.0]
+    summary = run(distances, sigma_km=25_000.0, samples=5_000, seed=7)
+
+    rng = np.random.default_rng(7)
+    trials = np.asarray(distances)[None, :] + rng.normal(0.0, 25_000.0, size=(5_000, 3))
+    closest = np.maximum(0.0, trials.min(axis=1))
+    assert summary.p1_km == float(np.percentile(closest, 1))
+    assert summary.p50_km == float(np.percentile(closest, 50))
+    assert summary.p99_km == float(np.percentile(closest, 99))
+    assert summary.closest_p1_km == summary.p1_km
+
+
+def test_run_reuses_thread_scratch_buffers_without_changing_results():
+    first = run([700_000.0, 650_000.0], sigma_km=5_000.0, samples=3_000, seed=3)
+    buf = monte_carlo._buffers.trials
+    run([1.0e6, 9.0e5, 8.0e5, 7.5e5], sigma_km=1_000.0, samples=500, seed=4)
+    assert monte_carlo._buffers.trials is buf  # smaller run fits in place
+    assert run([700_000.0, 650_000.0], sigma_km=5_000.0, samples=3_000, seed=3) == first
+
+
+def test_run_above_retention_cap_leaves_thread_buffers_alone(monkeypatch):
+    monkeypatch.setattr(monte_carlo, "_buffers", threading.local())
+    monkeypatch.setattr(monte_carlo, "_RETAINED_TRIALS_MAX", 2_000 * 4)
+    run([700_000.0, 650_000.0], sigma_km=5_000.0, samples=2_000, seed=3)
+    trials, closest = monte_carlo._buffers.trials, monte_carlo._buffers.closest
+
+    big = run([1.0e6, 9.0e5, 8.0e5, 7.5e5, 7.0e5], sigma_km=1_000.0, samples=3_000, seed=4)
+    assert monte_carlo._buffers.trials is trials and monte_carlo._buffers.closest is closest
+    assert trials.size == 2_000 * 2
+    assert big.samples == 3_000 and 0.0 < big.p1_km <= big.p50_km <= big.p99_km
@@ -0,0 +1,36 @@
+"""NASA Redis JSON cache tests (fakeredis)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from app.nasa import cache
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis")
+
+
+async def test_round_trips_upstream_json_and_python_values():
+    value = {"near_earth_objects": {"2024-01-01": [{"id": "1", "name": "Çelyabinsk"}]}, 7: datetime(2024, 1, 1)}
+    await cache.set("feed", value, 60)
+
+    assert await cache.get("feed") == {
+        "near_earth_objects": {"2024-01-01": [{"id": "1", "name": "Çelyabinsk"}]},
+        "7": "2024-01-01T00:00:00",
+    }
+
+
+async def test_get_or_fetch_only_loads_on_miss():
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return {"ok": True}
+
+    assert await cache.get_or_fetch("k", 60, loader) == {"ok": True}
+    assert await cache.get_or_fetch("k", 60, loader) == {"ok": True}
+    assert calls == 1
+
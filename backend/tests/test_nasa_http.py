@@ -0,0 +1,67 @@
+"""Shared NASA HTTP client tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.nasa import http
+
+
+@pytest.fixture(autouse=True)
+def _reset_request_times():
+    http._request_times.clear()
+    yield
+    http._request_times.clear()
+
+
+def test_requests_per_second_counts_recent_window():
+    for ts in (100.0, 110.0, 150.0):
+        http._record_request(now=ts)
+    assert http.requests_per_second(now=155.0) == pytest.approx(3 / http.RATE_WINDOW_SECONDS)
+
+
+def test_requests_per_second_expires_old_entries():
+    http._record_request(now=0.0)
+    http._record_request(now=30.0)
+    http._record_request(now=90.0)
+    # At t=100 only the 90 s call (and nothing older than t=40) remains.
+    assert http.requests_per_second(now=100.0) == pytest.approx(1 / http.RATE_WINDOW_SECONDS)
+    assert len(http._request_times) == 1
+
+
+def test_requests_per_second_empty():
+    assert http.requests_per_second() == 0.0
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [(None, None), ("", None), ("soon", None), ("0", 0.0), ("2.5", 2.5), ("3600", 60.0)],
+)
+def test_parse_retry_after(header, expected):
+    assert http._parse_retry_after(header) == expected
+
+
+async def test_rate_limit_without_retry_after_uses_backoff_schedule(monkeypatch):
+    import httpx
+
+    sleeps = []
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(429)
+        return httpx.Response(200, json={"ok": True})
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(http.settings, "NASA_RATE_LIMIT_RPS", 0)
+    monkeypatch.setattr(http.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(http, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await http.request_json("GET", "https://api.nasa.test/x") == {"ok": True}
+    assert calls == 2
+    assert len(sleeps) == 1 and 0.5 <= sleeps[0] <= 1.0
+    await http.close_client()
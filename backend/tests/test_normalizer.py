@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
+from app.pipeline import normalizer
 from app.pipeline.normalizer import normalize_neows
 
 
@@ -42,3 +45,45 @@ def test_normalize_neows_returns_none_on_garbage():
     assert normalize_neows({}) is None
     assert normalize_neows({"foo": "bar"}) is None
     assert normalize_neows(None) is None  # type: ignore[arg-type]
+
+
+def test_normalize_neows_picks_next_approach_relative_to_given_now():
+    raw = {
+        "id": "1",
+        "name": "test",
+        "close_approach_data": [
+            {"close_approach_date_full": "2020-Jan-01 00:00", "orbiting_body": "Earth"},
+            {"close_approach_date_full": "2030-Jan-01 00:00", "orbiting_body": "Earth"},
+        ],
+    }
+    assert normalize_neows(raw, now=datetime(2025, 1, 1)).next_approach_at.year == 2030
+    assert normalize_neows(raw, now=datetime(2031, 1, 1)).next_approach_at.year == 2030
+    assert normalize_neows(raw, now=datetime(2010, 1, 1)).next_approach_at.year == 2020
+
+
+def test_normalize_neows_ignores_order_and_non_earth_approaches():
+    raw = {
+        "id": "2",
+        "name": "test",
+        "close_approach_data": [
+            {"close_approach_date_full": "2040-Mar-01 00:00", "orbiting_body": "Earth", "miss_distance": {"kilometers": "3"}},
+            {"close_approach_date_full": "2026-Feb-01 00:00", "orbiting_body": "Mars", "miss_distance": {"kilometers": "9"}},
+            {"close_approach_date_full": "2031-Jun-01 00:00", "orbiting_body": "Earth", "miss_distance": {"kilometers": "1"}},
+            {"close_approach_date_full": "2019-Jun-01 00:00", "orbiting_body": "Earth", "miss_distance": {"kilometers": "2"}},
+        ],
+    }
+    neo = normalize_neows(raw, now=datetime(2025, 1, 1))
+    assert neo.next_approach_at == datetime(2031, 6, 1)
+    assert neo.miss_distance_km == 1.0
+    assert normalize_neows(raw, now=datetime(2050, 1, 1)).next_approach_at.year == 2040
+
+
+def test_parse_iso_memoises_repeated_approach_dates():
+    normalizer._parse_approach_date.cache_clear()
+    first = normalizer._parse_iso("2029-Apr-13 21:46")
+    again = normalizer._parse_iso("2029-Apr-13 21:46")
+    assert first == datetime(2029, 4, 13, 21, 46)
+    assert again is first
+    assert normalizer._parse_approach_date.cache_info().hits == 1
+    assert normalizer._parse_iso({"not": "a string"}) is None
+    assert normalizer._parse_iso("13/04/2029") is None
@@ -0,0 +1,128 @@
+"""Turkey-observable NEO endpoint tests (risk store monkeypatched)."""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.api.v1.endpoints import observability
+from app.domain.risk import RiskClass, RiskRecord
+
+
+def _record(neo_id: str, diameter_km, miss_km, *, in_days: float = 3.0) -> RiskRecord:
+    return RiskRecord(
+        neo_id=neo_id,
+        name=f"({neo_id})",
+        risk_class=RiskClass.LOW,
+        hybrid_score=0.2,
+        diameter_max_km=diameter_km,
+        miss_distance_km=miss_km,
+        next_approach_at=datetime.utcnow() + timedelta(days=in_days),
+    )
+
+
+async def test_turkey_observable_batch_photometry_matches_scalar_formula(monkeypatch):
+    records = [
+        _record("near", 0.3, 100_000.0),
+        _record("mid", 1.2, 5_000_000.0),
+        _record("far", 0.05, 60_000_000.0),
+        _record("no-diameter", None, 1_000_000.0),
+        _record("past", 0.5, 1_000_000.0, in_days=-2),
+    ]
+
+    async def fake_top_n(n):
+        return records
+
+    monkeypatch.setattr(observability.risk_store, "top_n_by_score", fake_top_n)
+    res = await observability.turkey_observable(days=14, max_magnitude=24.0)
+
+    by_id = {item["neo_id"]: item for item in res["items"]}
+    assert set(by_id) == {"near", "mid", "far"}
+    for rec in records[:3]:
+        d_au = rec.miss_distance_km / observability.KM_PER_AU
+        h = 5.0 * math.log10(1329.0 / math.sqrt(observability.DEFAULT_ALBEDO)) - 5.0 * math.log10(rec.diameter_max_km)
+        m = h + 5.0 * math.log10(d_au)
+        item = by_id[rec.neo_id]
+        assert item["absolute_magnitude_h"] == pytest.approx(round(h, 2))
+        assert item["apparent_magnitude"] == pytest.approx(round(m, 2))
+        assert item["observable_class"] == observability._classify(np.array([m]))[0]
+    assert by_id["near"]["phase_angle_deg"] == 30.0
+    assert by_id["far"]["phase_angle_deg"] == 110.0
+    assert [i["apparent_magnitude"] for i in res["items"]] == sorted(i["apparent_magnitude"] for i in res["items"])
+
+
+async def test_turkey_observable_applies_magnitude_cutoff(monkeypatch):
+    async def fake_top_n(n):
+        return [_record("faint", 0.01, 50_000_000.0)]
+
+    monkeypatch.setattr(observability.risk_store, "top_n_by_score", fake_top_n)
+    res = await observability.turkey_observable(days=14, max_magnitude=12.0)
+    assert res["items"] == [] and res["total"] == 0
+
+
+async def test_turkey_observable_days_until_is_whole_days_remaining(monkeypatch):
+    records = [
+        _record("half-day", 0.3, 100_000.0, in_days=0.5),
+        _record("three", 0.3, 100_000.0, in_days=3.0),
+        _record("ten", 0.3, 100_000.0, in_days=10.25),
+    ]
+
+    async def fake_top_n(n):
+        return records
+
+    monkeypatch.setattr(observability.risk_store, "top_n_by_score", fake_top_n)
+    res = await observability.turkey_observable(days=14, max_magnitude=24.0)
+
+    by_id = {item["neo_id"]: item["days_until_approach"] for item in res["items"]}
+    # Records are built before the endpoint reads the clock, so whole-day
+    # offsets land just under the boundary.
+    assert by_id == {"half-day": 0, "three": 2, "ten": 10}
+
+
+def test_records_to_columns_marks_missing_fields_nan():
+    aware = _record("aware", 0.3, 100_000.0)
+    aware.next_approach_at = aware.next_approach_at.replace(tzinfo=timezone.utc)
+    records = [_record("full", 0.3, 100_000.0), _record("no-diameter", None, 5.0), aware]
+    records[1].next_approach_at = None
+
+    cols = observability._records_to_columns(records)
+
+    assert cols.miss_km.tolist() == [100_000.0, 5.0, 100_000.0]
+    assert cols.diameter_km[0] == 0.3 and math.isnan(cols.diameter_km[1])
+    assert math.isnan(cols.approach_s[1])
+    # Naive timestamps are taken as UTC, same epoch as the aware twin.
+    assert cols.approach_s[0] == pytest.approx(records[0].next_approach_at.replace(tzinfo=timezone.utc).timestamp())
+    assert cols.approach_s[2] == aware.next_approach_at.timestamp()
+
+
+@pytest.mark.parametrize(
+    "magnitude, cls",
+    [
+        (5.9, "naked_eye"),
+        (6.0, "naked_eye"),
+        (6.01, "amateur_telescope"),
+        (12.0, "amateur_telescope"),
+        (18.0, "professional"),
+        (18.2, "out_of_reach"),
+    ],
+)
+def test_classify_limits_are_inclusive(magnitude, cls):
+    assert observability._classify(np.array([magnitude])) == [cls]
+
+
+@pytest.mark.parametrize(
+    "utc_hour, window, best_time",
+    [
+        (19, "gece (uygun)", "05 Mar · 22:00 TRT"),
+        (1, "gece (uygun)", "05 Mar · 04:00 TRT"),
+        (3, "alacakaranlık", "05 Mar 06:00 TRT (gündüz)"),
+        (16, "alacakaranlık", "05 Mar 19:00 TRT (gündüz)"),
+        (9, "gündüz (uygun değil)", "05 Mar 12:00 TRT (gündüz)"),
+    ],
+)
+def test_observing_slot_uses_turkey_local_time(utc_hour, window, best_time):
+    approach = datetime(2026, 3, 5, utc_hour, 0, tzinfo=timezone.utc)
+    assert observability._observing_slot(approach) == (window, best_time)
@@ -0,0 +1,25 @@
+"""Press aggregator helpers (no network)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from app.sources.press import PressArticle, _dedupe_and_window
+
+
+def _article(url: str, day: str, source: str = "A") -> PressArticle:
+    return PressArticle(id=url, date=day, title="t", summary="s", url=url, source=source, topic="misyon")
+
+
+def test_dedupe_and_window_keeps_first_url_and_inclusive_cutoff():
+    articles = [
+        _article("u1", "2026-10-10"),
+        _article("u1", "2026-10-12", source="B"),  # duplicate URL from another feed
+        _article("u2", "2026-09-17"),  # exactly `days` ago → kept
+        _article("u3", "2026-09-16"),  # one day outside
+        _article("u4", "2026-10-17"),
+    ]
+
+    kept = _dedupe_and_window(articles, days=30, today=date(2026, 10, 17))
+
+    assert [(a.url, a.source) for a in kept] == [("u1", "A"), ("u2", "A"), ("u4", "A")]
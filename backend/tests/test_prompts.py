@@ -0,0 +1,62 @@
+"""Prompt builder tests."""
+
+from __future__ import annotations
+
+from app.ai import prompts
+from app.domain.risk import MCSummary, RiskClass, RiskRecord
+
+
+def _record(score: float) -> RiskRecord:
+    return RiskRecord(neo_id="2000433", name="433 Eros", risk_class=RiskClass.MINIMAL, hybrid_score=score)
+
+
+def test_threat_prompt_is_static_instructions_then_facts():
+    for language, instructions in (
+        ("tr", prompts._THREAT_BRIEF_INSTRUCTIONS_TR),
+        ("en-US", prompts._THREAT_BRIEF_INSTRUCTIONS_EN),
+    ):
+        a = prompts.threat_explanation_user_prompt(_record(0.1), language=language)
+        b = prompts.threat_explanation_user_prompt(_record(0.2), language=language)
+        assert a.startswith(instructions) and b.startswith(instructions)
+        assert a[len(instructions) :].startswith("- NEO id: 2000433")
+        assert "Hybrid score: 0.100" in a and "Hybrid score: 0.200" in b
+
+
+def test_chat_messages_reuse_the_prebuilt_system_message():
+    history = [{"role": "user", "content": "önceki"}]
+    a = prompts.chat_messages(history, "Apophis ne zaman geçecek?")
+    b = prompts.chat_messages([], "Bennu?")
+
+    assert a[0] is b[0] and a[0] == {"role": "system", "content": prompts.CHAT_SYSTEM}
+    assert a[1:] == [history[0], {"role": "user", "content": "Apophis ne zaman geçecek?"}]
+    assert history == [{"role": "user", "content": "önceki"}]  # caller's list untouched
+
+
+def test_routine_brief_formats_numbers_per_language():
+    record = _record(0.0123).model_copy(
+        update={"diameter_max_km": 1.2, "miss_distance_km": 384_400.0, "relative_velocity_kms": 12.34}
+    )
+    tr = prompts.routine_threat_brief(record, language="tr")
+    en = prompts.routine_threat_brief(record, language="en")
+
+    assert "1.200 m" in tr and "384.400 km" in tr and "12,3 km/s" in tr and "1,0 katı" in tr and "0,012" in tr
+    assert "1,200 m" in en and "384,400 km" in en and "12.3 km/s" in en and "1.0×" in en and "0.012" in en
+    assert "çarpma riski ihmal edilebilir" in tr and "riski yok" not in tr
+    assert "negligible per the current orbit solution" in en and "no impact risk" not in en
+    far = record.model_copy(update={"miss_distance_km": 38_500_000.0})
+    assert "38,5 milyon km" in prompts.routine_threat_brief(far, language="tr")
+    assert "38.5 million km" in prompts.routine_threat_brief(far, language="en")
+
+
+def test_prompt_renders_quantised_facts():
+    mc = MCSummary(samples=10_000, mean_km=5e6, std_km=1e4, p1_km=4_912_345.0, p50_km=5e6, p99_km=5.1e6, closest_p1_km=4.9e6)
+    base = _record(0.312).model_copy(update={"miss_distance_km": 4_812_330.0, "monte_carlo": mc})
+    jittered = base.model_copy(update={"hybrid_score": 0.309, "miss_distance_km": 4_809_950.0})
+    reduced = base.model_copy(update={"monte_carlo": mc.model_copy(update={"samples": 1_000})})
+
+    prompt = prompts.threat_explanation_user_prompt(base)
+    assert "Hybrid score: 0.310" in prompt and "Nominal miss distance: 4,800,000 km" in prompt
+    assert "4,900,000 / 5,000,000 / 5,100,000" in prompt
+    # Jitter renders the same prompt (same cache key); a fact change does not.
+    assert prompts.threat_explanation_user_prompt(jittered) == prompt
+    assert prompts.threat_explanation_user_prompt(reduced) != prompt
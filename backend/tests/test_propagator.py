@@ -7,13 +7,15 @@ import math
 import numpy as np
 
 from app.pipeline.orbit_elements import (
+    GM_SUN_AU3_PER_DAY2,
     OrbitalElements,
     from_neows,
     sample_orbit,
     solve_kepler,
+    solve_kepler_array,
     state_at,
 )
-from app.pipeline.propagator import planet_position, propagate
+from app.pipeline.propagator import PLANETS_GM, _perturber_positions, acceleration, planet_position, propagate
 
 
 # ----- Kepler equation -----
@@ -129,8 +131,25 @@ def test_jupiter_position_in_belt():
     assert 4.95 < d < 5.46
 
 
+def test_perturber_kernel_matches_planet_position():
+    for jd in (2451545.0, 2459580.0, 2465000.5):
+        expected = np.stack([planet_position(name, jd) for name in PLANETS_GM])
+        assert np.allclose(_perturber_positions(jd), expected, rtol=0.0, atol=1e-14)
+
+
 # ----- N-body propagator -----
 
+def test_acceleration_matches_per_planet_sum():
+    jd = 2459580.0
+    for r in (np.array([1.1, 0.2, 0.05]), np.array([-2.5, 3.0, -0.1])):
+        expected = -GM_SUN_AU3_PER_DAY2 * r / float(np.linalg.norm(r)) ** 3
+        for name, gm in PLANETS_GM.items():
+            rp = planet_position(name, jd)
+            d = r - rp
+            expected = expected - gm * (d / np.linalg.norm(d) ** 3 + rp / np.linalg.norm(rp) ** 3)
+        assert np.allclose(acceleration(r, jd), expected, rtol=1e-12, atol=0.0)
+
+
 def test_propagate_earth_one_year():
     """Propagating an Earth-like orbit for 365 days should return near origin."""
     elem = _earth_like()
@@ -154,3 +173,18 @@ def test_propagate_keeps_bounded_distance():
     for s in samples:
         d = math.sqrt(sum(c * c for c in s.r_au))
         assert peri <= d <= aph
+
+
+def test_solve_kepler_low_eccentricity_starter_converges():
+    for e in (0.0, 0.0167, 0.1, 0.29):
+        for M in (-3.0, -1.0, 0.1, 1.5, 3.1):
+            E = solve_kepler(M, e)
+            assert abs(E - e * math.sin(E) - M) < 1e-10
+
+
+def test_solve_kepler_array_matches_scalar():
+    M = np.linspace(-math.pi, math.pi, 41)
+    for e in (0.05, 0.5, 0.9):
+        E = solve_kepler_array(M, e)
+        expected = [solve_kepler(float(m), e) for m in M]
+        assert np.allclose(E, expected, atol=1e-9)
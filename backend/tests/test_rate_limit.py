@@ -0,0 +1,34 @@
+"""In-memory token-bucket limiter tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core import rate_limit
+
+
+@pytest.fixture(autouse=True)
+def _reset_buckets():
+    rate_limit._BUCKETS.clear()
+    yield
+    rate_limit._BUCKETS.clear()
+
+
+async def test_bucket_queues_then_grants_after_refill():
+    bucket = rate_limit._TokenBucket(capacity=1, refill_rate=20.0)
+    assert await bucket.acquire(max_wait_seconds=1.0) == (True, 0.0)
+    acquired, waited = await bucket.acquire(max_wait_seconds=1.0)
+    assert acquired and waited > 0
+    assert (await bucket.acquire(max_wait_seconds=0.0))[0] is False
+
+
+def test_fully_refilled_idle_buckets_expire_from_the_front():
+    a = rate_limit._bucket_for("t", "1.1.1.1", capacity=3, refill_rate=0.05)  # 60 s to refill
+    b = rate_limit._bucket_for("t", "2.2.2.2", capacity=3, refill_rate=0.05)
+    a.last_used -= 61  # idle past a full refill
+
+    c = rate_limit._bucket_for("t", "3.3.3.3", capacity=3, refill_rate=0.05)
+
+    assert list(rate_limit._BUCKETS["t"]) == ["2.2.2.2", "3.3.3.3"]
+    assert rate_limit._bucket_for("t", "2.2.2.2", capacity=3, refill_rate=0.05) is b
+    assert c is not a
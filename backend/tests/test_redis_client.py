@@ -0,0 +1,40 @@
+"""redis_client connection lifecycle tests."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core import redis_client
+
+
+class _SlowPingRedis:
+    async def ping(self) -> bool:
+        await asyncio.sleep(0.01)
+        return True
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.fixture
+def no_client(monkeypatch):
+    monkeypatch.setattr(redis_client, "_client", None)
+    yield
+    monkeypatch.setattr(redis_client, "_client", None)
+
+
+async def test_concurrent_connect_builds_a_single_pool(monkeypatch, no_client):
+    built = []
+
+    def fake_from_url(url, **kwargs):
+        built.append(_SlowPingRedis())
+        return built[-1]
+
+    monkeypatch.setattr(redis_client.aioredis, "from_url", fake_from_url)
+
+    clients = await asyncio.gather(*[redis_client.connect() for _ in range(5)])
+
+    assert len(built) == 1
+    assert all(c is built[0] for c in clients)
@@ -0,0 +1,53 @@
+"""risk_store batch-path tests against fakeredis."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.domain.risk import RiskClass, RiskRecord
+from app.pipeline import risk_store, risk_timeline
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis")
+
+
+def _rec(neo_id: str, cls: RiskClass, score: float) -> RiskRecord:
+    return RiskRecord(neo_id=neo_id, name=f"NEO {neo_id}", risk_class=cls, hybrid_score=score)
+
+
+async def test_upsert_many_matches_per_record_upsert_semantics():
+    await risk_store.upsert(_rec("a", RiskClass.LOW, 0.3))
+    await risk_store.upsert(_rec("b", RiskClass.LOW, 0.3))
+
+    deltas = await risk_store.upsert_many(
+        [
+            _rec("a", RiskClass.HIGH, 0.8),  # up
+            _rec("b", RiskClass.LOW, 0.305),  # below change threshold → no delta
+            _rec("c", RiskClass.MINIMAL, 0.1),  # new
+        ]
+    )
+
+    assert [(d.neo_id, d.direction) for d in deltas] == [("a", "up"), ("c", "new")]
+    stored = await risk_store.get_many(["a", "b", "c", "missing"])
+    assert [r.risk_class if r else None for r in stored] == [RiskClass.HIGH, RiskClass.LOW, RiskClass.MINIMAL, None]
+    assert [r.neo_id for r in await risk_store.top_n_by_score(3)] == ["a", "b", "c"]
+
+
+async def test_top_n_with_total_joins_records_in_score_order(fake_redis):
+    await risk_store.upsert_many([_rec(nid, RiskClass.LOW, score) for nid, score in [("a", 0.2), ("b", 0.9), ("c", 0.5)]])
+    # Index entry whose record vanished is skipped, but still counted by ZCARD.
+    await fake_redis.zadd("cliff:risk:by_score", {"ghost": 0.7})
+
+    items, total = await risk_store.top_n_with_total(3)
+
+    assert [r.neo_id for r in items] == ["b", "c"]
+    assert total == 4
+    assert [r.neo_id for r in await risk_store.top_n_by_score(10)] == ["b", "c", "a"]
+
+
+async def test_append_many_writes_one_sample_per_record():
+    await risk_timeline.append_many([_rec("a", RiskClass.LOW, 0.3), _rec("b", RiskClass.HIGH, 0.7)])
+    a = await risk_timeline.fetch("a")
+    b = await risk_timeline.fetch("b")
+    assert len(a.samples) == 1 and a.samples[0].hybrid_score == 0.3
+    assert len(b.samples) == 1 and b.samples[0].risk_class == RiskClass.HIGH
@@ -0,0 +1,44 @@
+"""SWPC classification helper tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.nasa.space_weather import _flare_class, _kp_label
+
+
+@pytest.mark.parametrize(
+    "kp, label",
+    [
+        (0.0, "Quiet"),
+        (3.99, "Quiet"),
+        (4.0, "Unsettled"),
+        (5.0, "G1 — Minor"),
+        (6.33, "G2 — Moderate"),
+        (7.0, "G3 — Strong"),
+        (8.67, "G4 — Severe"),
+        (9.0, "G5 — Extreme"),
+    ],
+)
+def test_kp_label_boundaries_are_inclusive(kp, label):
+    assert _kp_label(kp) == label
+
+
+@pytest.mark.parametrize(
+    "flux, cls",
+    [
+        (3.2e-8, "A3.2"),
+        (1e-7, "B1.0"),
+        (2.4e-6, "C2.4"),
+        (1e-5, "M1.0"),
+        (9.3e-4, "X9.3"),
+    ],
+)
+def test_flare_class_letters(flux, cls):
+    assert _flare_class(flux) == cls
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_readings_get_the_unknown_label(value):
+    assert _kp_label(value) == "Unknown"
+    assert _flare_class(value) == "Unknown"
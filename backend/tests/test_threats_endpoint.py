@@ -0,0 +1,76 @@
+"""Threat endpoint tests (risk store monkeypatched)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from app.api.v1.endpoints import threats
+from app.domain.risk import RiskClass, RiskRecord
+
+
+def _record(neo_id: str, score: float, in_days=None) -> RiskRecord:
+    return RiskRecord(
+        neo_id=neo_id,
+        name=f"({neo_id})",
+        risk_class=RiskClass.LOW,
+        hybrid_score=score,
+        next_approach_at=None if in_days is None else datetime.utcnow() + timedelta(days=in_days),
+    )
+
+
+async def test_featured_today_prefers_first_upcoming_in_score_order(monkeypatch):
+    items = [_record("past", 0.9, in_days=-3), _record("unknown", 0.8), _record("soon", 0.7, 5), _record("later", 0.6, 9)]
+
+    async def fake_top_n(n):
+        return items
+
+    monkeypatch.setattr(threats.risk_store, "top_n_by_score", fake_top_n)
+    res = await threats.featured_today()
+    assert res["neo_id"] == "soon"
+    assert res["days_until_approach"] == 4
+
+
+async def test_featured_today_falls_back_to_top_record(monkeypatch):
+    async def fake_top_n(n):
+        return [_record("past", 0.9, in_days=-3), _record("unknown", 0.8)]
+
+    monkeypatch.setattr(threats.risk_store, "top_n_by_score", fake_top_n)
+    res = await threats.featured_today()
+    assert res["neo_id"] == "past" and res["days_until_approach"] is None
+
+
+async def test_generate_explanation_regenerates_past_the_response_cache(monkeypatch):
+    from app.ai import service as ai_service
+
+    class _Client:
+        supports_web_search = False
+        calls = 0
+
+        async def chat(self, messages, **kwargs) -> str:
+            _Client.calls += 1
+            return f"briefing {_Client.calls}"
+
+    async def fake_get(neo_id):
+        return _record(neo_id, 0.4)
+
+    async def fake_put(neo_id, **fields):
+        return {"neo_id": neo_id, "generated_at": 0, **fields}
+
+    cached = {}
+
+    async def cache_get(digest):
+        return cached.get(digest)
+
+    async def cache_put(digest, value, ttl):
+        cached[digest] = value
+
+    monkeypatch.setattr(ai_service.risk_store, "get", fake_get)
+    monkeypatch.setattr(ai_service.response_cache, "get", cache_get)
+    monkeypatch.setattr(ai_service.response_cache, "put", cache_put)
+    monkeypatch.setattr(threats, "get_service", lambda: ai_service.AIService(client=_Client()))  # type: ignore[arg-type]
+    monkeypatch.setattr(threats.explanation_store, "put", fake_put)
+
+    request = threats.GenerateExplanationRequest(language="tr", with_search=False)
+    first = await threats.generate_explanation("2000433", request)
+    second = await threats.generate_explanation("2000433", request)
+    assert (first.text, second.text) == ("briefing 1", "briefing 2")
@@ -0,0 +1,15 @@
+"""TTS poll-pacing tests."""
+
+from __future__ import annotations
+
+from app.ai import tts
+from app.core.config import settings
+
+
+def test_poll_delay_ramps_up_to_configured_interval(monkeypatch):
+    monkeypatch.setattr(settings, "TTS_POLL_INTERVAL_SECONDS", 1.5)
+    delays = [tts._poll_delay(i) for i in range(6)]
+    assert delays[0] < settings.TTS_POLL_INTERVAL_SECONDS
+    assert delays == sorted(delays)
+    assert delays[-1] == settings.TTS_POLL_INTERVAL_SECONDS
+    assert tts._poll_delay(10_000) == settings.TTS_POLL_INTERVAL_SECONDS
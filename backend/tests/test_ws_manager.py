@@ -0,0 +1,97 @@
+"""WebSocketManager tests with an in-memory socket stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.ws.manager import WebSocketManager
+
+
+class _FakeSocket:
+    def __init__(self) -> None:
+        self.accepted = False
+        self.closed_with = None
+        self.sent: list[str] = []
+
+    async def accept(self) -> None:
+        self.accepted = True
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+
+async def test_refuses_connections_beyond_capacity(monkeypatch):
+    monkeypatch.setattr(settings, "WS_MAX_CONNECTIONS", 2)
+    mgr = WebSocketManager()
+    sockets = [_FakeSocket() for _ in range(3)]
+
+    ids = [await mgr.accept(ws) for ws in sockets]
+
+    assert ids[0] and ids[1] and ids[2] is None
+    assert sockets[2].accepted and sockets[2].closed_with == 1013
+    assert mgr.current_active_count() == 2
+
+
+class _SlowSocket(_FakeSocket):
+    def __init__(self, *, fail: bool = False) -> None:
+        super().__init__()
+        self.fail = fail
+
+    async def accept(self) -> None:
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("handshake dropped")
+        await super().accept()
+
+
+async def test_concurrent_handshakes_cannot_exceed_capacity(monkeypatch):
+    monkeypatch.setattr(settings, "WS_MAX_CONNECTIONS", 2)
+    mgr = WebSocketManager()
+
+    ids = await asyncio.gather(*(mgr.accept(_SlowSocket()) for _ in range(5)))
+
+    assert sum(i is not None for i in ids) == 2
+    assert mgr.current_active_count() == 2
+
+
+async def test_failed_handshake_releases_its_reserved_slot(monkeypatch):
+    monkeypatch.setattr(settings, "WS_MAX_CONNECTIONS", 1)
+    mgr = WebSocketManager()
+
+    with pytest.raises(RuntimeError):
+        await mgr.accept(_SlowSocket(fail=True))
+
+    assert await mgr.accept(_FakeSocket()) is not None
+
+
+async def test_disconnect_clears_only_joined_channels():
+    mgr = WebSocketManager()
+    ws = _FakeSocket()
+    client_id = await mgr.accept(ws)
+    await mgr.handle_text(client_id, json.dumps({"action": "subscribe", "channel": "risk_updates"}))
+    await mgr.handle_text(client_id, json.dumps({"action": "subscribe", "channel": "earth_alerts"}))
+    assert mgr.stats()["subscriptions"]["risk_updates"] == 1
+
+    await mgr.disconnect(client_id)
+
+    assert all(n == 0 for n in mgr.stats()["subscriptions"].values())
+    assert mgr._connections == {}
+
+
+async def test_unsubscribe_updates_the_client_session():
+    mgr = WebSocketManager()
+    client_id = await mgr.accept(_FakeSocket())
+    await mgr.handle_text(client_id, json.dumps({"action": "subscribe", "channel": "risk_updates"}))
+    assert mgr._connections[client_id].channels == {"risk_updates"}
+
+    await mgr.handle_text(client_id, json.dumps({"action": "unsubscribe", "channel": "risk_updates"}))
+
+    assert mgr._connections[client_id].channels == set()
+    assert mgr.stats()["subscriptions"]["risk_updates"] == 0